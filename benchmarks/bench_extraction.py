@@ -0,0 +1,58 @@
+"""
+Records/sec of per-call `extract_from_spec` versus the compiled extraction plans.
+
+"before" rebuilds the spec table on every record, like the client used to;
+"after" reuses the module-level `ExtractionPlan`.
+
+Run with:
+
+    python -m benchmarks.bench_extraction
+"""
+
+import time
+from typing import Any, Callable
+
+from google_play_scraper import client
+from google_play_scraper.internal.extractor import ElementSpec, ExtractionPlan, extract_from_spec
+
+from . import fixtures
+
+RECORDS = 2_000
+
+
+def _legacy(plan: ExtractionPlan) -> Callable[[Any], dict]:
+    def _extract(record: Any) -> dict:
+        specs = {
+            key: ElementSpec(list(spec.path), spec.transformer, spec.fallback_path)
+            for key, spec in plan.specs.items()
+        }
+        return extract_from_spec(record, specs)
+
+    return _extract
+
+
+def _records_per_second(func: Callable[[Any], Any], records: list) -> float:
+    start = time.perf_counter()
+    for record in records:
+        func(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main():
+    cases = [
+        ("app details", client._APP_DETAILS_PLAN, fixtures.app_details_root),
+        ("search", client._SEARCH_RESULT_PLAN, fixtures.search_item),
+        ("list", client._LIST_RESULT_PLAN, fixtures.list_item),
+        ("reviews", client._REVIEW_PLAN, fixtures.review),
+    ]
+
+    print(f"{'payload':<12} {'before rec/s':>14} {'after rec/s':>14} {'speedup':>8}")
+    for name, plan, make_record in cases:
+        records = [make_record(i) for i in range(RECORDS)]
+        before = _records_per_second(_legacy(plan), records)
+        after = _records_per_second(plan.extract, records)
+        print(f"{name:<12} {before:>14,.0f} {after:>14,.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Model construction throughput: full Pydantic validation versus `construct_trusted`
+(what `GooglePlayClient(validate=False)` uses) on extracted fixture records.
+
+Run with:
+
+    python -m benchmarks.bench_models
+"""
+
+import time
+from typing import Any, Callable
+
+from google_play_scraper import client
+from google_play_scraper.models import AppDetails, AppOverview, Review, construct_trusted
+
+from . import fixtures
+
+RECORDS = 5_000
+
+
+def _records_per_second(func: Callable[[Any], Any], records: list) -> float:
+    start = time.perf_counter()
+    for record in records:
+        func(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def _details_record(i: int) -> dict:
+    data = client._APP_DETAILS_PLAN.extract(fixtures.app_details_root(i))
+    data["app_id"] = f"com.fixture.app{i}"
+    return data
+
+
+def main():
+    cases = [
+        ("AppDetails", AppDetails, _details_record),
+        ("AppOverview", AppOverview, lambda i: client._SEARCH_RESULT_PLAN.extract(fixtures.search_item(i))),
+        ("Review", Review, lambda i: client._REVIEW_PLAN.extract(fixtures.review(i))),
+    ]
+
+    print(f"{'model':<12} {'validated rec/s':>16} {'trusted rec/s':>15} {'speedup':>8}")
+    for name, model_cls, make_record in cases:
+        records = [make_record(i) for i in range(RECORDS)]
+        validated = _records_per_second(lambda d: model_cls(**d), records)
+        trusted = _records_per_second(lambda d: construct_trusted(model_cls, d), records)
+        print(f"{name:<12} {validated:>16,.0f} {trusted:>15,.0f} {trusted / validated:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Parse throughput of `ScriptDataParser` under every installed JSON backend.
+
+Each case parses a recorded-shape response (`benchmarks/fixtures.py`) the way
+the client does; the speedup column compares against the stdlib backend.
+
+Run with:
+
+    python -m benchmarks.bench_parser
+"""
+
+import time
+from typing import Callable
+
+from google_play_scraper.internal import jsonlib
+from google_play_scraper.internal.parser import ScriptDataParser
+
+from . import fixtures
+
+ROUNDS = 300
+
+
+def _parses_per_second(func: Callable[[], object]) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+    return ROUNDS / (time.perf_counter() - start)
+
+
+def _installed() -> list[str]:
+    names = []
+    for name in jsonlib.BACKENDS:
+        try:
+            jsonlib.use(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def main():
+    app_page = fixtures.app_details_page()
+    search_page = fixtures.search_page()
+    reviews = fixtures.reviews_response()
+    charts = fixtures.list_response()
+    cases = [
+        ("app details", lambda: ScriptDataParser.parse(app_page, keys={"ds:5"})),
+        ("search", lambda: ScriptDataParser.parse(search_page, keys={"ds:1"})),
+        ("reviews", lambda: ScriptDataParser.parse_batchexecute_response(reviews)),
+        ("list", lambda: ScriptDataParser.parse_batchexecute_response(charts)),
+    ]
+
+    default = jsonlib.backend
+    backends = _installed()
+    try:
+        print(f"{'payload':<12} {'backend':<8} {'parses/s':>10} {'speedup':>8}")
+        for name, parse in cases:
+            baseline = None
+            for backend in reversed(backends):
+                jsonlib.use(backend)
+                rate = _parses_per_second(parse)
+                baseline = baseline or rate
+                print(f"{name:<12} {backend:<8} {rate:>10,.0f} {rate / baseline:>7.2f}x")
+    finally:
+        jsonlib.use(default)
+
+
+if __name__ == "__main__":
+    main()
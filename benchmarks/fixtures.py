@@ -0,0 +1,159 @@
+"""
+Deterministic Google Play payload fixtures for the benchmarks.
+
+Records are laid out exactly where the client's extraction plans look for data,
+mirroring the structure of real `ds:5` pages and `batchexecute` responses.
+"""
+
+import json
+from typing import Any
+
+
+def _set(root: list, path: list[int], value: Any) -> None:
+    cur = root
+    for idx, key in enumerate(path):
+        while len(cur) <= key:
+            cur.append(None)
+        if idx == len(path) - 1:
+            cur[key] = value
+        else:
+            if cur[key] is None:
+                cur[key] = []
+            cur = cur[key]
+
+
+def _image(url: str) -> list:
+    return [None, None, None, [None, None, url]]
+
+
+def app_details_root(i: int = 0) -> list:
+    root: list = []
+    _set(root, [0, 0], f"Fixture App {i}")
+    _set(root, [72, 0, 1], "Line one<br>Line two<br>" + "Lorem ipsum dolor sit amet. " * 40)
+    _set(root, [73, 0, 1], "A short summary")
+    _set(root, [13, 0], "1,000,000+")
+    _set(root, [13, 1], 1_000_000)
+    _set(root, [13, 2], 4_512_345)
+    _set(root, [51, 0, 0], "4.5")
+    _set(root, [51, 0, 1], 4.5123)
+    _set(root, [51, 1], [None, [None, 10], [None, 20], [None, 30], [None, 40], [None, 50]])
+    _set(root, [51, 2, 1], 12_345)
+    _set(root, [51, 3, 1], 2_345)
+    _set(root, [57, 0, 0, 0, 0, 1, 0, 0], 1_990_000)
+    _set(root, [57, 0, 0, 0, 0, 1, 0, 1], "USD")
+    _set(root, [57, 0, 0, 0, 0, 1, 0, 2], "$1.99")
+    _set(root, [18, 0], 1)
+    _set(root, [19, 0], 1)
+    _set(root, [140, 0, 0, 0], "1.2.3")
+    _set(root, [140, 1, 1, 0, 0, 1], "8.0")
+    _set(root, [68, 0], "Fixture Developer")
+    _set(root, [68, 1, 4, 2], "/store/apps/dev?id=5700313618786177705")
+    _set(root, [69, 0, 5, 2], "https://developer.example.com")
+    _set(root, [69, 1, 0], "dev@example.com")
+    _set(root, [69, 2, 0], "1 Example Street")
+    _set(root, [99, 0, 5, 2], "https://developer.example.com/privacy")
+    _set(root, [79, 0, 0, 0], "Tools")
+    _set(root, [79, 0, 0, 2], "TOOLS")
+    _set(root, [95, 0, 3, 2], f"https://play-lh.googleusercontent.com/icon{i}")
+    _set(root, [96, 0, 3, 2], f"https://play-lh.googleusercontent.com/header{i}")
+    _set(root, [78, 0], [_image(f"https://play-lh.googleusercontent.com/shot{i}_{n}") for n in range(12)])
+    _set(root, [100, 0, 0, 3, 2], "https://www.youtube.com/embed/fixture")
+    _set(root, [9, 0], "Everyone")
+    _set(root, [10, 0], "Jan 1, 2020")
+    _set(root, [144, 1, 1], "Bug fixes and improvements.")
+    _set(root, [145, 0, 1, 0], 1_700_000_000)
+    return root
+
+
+def search_item(i: int = 0) -> list:
+    item: list = []
+    _set(item, [1, 1, 0, 3, 2], f"https://play-lh.googleusercontent.com/icon{i}")
+    _set(item, [2], f"Search Result {i}")
+    _set(item, [4, 0, 0, 0], "Fixture Developer")
+    _set(item, [4, 0, 0, 1, 4, 2], "/store/apps/dev?id=FixtureDeveloper")
+    _set(item, [4, 1, 1, 1, 1], "A short summary")
+    _set(item, [6, 0, 2, 1, 0], "4.4")
+    _set(item, [6, 0, 2, 1, 1], 4.4)
+    _set(item, [7, 0, 3, 2, 1, 0, 0], 0)
+    _set(item, [7, 0, 3, 2, 1, 0, 2], "")
+    _set(item, [12, 0], f"com.fixture.search{i}")
+    return item
+
+
+def list_item(i: int = 0) -> list:
+    entry: list = []
+    _set(entry, [0, 0, 0], f"com.fixture.list{i}")
+    _set(entry, [0, 1, 3, 2], f"https://play-lh.googleusercontent.com/icon{i}")
+    _set(entry, [0, 3], f"Chart App {i}")
+    _set(entry, [0, 4, 0], "4.3")
+    _set(entry, [0, 4, 1], 4.3)
+    _set(entry, [0, 8, 1, 0, 0], 0)
+    _set(entry, [0, 8, 1, 0, 1], "USD")
+    _set(entry, [0, 10, 4, 2], f"/store/apps/details?id=com.fixture.list{i}")
+    _set(entry, [0, 13, 1], "A short summary")
+    _set(entry, [0, 14], "Fixture Developer")
+    return entry
+
+
+def review(i: int = 0) -> list:
+    entry: list = []
+    _set(entry, [0], f"gp:AOqpTOFixtureReview{i:08d}")
+    _set(entry, [1, 0], f"User {i}")
+    _set(entry, [1, 1, 3, 2], f"https://play-lh.googleusercontent.com/user{i}")
+    _set(entry, [2], 1 + i % 5)
+    _set(entry, [4], "Great app, does what it says. " * 3)
+    _set(entry, [5, 0], 1_700_000_000 - i * 60)
+    _set(entry, [6], i % 17)
+    _set(entry, [7, 1], "Thanks for the feedback!")
+    _set(entry, [7, 2, 0], 1_700_000_000 - i * 60 + 3600)
+    _set(entry, [10], "1.2.3")
+    return entry
+
+
+# -- Recorded-shape responses for the parser benchmarks --
+
+def _callback(key: str, data: Any) -> str:
+    payload = json.dumps(data, ensure_ascii=False)
+    return (
+        f"<script class=\"ds:{key[3:]}\" nonce=\"fixture\">AF_initDataCallback("
+        f"{{key: '{key}', hash: '1', data:{payload}, sideChannel: {{}}}});</script>"
+    )
+
+
+def _html(blocks: list[str]) -> str:
+    filler = "<div class=\"fixture\">" + "x" * 2_000 + "</div>"
+    return "<!doctype html><html><head>" + filler.join(blocks) + "</head><body>" + filler * 20 + "</body></html>"
+
+
+def app_details_page(i: int = 0) -> str:
+    """Details page with `ds:5` among unrelated data blocks, roughly the size of a real one."""
+    others = [_callback(f"ds:{n}", [[review(n * 10 + k) for k in range(10)]]) for n in (0, 1, 2, 3, 4)]
+    return _html(others + [_callback("ds:5", [None, [None, None, app_details_root(i)]])])
+
+
+def search_page(count: int = 30) -> str:
+    sections = [[search_item(i) for i in range(count)], "search-token"]
+    return _html([_callback("ds:1", [[None, [[sections]]]])])
+
+
+def _frame(document: Any) -> str:
+    body = json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+    # Lengths count UTF-16 code units of the newline and the JSON after them.
+    return f"{len(body.encode('utf-16-le')) // 2 + 1}\n{body}"
+
+
+def reviews_response(count: int = 100) -> str:
+    """Chunked (`rt=c`) batchexecute response for one page of reviews."""
+    payload = json.dumps([[review(i) for i in range(count)], [None, "next-page-token"]], ensure_ascii=False)
+    envelope = [["wrb.fr", "UsvDTd", payload, None, None, None, "generic"]]
+    frames = [envelope, [["di", 42], ["af.httprm", 41, "-1234567890", 7]], [["e", 4, None, None, 1234]]]
+    return ")]}'\n\n" + "\n".join(_frame(frame) for frame in frames) + "\n"
+
+
+def list_response(count: int = 200) -> str:
+    """Chunked (`rt=c`) batchexecute response for a top chart of `count` apps."""
+    root: list = []
+    _set(root, [0, 1, 0, 28, 0], [list_item(i) for i in range(count)])
+    envelope = [["wrb.fr", "vyAe2", json.dumps(root, ensure_ascii=False), None, None, None, "generic"]]
+    frames = [envelope, [["di", 42], ["af.httprm", 41, "-1234567890", 7]], [["e", 4, None, None, 1234]]]
+    return ")]}'\n\n" + "\n".join(_frame(frame) for frame in frames) + "\n"
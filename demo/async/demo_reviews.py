@@ -32,6 +32,11 @@ async def amain():
     else:
         print("No more pages.")
 
+    # 3. Or let the client follow the tokens
+    print("\n--- Streaming the 25 newest reviews ---")
+    async for r in client.aiter_reviews(app_id, sort=Sort.NEWEST, limit=25, page_size=10):
+        print(f"{r.date} [{r.score}/5] {r.user_name}")
+
 
 def main():
     asyncio.run(amain())
@@ -34,6 +34,11 @@ def main():
     else:
         print("No more pages.")
 
+    # 3. Or let the client follow the tokens
+    print("\n--- Streaming the 25 newest reviews ---")
+    for r in client.iter_reviews(app_id, sort=Sort.NEWEST, limit=25, page_size=10):
+        print(f"{r.date} [{r.score}/5] {r.user_name}")
+
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,79 @@
-from .client import GooglePlayClient
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .constants import Category, Collection, Sort, Age
 from .exceptions import GooglePlayError, AppNotFound
-from .models import AppDetails, AppOverview, Review
+
+if TYPE_CHECKING:
+    from .batch import RpcBatch
+    from .cache import ResponseCache, MemoryCache, SQLiteCache, ObjectCache
+    from .charts import ChartKey, ChartSink, ChartSnapshot, CsvChartSink
+    from .client import GooglePlayClient
+    from .models import AppDetails, AppOverview, LocalizedAppDetails, Review, SearchRankings
+    from .proxy import ProxyPool
+    from .ratelimit import TokenBucket, AdaptiveRateLimiter, MemoryBackend, FileLockBackend
+    from .retry import RetryPolicy, RequestMetrics
+    from .review_sync import (
+        ReviewSyncer,
+        Watermark,
+        WatermarkStore,
+        MemoryWatermarkStore,
+        SQLiteWatermarkStore,
+    )
 
 # Library version (single-source versioning for packaging)
 __version__ = "0.1.7"
 
+# Names backed by modules that import httpx/pydantic are resolved on first access
+# (PEP 562), so `from google_play_scraper import Category` stays cheap.
+_LAZY_ATTRIBUTES = {
+    "GooglePlayClient": ".client",
+    "RpcBatch": ".batch",
+    "ResponseCache": ".cache",
+    "MemoryCache": ".cache",
+    "SQLiteCache": ".cache",
+    "ObjectCache": ".cache",
+    "ChartKey": ".charts",
+    "ChartSink": ".charts",
+    "ChartSnapshot": ".charts",
+    "CsvChartSink": ".charts",
+    "ProxyPool": ".proxy",
+    "TokenBucket": ".ratelimit",
+    "AdaptiveRateLimiter": ".ratelimit",
+    "MemoryBackend": ".ratelimit",
+    "FileLockBackend": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "RequestMetrics": ".retry",
+    "AppDetails": ".models",
+    "AppOverview": ".models",
+    "LocalizedAppDetails": ".models",
+    "SearchRankings": ".models",
+    "Review": ".models",
+    "ReviewSyncer": ".review_sync",
+    "Watermark": ".review_sync",
+    "WatermarkStore": ".review_sync",
+    "MemoryWatermarkStore": ".review_sync",
+    "SQLiteWatermarkStore": ".review_sync",
+}
+
 __all__ = [
     "GooglePlayClient",
+    "RpcBatch",
+    "ResponseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "ObjectCache",
+    "ChartKey",
+    "ChartSink",
+    "ChartSnapshot",
+    "CsvChartSink",
+    "ProxyPool",
+    "TokenBucket",
+    "AdaptiveRateLimiter",
+    "MemoryBackend",
+    "FileLockBackend",
+    "RetryPolicy",
+    "RequestMetrics",
     "Category",
     "Collection",
     "Sort",
@@ -16,6 +82,26 @@ __all__ = [
     "AppNotFound",
     "AppDetails",
     "AppOverview",
+    "LocalizedAppDetails",
+    "SearchRankings",
     "Review",
+    "ReviewSyncer",
+    "Watermark",
+    "WatermarkStore",
+    "MemoryWatermarkStore",
+    "SQLiteWatermarkStore",
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,191 @@
+import json
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+from .constants import Age, Category, Collection, Sort
+from .internal.concurrency import DEFAULT_BULK_CONCURRENCY, abounded_map
+from .internal.parser import ScriptDataParser
+
+if TYPE_CHECKING:
+    from .client import GooglePlayClient
+
+BATCHEXECUTE_PATH = "/_/PlayStoreUi/data/batchexecute"
+
+
+@dataclass
+class _QueuedCall:
+    rpc_id: str
+    request_json: str
+    extract: Callable[[list], Any]
+    lang: Optional[str]
+    country: Optional[str]
+    age: Optional[str] = None
+
+
+class RpcBatch:
+    """
+    Collects RPC calls and sends them as multiplexed `batchexecute` POSTs.
+
+    Every queue method returns the position of its result in the list returned by
+    `execute`/`aexecute`. Calls sharing a locale (and age filter) travel together in
+    requests of up to `max_size` entries, and each `wrb.fr` envelope of the response
+    is routed back to its call by the request identifier. Results have the same
+    shape as the matching single-call client methods. When a request fails, the
+    exception takes the place of the result of every call it carried, and the
+    other requests still complete.
+    """
+
+    def __init__(self, client: "GooglePlayClient", max_size: int = 50):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._client = client
+        self._max_size = max_size
+        self._calls: List[_QueuedCall] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def reviews(
+        self,
+        app_id: str,
+        lang: str = None,
+        country: str = None,
+        sort: Sort = Sort.NEWEST,
+        num: int = 100,
+        pagination_token: str = None,
+    ) -> int:
+        rpc_id, req_json = self._client._build_reviews_rpc(app_id, sort, num, pagination_token)
+        return self._queue(
+            _QueuedCall(rpc_id, req_json, self._client._extract_reviews, lang, country)
+        )
+
+    def suggest(self, term: str, lang: str = None, country: str = None) -> int:
+        if not term:
+            raise ValueError("Term cannot be empty")
+        rpc_id, req_json = self._client._build_suggest_rpc(term)
+        return self._queue(
+            _QueuedCall(rpc_id, req_json, self._client._extract_suggestions, lang, country)
+        )
+
+    def list(
+        self,
+        collection: Union[Collection, str] = Collection.TOP_FREE,
+        category: Union[Category, str] = Category.APPLICATION,
+        age: Union[Age, str] = None,
+        num: int = 50,
+        lang: str = None,
+        country: str = None,
+    ) -> int:
+        return self._queue_list(
+            collection, category, age, num, lang, country, self._client._extract_list_results
+        )
+
+    def execute(self) -> List[Any]:
+        """Send all queued calls and return their results in queue order."""
+        calls, self._calls = self._calls, []
+        results: List[Any] = [None] * len(calls)
+        for chunk, form_data, params in self._plan(calls):
+            try:
+                response_text = self._client._requester.post(
+                    BATCHEXECUTE_PATH, params=params, data=form_data
+                )
+                self._collect(calls, chunk, response_text, results)
+            except Exception as e:
+                self._fail(chunk, e, results)
+        return results
+
+    async def aexecute(self, concurrency: int = DEFAULT_BULK_CONCURRENCY) -> List[Any]:
+        """Async `execute` with at most `concurrency` requests in flight."""
+        calls, self._calls = self._calls, []
+        results: List[Any] = [None] * len(calls)
+
+        async def send(request: tuple[List[int], Dict[str, str], Dict[str, Any]]) -> str:
+            _, form_data, params = request
+            return await self._client._requester.apost(
+                BATCHEXECUTE_PATH, params=params, data=form_data
+            )
+
+        async with aclosing(abounded_map(send, self._plan(calls), concurrency)) as responses:
+            async for (chunk, _, _), response_text in responses:
+                try:
+                    if isinstance(response_text, Exception):
+                        raise response_text
+                    self._collect(calls, chunk, response_text, results)
+                except Exception as e:
+                    self._fail(chunk, e, results)
+        return results
+
+    def _queue(self, call: _QueuedCall) -> int:
+        self._calls.append(call)
+        return len(self._calls) - 1
+
+    def _queue_list(
+        self,
+        collection: Union[Collection, str],
+        category: Union[Category, str],
+        age: Union[Age, str, None],
+        num: int,
+        lang: Optional[str],
+        country: Optional[str],
+        extract: Callable[[list], Any],
+    ) -> int:
+        rpc_id, req_json = self._client._build_list_rpc(collection, category, num)
+        return self._queue(_QueuedCall(rpc_id, req_json, extract, lang, country, age))
+
+    def _plan(
+        self, calls: List[_QueuedCall]
+    ) -> List[tuple[List[int], Dict[str, str], Dict[str, Any]]]:
+        groups: Dict[tuple, List[int]] = {}
+        for index, call in enumerate(calls):
+            groups.setdefault((call.lang, call.country, call.age), []).append(index)
+
+        plan = []
+        for (lang, country, age), indexes in groups.items():
+            for start in range(0, len(indexes), self._max_size):
+                chunk = indexes[start:start + self._max_size]
+                form_data, params = self._build_request(
+                    [calls[i] for i in chunk], lang, country, age
+                )
+                plan.append((chunk, form_data, params))
+        return plan
+
+    @staticmethod
+    def _build_request(
+        calls: List[_QueuedCall], lang: Optional[str], country: Optional[str], age: Optional[str]
+    ) -> tuple[Dict[str, str], Dict[str, Any]]:
+        # The fourth element of every entry is echoed back in its response envelope,
+        # which is what lets us demultiplex several calls to the same RPC.
+        entries = [
+            [call.rpc_id, call.request_json, None, str(position)]
+            for position, call in enumerate(calls, 1)
+        ]
+        form_data = {"f.req": json.dumps([entries])}
+        params = {
+            "rpcids": ",".join(dict.fromkeys(call.rpc_id for call in calls)),
+            "source-path": "/store/apps",
+            "bl": "boq_playuiserver_20220612.08_p0",
+            "hl": lang,
+            "gl": country,
+            "authuser": "0",
+            "soc-app": "121",
+            "soc-platform": "1",
+            "soc-device": "1",
+            "rt": "c",
+        }
+        if age:
+            params["age"] = age
+        return form_data, params
+
+    @staticmethod
+    def _fail(chunk: List[int], error: Exception, results: List[Any]) -> None:
+        for index in chunk:
+            results[index] = error
+
+    @staticmethod
+    def _collect(
+        calls: List[_QueuedCall], chunk: List[int], response_text: str, results: List[Any]
+    ) -> None:
+        payloads = ScriptDataParser.demultiplex_batchexecute_response(response_text)
+        for position, index in enumerate(chunk, 1):
+            results[index] = calls[index].extract(payloads.get(str(position), []))
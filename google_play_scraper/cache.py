@@ -0,0 +1,255 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Mapping, Optional
+
+BATCHEXECUTE_PATH = "/_/PlayStoreUi/data/batchexecute"
+
+# Seconds a response stays fresh, keyed by request path or, for `batchexecute`
+# requests, by RPC id. Requests carrying several RPCs use the shortest TTL.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/store/apps/details": 6 * 3600,  # app details
+    "/work/search": 3600,  # search results
+    "IJ4APc": 3 * 86400,  # suggestions
+    "UsvDTd": 5 * 60,  # reviews
+    "vyAe2": 3600,  # top lists
+    "qnKhOb": 3600,  # search pagination
+}
+DEFAULT_TTL = 300.0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(ABC):
+    """
+    Storage for raw response bodies, keyed by `make_key`.
+
+    Backends implement `_load`/`_store`/`clear`; `get` and `set` keep the hit and
+    miss counters in `stats`. `_lock` guards the counters and is shared with the
+    backend's own state.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._load(key)
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        if ttl > 0:
+            self._store(key, value, time.time() + ttl)
+
+    @abstractmethod
+    def _load(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def _store(self, key: str, value: str, expires_at: float) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU cache holding at most `max_entries` responses."""
+
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-disk cache in a SQLite database, shared by every process using `path`.
+
+    When `max_entries` is set, the least recently read entries are evicted once
+    the table grows past it. Expired rows are purged on every write.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None):
+        super().__init__()
+        self._max_entries = max_entries
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+
+    def _load(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def _store(self, key: str, value: str, expires_at: float) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            if self._max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self._max_entries,),
+                )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ObjectCache:
+    """
+    In-process LRU cache of parsed results, bounded by serialized size.
+
+    Values are stored pickled, so every `get` returns an independent copy and the
+    memory bound is measured on the stored bytes. Unpickling a model restores its
+    field values directly, skipping parsing and validation.
+    """
+
+    def __init__(self, ttl: float = 3600, max_bytes: int = 64 * 1024 * 1024):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.stats = CacheStats()
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[Hashable, tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.time():
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return pickle.loads(entry[0])
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self._ttl <= 0:
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self._max_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (blob, time.time() + self._ttl)
+            self._size += len(blob)
+            while self._size > self._max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+
+def make_key(method: str, path: str, params: Mapping[str, Any], data: Any) -> str:
+    """Stable digest of everything that determines a response body."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", "replace")
+    raw = json.dumps([method.upper(), path, params, data], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def resolve_ttl(
+        path: str,
+        params: Mapping[str, Any],
+        ttls: Mapping[str, float],
+        default: float = DEFAULT_TTL,
+) -> float:
+    """TTL for a request: by RPC id for `batchexecute`, by path otherwise."""
+    if path == BATCHEXECUTE_PATH:
+        rpc_ids = str(params.get("rpcids") or "").split(",")
+        return min((ttls.get(rpc_id, default) for rpc_id in rpc_ids), default=default)
+    return ttls.get(path, default)
@@ -0,0 +1,135 @@
+import csv
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Union
+
+from .constants import Category, Collection
+
+# Per-app fields kept for every chart position, in column order.
+ENTRY_FIELDS = ("app_id", "title", "developer", "score", "price", "currency", "free")
+
+
+class ChartKey(NamedTuple):
+    country: str
+    category: str
+    collection: str
+
+
+COLUMNS = ChartKey._fields + ("rank",) + ENTRY_FIELDS
+
+
+class ChartSink(ABC):
+    """
+    Receives charts from `charts_snapshot` as they complete.
+
+    Calls are made one at a time from the thread (or task) driving the snapshot,
+    so implementations need no locking.
+    """
+
+    @abstractmethod
+    def write(self, chart: ChartKey, entries: List[Dict[str, Any]]) -> None:
+        """Store one chart; `entries` hold the apps' fields in rank order."""
+
+    def fail(self, chart: ChartKey, error: Exception) -> None:
+        """Called instead of `write` for a chart that could not be fetched."""
+
+
+class ChartSnapshot(ChartSink):
+    """
+    In-memory columnar table with one row per chart position.
+
+    `columns` maps every name in `COLUMNS` to a column of equal length; `rank`
+    is 1-based. Charts that failed are listed in `errors` with their message.
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, Any] = {name: [] for name in COLUMNS}
+        self.columns["rank"] = array("I")
+        self.errors: Dict[ChartKey, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns["rank"])
+
+    def write(self, chart: ChartKey, entries: List[Dict[str, Any]]) -> None:
+        columns = self.columns
+        for name, value in zip(ChartKey._fields, chart):
+            columns[name].extend([value] * len(entries))
+        columns["rank"].extend(range(1, len(entries) + 1))
+        for name in ENTRY_FIELDS:
+            columns[name].extend(entry.get(name) for entry in entries)
+
+    def fail(self, chart: ChartKey, error: Exception) -> None:
+        self.errors[chart] = f"{type(error).__name__}: {error}"
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the table row by row."""
+        columns = [self.columns[name] for name in COLUMNS]
+        for values in zip(*columns):
+            yield dict(zip(COLUMNS, values))
+
+    def ranking(self, country: str, category: str, collection: str) -> List[str]:
+        """App ids of one chart in rank order."""
+        key = (country, str(category), str(collection))
+        columns = self.columns
+        return [
+            app_id
+            for app_id, *row_key in zip(
+                columns["app_id"], columns["country"], columns["category"], columns["collection"]
+            )
+            if tuple(row_key) == key
+        ]
+
+
+class CsvChartSink(ChartSink):
+    """Streams chart rows to a CSV file as they arrive instead of keeping them in memory."""
+
+    def __init__(self, file: TextIO, header: bool = True):
+        self._writer = csv.writer(file)
+        self.errors: Dict[ChartKey, str] = {}
+        if header:
+            self._writer.writerow(COLUMNS)
+
+    def write(self, chart: ChartKey, entries: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(
+            (*chart, rank, *(entry.get(name) for name in ENTRY_FIELDS))
+            for rank, entry in enumerate(entries, 1)
+        )
+
+    def fail(self, chart: ChartKey, error: Exception) -> None:
+        self.errors[chart] = f"{type(error).__name__}: {error}"
+
+
+def _chart_chunks(
+    countries: Iterable[str],
+    categories: Optional[Iterable[Union[Category, str]]],
+    collections: Optional[Iterable[Union[Collection, str]]],
+    size: int,
+) -> Iterator[tuple[ChartKey, ...]]:
+    """Lazily enumerate the chart matrix in per-country groups of at most `size` charts."""
+    if size < 1:
+        raise ValueError("batch_size must be at least 1")
+    categories = [str(c) for c in (Category if categories is None else categories)]
+    collections = [str(c) for c in (Collection if collections is None else collections)]
+    for country in dict.fromkeys(countries):
+        # Charts of one country share `gl`, so each chunk fits in a single request.
+        keys = [
+            ChartKey(country, category, collection)
+            for category in categories
+            for collection in collections
+        ]
+        for start in range(0, len(keys), size):
+            yield tuple(keys[start:start + size])
+
+
+def _write_charts(
+    sink: ChartSink,
+    charts: tuple[ChartKey, ...],
+    result: Union[List[Union[List[Dict[str, Any]], Exception]], Exception],
+) -> None:
+    if isinstance(result, Exception):
+        result = [result] * len(charts)
+    for chart, entries in zip(charts, result):
+        if isinstance(entries, Exception):
+            sink.fail(chart, entries)
+        else:
+            sink.write(chart, entries)
@@ -1,24 +1,64 @@
+import asyncio
 import json
 import re
+import ssl
+import threading
+from functools import lru_cache
+from urllib.parse import parse_qs
 from datetime import datetime
-from typing import Optional, List, Union, Dict, Any
+from typing import (
+    Optional, List, Union, Dict, Any, Callable, Iterable, Iterator, AsyncIterator,
+    ContextManager,
+)
 
 import httpx
 
+from .batch import RpcBatch
+from .cache import ObjectCache, ResponseCache
+from .charts import ChartKey, ChartSink, ChartSnapshot, _chart_chunks, _write_charts
 from .constants import Category, Collection, Sort, Age
 from .exceptions import AppNotFound
-from .internal.extractor import ElementSpec, extract_from_spec
+from .internal.concurrency import DEFAULT_BULK_CONCURRENCY, SingleFlight, bounded_map, abounded_map
+from .internal.extractor import ElementSpec, ExtractionPlan
 from .internal.parser import ScriptDataParser
 from .internal.request import Requester
 from .internal.request_constants import LIST_PAYLOAD_TEMPLATE
-from .models import AppDetails, AppOverview, Review
+from .models import (
+    AppDetails,
+    AppOverview,
+    LocalizedAppDetails,
+    Review,
+    SearchRankings,
+    ModelT,
+    construct_trusted,
+    locale_key,
+)
+from .proxy import ProxyPool
+from .ratelimit import TokenBucket
+from .retry import RequestMetrics, RetryPolicy
 
 SEARCH_PAGINATION_RPC_ID = "qnKhOb"
+REVIEWS_RPC_ID = "UsvDTd"
+SUGGEST_RPC_ID = "IJ4APc"
+LIST_RPC_ID = "vyAe2"
 SEARCH_PAGINATION_PAGE_SIZE = 100
+DEFAULT_BATCH_SIZE = 50
+REVIEWS_PAGE_SIZE = 100
+
+_SEARCH_PRICES = {"free": 1, "paid": 2, "all": 0}
+
+# Called with the results collected so far after each search page; True stops paging.
+SearchStopCallback = Callable[[List[AppOverview]], bool]
+
+# Turns raw search result items (at most `limit` of them when given) into results.
+SearchExtractor = Callable[[Any, Optional[int]], List[Any]]
+
+# An app id, optionally paired with a per-app `(app_id, lang, country)` locale override.
+AppRequest = Union[str, tuple[str, Optional[str], Optional[str]]]
 
 
 def _build_proxy_mounts(
-    proxies: Optional[dict], *, async_client: bool = False
+    proxies: Optional[dict], *, async_client: bool = False, **transport_options: Any
 ) -> Optional[dict]:
     """Build `httpx` `mounts` from a requests-style proxies dict.
 
@@ -28,6 +68,9 @@ def _build_proxy_mounts(
     Expected input examples:
       - {"http": "http://localhost:8030", "https": "http://localhost:8031"}
       - {"http://": "http://localhost:8030", "https://": "http://localhost:8031"}
+
+    `transport_options` (`verify`, `http2`, `limits`) are applied to every proxy
+    transport so proxied traffic gets the same pool settings as direct traffic.
     """
 
     if not proxies:
@@ -45,14 +88,120 @@ def _build_proxy_mounts(
     transport_cls = httpx.AsyncHTTPTransport if async_client else httpx.HTTPTransport
     mounts: dict[str, httpx.BaseTransport | httpx.AsyncBaseTransport] = {}
     if http_proxy:
-        mounts["http://"] = transport_cls(proxy=http_proxy)
+        mounts["http://"] = transport_cls(proxy=http_proxy, **transport_options)
     if https_proxy:
-        mounts["https://"] = transport_cls(proxy=https_proxy)
+        mounts["https://"] = transport_cls(proxy=https_proxy, **transport_options)
 
     # If user passed only one of them, still return what we have.
     return mounts or None
 
 
+def _transport_options(
+    verify_ssl: bool, http2: bool, limits: Optional[httpx.Limits]
+) -> Dict[str, Any]:
+    """Keyword arguments shared by `httpx` clients and the transports we build."""
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "http2=True requires the optional 'h2' package: "
+                "pip install 'play-store-scraper-ng[http2]'"
+            ) from e
+    options: Dict[str, Any] = {"verify": verify_ssl, "http2": http2}
+    if limits is not None:
+        options["limits"] = limits
+    return options
+
+
+@lru_cache(maxsize=None)
+def _ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """One SSL context per verification mode, shared by every client in the process."""
+    return httpx.create_ssl_context(verify=verify_ssl)
+
+
+def _with_ssl_context(options: Dict[str, Any]) -> Dict[str, Any]:
+    return {**options, "verify": _ssl_context(options["verify"])}
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a prefetch that is no longer needed without leaking its exception."""
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.cancel()
+
+
+def _localize(
+    app_id: str,
+    locales: List[tuple[str, str]],
+    results: Dict[tuple[str, str], Union[AppDetails, Exception]],
+) -> LocalizedAppDetails:
+    """Fold per-locale results into one base `AppDetails` plus per-locale deltas."""
+    localized = LocalizedAppDetails(app_id=app_id)
+    for lang, country in locales:
+        key = locale_key(lang, country)
+        result = results[(lang, country)]
+        if isinstance(result, Exception):
+            localized.errors[key] = f"{type(result).__name__}: {result}"
+            continue
+        if localized.base is None:
+            localized.base, localized.base_locale = result, key
+        base_fields = localized.base.__dict__
+        localized.deltas[key] = {
+            name: value for name, value in result.__dict__.items()
+            if base_fields.get(name) != value
+        }
+    return localized
+
+
+class _SearchCollector:
+    """
+    Search extractor shared by the terms of one `search_many` call.
+
+    Only the app id is read for an app that was already collected, so each
+    `AppOverview` is built once however many terms return it.
+    """
+
+    def __init__(self, build: Callable[[type[ModelT], Dict[str, Any]], ModelT]):
+        self._build = build
+        self._lock = threading.Lock()
+        self.apps: Dict[str, AppOverview] = {}
+
+    def __call__(self, items: Any, limit: Optional[int] = None) -> List[str]:
+        if not items:
+            return []
+
+        app_ids = []
+        for item in items if limit is None else items[:limit]:
+            app_id = _SEARCH_APP_ID_SPEC.extract(item)
+            if not app_id:
+                continue
+            app_ids.append(app_id)
+            if app_id in self.apps:
+                continue
+            with self._lock:
+                if app_id not in self.apps:
+                    self.apps[app_id] = self._build(AppOverview, _SEARCH_RESULT_PLAN.extract(item))
+        return app_ids
+
+
+def _rankings(
+    terms: List[str],
+    results: Dict[str, Union[List[str], Exception]],
+    collector: _SearchCollector,
+) -> SearchRankings:
+    rankings = SearchRankings(apps=collector.apps)
+    for term in terms:
+        result = results[term]
+        if isinstance(result, Exception):
+            rankings.errors[term] = f"{type(result).__name__}: {result}"
+        else:
+            rankings.rankings[term] = result
+    return rankings
+
+
 def _clean_desc(html: Optional[str]) -> str:
     return re.sub(r"<br>", "\r\n", html) if html else ""
 
@@ -74,31 +223,299 @@ def _ts_to_date(ts: int) -> datetime:
     return datetime.fromtimestamp(ts) if ts else None
 
 
+def _local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    # Review dates are naive local times (see `_ts_to_date`).
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _normalize_app_request(request: AppRequest) -> tuple[str, Optional[str], Optional[str]]:
+    if isinstance(request, str):
+        return request, None, None
+    app_id, lang, country = request
+    return app_id, lang, country
+
+
+def _price_from_micros(micros: Optional[int]) -> float:
+    return micros / 1000000 if micros else 0
+
+
+def _is_zero(value: Any) -> bool:
+    return value == 0
+
+
+def _developer_id_from_url(url: str) -> str:
+    return url.split("id=")[1] if "id=" in url else url
+
+
+def _screenshot_urls(items: list) -> List[str]:
+    return [i[3][2] for i in items] if items else []
+
+
+def _absolute_url(path: str) -> str:
+    return f"{Requester.BASE_URL}{path}"
+
+
+# Extraction plans are compiled once at import time and shared by every call.
+_APP_DETAILS_PLAN = ExtractionPlan({
+    "title": ElementSpec([0, 0]),
+    "description_html": ElementSpec([72, 0, 1]),
+    "description": ElementSpec([72, 0, 1], transformer=_clean_desc),
+    "summary": ElementSpec([73, 0, 1]),
+    "installs": ElementSpec([13, 0]),
+    "min_installs": ElementSpec([13, 1]),
+    "max_installs": ElementSpec([13, 2]),
+    "score": ElementSpec([51, 0, 1]),
+    "score_text": ElementSpec([51, 0, 0]),
+    "ratings": ElementSpec([51, 2, 1]),
+    "reviews": ElementSpec([51, 3, 1]),
+    "histogram": ElementSpec([51, 1], transformer=_normalize_histogram),
+    "price": ElementSpec([57, 0, 0, 0, 0, 1, 0, 0], transformer=_price_from_micros),
+    "free": ElementSpec([57, 0, 0, 0, 0, 1, 0, 0], transformer=_is_zero),
+    "currency": ElementSpec([57, 0, 0, 0, 0, 1, 0, 1]),
+    "price_text": ElementSpec([57, 0, 0, 0, 0, 1, 0, 2]),
+    "available": ElementSpec([18, 0], transformer=bool),
+    "offers_iap": ElementSpec([19, 0], transformer=bool),
+    "android_version": ElementSpec([140, 1, 1, 0, 0, 1]),
+    "developer": ElementSpec([68, 0]),
+    "developer_id": ElementSpec([68, 1, 4, 2], transformer=_developer_id_from_url),
+    "developer_email": ElementSpec([69, 1, 0]),
+    "developer_website": ElementSpec([69, 0, 5, 2]),
+    "developer_address": ElementSpec([69, 2, 0]),
+    "privacy_policy": ElementSpec([99, 0, 5, 2]),
+    "genre": ElementSpec([79, 0, 0, 0]),
+    "genre_id": ElementSpec([79, 0, 0, 2]),
+    "icon": ElementSpec([95, 0, 3, 2]),
+    "header_image": ElementSpec([96, 0, 3, 2]),
+    "screenshots": ElementSpec([78, 0], transformer=_screenshot_urls),
+    "video": ElementSpec([100, 0, 0, 3, 2]),
+    "content_rating": ElementSpec([9, 0]),
+    "released": ElementSpec([10, 0]),
+    "updated": ElementSpec([145, 0, 1, 0], transformer=_ts_to_date),
+    "version": ElementSpec([140, 0, 0, 0]),
+    "recent_changes": ElementSpec([144, 1, 1]),
+})
+_APP_DETAILS_KEYS = frozenset({"ds:5"})
+_DESCRIPTION_FALLBACK_SPEC = ElementSpec([12, 0, 0, 1], transformer=_clean_desc)
+_DESCRIPTION_HTML_FALLBACK_SPEC = ElementSpec([12, 0, 0, 1])
+
+_SEARCH_RESULT_PLAN = ExtractionPlan({
+    "title": ElementSpec([2]),
+    "app_id": ElementSpec([12, 0]),
+    "icon": ElementSpec([1, 1, 0, 3, 2]),
+    "developer": ElementSpec([4, 0, 0, 0]),
+    "developer_id": ElementSpec([4, 0, 0, 1, 4, 2], transformer=_developer_id_from_url),
+    "score": ElementSpec([6, 0, 2, 1, 1]),
+    "score_text": ElementSpec([6, 0, 2, 1, 0]),
+    "price_text": ElementSpec([7, 0, 3, 2, 1, 0, 2]),
+    "free": ElementSpec([7, 0, 3, 2, 1, 0, 0], transformer=_is_zero),
+    "summary": ElementSpec([4, 1, 1, 1, 1]),
+})
+_SEARCH_APP_ID_SPEC = _SEARCH_RESULT_PLAN.specs["app_id"]
+_SEARCH_SECTION_TOKEN_SPEC = ElementSpec([1])
+_SEARCH_PAGE_ITEMS_SPEC = ElementSpec([0, 0, 0])
+_SEARCH_PAGE_TOKEN_SPEC = ElementSpec([0, 0, 7, 1])
+
+_LIST_RESULT_PLAN = ExtractionPlan({
+    "title": ElementSpec([0, 3]),
+    "app_id": ElementSpec([0, 0, 0]),
+    "url": ElementSpec([0, 10, 4, 2], transformer=_absolute_url),
+    "icon": ElementSpec([0, 1, 3, 2]),
+    "developer": ElementSpec([0, 14]),
+    "developer_id": ElementSpec([0, 14]),
+    "currency": ElementSpec([0, 8, 1, 0, 1]),
+    "price": ElementSpec([0, 8, 1, 0, 0], transformer=_price_from_micros),
+    "free": ElementSpec([0, 8, 1, 0, 0], transformer=_is_zero),
+    "summary": ElementSpec([0, 13, 1]),
+    "score_text": ElementSpec([0, 4, 0]),
+    "score": ElementSpec([0, 4, 1]),
+})
+_LIST_ITEMS_SPEC = ElementSpec([0, 1, 0, 28, 0])
+
+_REVIEW_PLAN = ExtractionPlan({
+    "id": ElementSpec([0]),
+    "user_name": ElementSpec([1, 0]),
+    "user_image": ElementSpec([1, 1, 3, 2]),
+    "date": ElementSpec([5, 0], transformer=_ts_to_date),
+    "score": ElementSpec([2]),
+    "text": ElementSpec([4]),
+    "reply_date": ElementSpec([7, 2, 0], transformer=_ts_to_date),
+    "reply_text": ElementSpec([7, 1]),
+    "thumbs_up": ElementSpec([6]),
+    "version": ElementSpec([10]),
+})
+
+
 class GooglePlayClient:
     def __init__(
         self,
         country: str = "us",
         lang: str = "en",
         proxies: Optional[dict] = None,
-        throttle_requests_per_second: Optional[int] = None,
+        throttle_requests_per_second: Optional[float] = None,
         verify_ssl: bool = True,
+        validate: bool = True,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        object_cache: Optional[ObjectCache] = None,
+        coalesce_requests: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        adaptive_throttle: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Union[httpx.Timeout, float, None] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        stream_html: bool = False,
     ):
-        sync_mounts = _build_proxy_mounts(proxies)
-        async_mounts = _build_proxy_mounts(proxies, async_client=True)
+        """
+        `validate=False` builds result models with `construct_trusted` instead of
+        full Pydantic validation. It is much faster for large crawls, but URL fields
+        are kept as plain strings; keep the default when debugging parser output.
+
+        `cache` stores raw responses (see `google_play_scraper.cache`). `cache_ttls`
+        overrides `DEFAULT_TTLS` by request path or RPC id; a TTL of 0 disables
+        caching for that endpoint.
+
+        `object_cache` memoizes parsed `app` and `search` results on top of that, so
+        hot entries skip parsing and model construction as well.
+
+        With `coalesce_requests` (the default), identical requests issued while one
+        is already in flight wait for it instead of going out again, and concurrent
+        `app`/`aapp` calls for the same app also share the parsed result.
+
+        `throttle_requests_per_second` may be fractional. For bursts, or to share a
+        budget between clients or worker processes, pass a `TokenBucket` as
+        `rate_limiter` instead. `adaptive_throttle=True` starts at the throttle rate
+        and adjusts it from 429/503 feedback (see `AdaptiveRateLimiter`); it needs
+        `throttle_requests_per_second` and cannot be combined with `rate_limiter`.
+
+        `retry_policy` retries transient failures (network errors, 5xx, quota) with
+        jittered exponential backoff; by default every failure is raised at once.
+
+        `limits`, `timeout` and `http2` configure the connection pools (HTTP/2 needs
+        the `http2` extra). `transport`/`async_transport` replace the default
+        transports, and `http_client`/`async_http_client` are used as-is instead of
+        building clients, in which case the pool and proxy options do not apply.
+
+        `proxy_pool` routes every request through a `ProxyPool`, replacing `proxies`.
+
+        `stream_html=True` streams app detail pages and stops reading as soon as the
+        needed data block has arrived, saving bandwidth and memory. Streamed pages
+        bypass the response cache.
+        """
+        self._validate = validate
+        self._stream_html = stream_html
+        self._object_cache = object_cache
+        self._coalesce = coalesce_requests
+        self._flights = SingleFlight()
+
+        options = _transport_options(verify_ssl, http2, limits)
+        if proxy_pool is not None and (proxies or transport or async_transport):
+            raise ValueError("proxy_pool cannot be combined with proxies or transports")
+        client_options: Dict[str, Any] = {}
+        if timeout is not None:
+            client_options["timeout"] = timeout
+
+        # Building an httpx client costs an SSL context and connection pools, so
+        # each one is only created on first use.
+        def _create_session() -> httpx.Client:
+            resolved = _with_ssl_context(options)
+            return httpx.Client(
+                transport=proxy_pool.transport(**resolved) if proxy_pool else transport,
+                mounts=_build_proxy_mounts(proxies, **resolved),
+                **resolved,
+                **client_options,
+            )
 
-        self._session = httpx.Client(mounts=sync_mounts, verify=verify_ssl)
-        self._async_session = httpx.AsyncClient(mounts=async_mounts, verify=verify_ssl)
+        def _create_async_session() -> httpx.AsyncClient:
+            resolved = _with_ssl_context(options)
+            return httpx.AsyncClient(
+                transport=proxy_pool.async_transport(**resolved) if proxy_pool else async_transport,
+                mounts=_build_proxy_mounts(proxies, async_client=True, **resolved),
+                **resolved,
+                **client_options,
+            )
 
         self._requester = Requester(
-            self._session,
+            http_client,
             throttle_requests_per_second,
             default_lang=lang,
             default_country=country,
-            async_session=self._async_session,
+            async_session=async_http_client,
+            session_factory=_create_session,
+            async_session_factory=_create_async_session,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            coalesce=coalesce_requests,
+            rate_limiter=rate_limiter,
+            adaptive_throttle=adaptive_throttle,
+            retry_policy=retry_policy,
         )
 
+    def close(self) -> None:
+        """Close the sync HTTP client if it was created by this client."""
+        self._requester.close()
+
+    async def aclose(self) -> None:
+        """Close every HTTP client created by this client; injected ones stay open."""
+        await self._requester.aclose()
+
+    def __enter__(self) -> "GooglePlayClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "GooglePlayClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        """Request, attempt, retry and failure counters for this client."""
+        return self._requester.metrics
+
+    @property
+    def effective_rate(self) -> Optional[float]:
+        """Requests/second currently allowed by the rate limiter, None when unthrottled."""
+        return self._requester.effective_rate
+
+    def bypass_cache(self) -> ContextManager[None]:
+        """Context manager forcing fresh responses for calls made inside it."""
+        return self._requester.bypass_cache()
+
+    def _cached_object(self, key: tuple) -> Optional[Any]:
+        if self._object_cache is None or self._requester.bypassing_cache:
+            return None
+        return self._object_cache.get(key)
+
+    def _store_object(self, key: tuple, value: Any) -> None:
+        if self._object_cache is not None:
+            self._object_cache.set(key, value)
+
+    def _resolve_locale(
+        self, lang: Optional[str], country: Optional[str]
+    ) -> tuple[str, str]:
+        """Fill in the client defaults the requester would use for `hl`/`gl`."""
+        return lang or self._requester._lang, country or self._requester._country
+
+    def _build_model(self, model_cls: type[ModelT], data: Dict[str, Any]) -> ModelT:
+        if self._validate:
+            return model_cls(**data)
+        return construct_trusted(model_cls, data)
+
     def _parse_app_details(self, html: str, app_id: str) -> AppDetails:
-        data_map = ScriptDataParser.parse(html)
+        return self._app_details_from(ScriptDataParser.parse(html, keys=_APP_DETAILS_KEYS), app_id)
+
+    def _app_details_from(self, data_map: Dict[str, Any], app_id: str) -> AppDetails:
         ds5 = data_map.get("ds:5")
         if not ds5:
             raise AppNotFound(f"Could not parse data for {app_id}")
@@ -108,149 +525,74 @@ class GooglePlayClient:
         except (IndexError, TypeError):
             raise AppNotFound(f"Unexpected data format for {app_id}")
 
-        specs = {
-            "title": ElementSpec([0, 0]),
-            "description_html": ElementSpec([72, 0, 1]),
-            "description": ElementSpec([72, 0, 1], transformer=_clean_desc),
-            "summary": ElementSpec([73, 0, 1]),
-            "installs": ElementSpec([13, 0]),
-            "min_installs": ElementSpec([13, 1]),
-            "max_installs": ElementSpec([13, 2]),
-            "score": ElementSpec([51, 0, 1]),
-            "score_text": ElementSpec([51, 0, 0]),
-            "ratings": ElementSpec([51, 2, 1]),
-            "reviews": ElementSpec([51, 3, 1]),
-            "histogram": ElementSpec([51, 1], transformer=_normalize_histogram),
-            "price": ElementSpec(
-                [57, 0, 0, 0, 0, 1, 0, 0], transformer=lambda x: x / 1000000 if x else 0
-            ),
-            "free": ElementSpec(
-                [57, 0, 0, 0, 0, 1, 0, 0], transformer=lambda x: x == 0
-            ),
-            "currency": ElementSpec([57, 0, 0, 0, 0, 1, 0, 1]),
-            "price_text": ElementSpec([57, 0, 0, 0, 0, 1, 0, 2]),
-            "available": ElementSpec([18, 0], transformer=bool),
-            "offers_iap": ElementSpec([19, 0], transformer=bool),
-            "android_version": ElementSpec([140, 1, 1, 0, 0, 1]),
-            "developer": ElementSpec([68, 0]),
-            "developer_id": ElementSpec(
-                [68, 1, 4, 2],
-                transformer=lambda x: x.split("id=")[1] if "id=" in x else x,
-            ),
-            "developer_email": ElementSpec([69, 1, 0]),
-            "developer_website": ElementSpec([69, 0, 5, 2]),
-            "developer_address": ElementSpec([69, 2, 0]),
-            "privacy_policy": ElementSpec([99, 0, 5, 2]),
-            "genre": ElementSpec([79, 0, 0, 0]),
-            "genre_id": ElementSpec([79, 0, 0, 2]),
-            "icon": ElementSpec([95, 0, 3, 2]),
-            "header_image": ElementSpec([96, 0, 3, 2]),
-            "screenshots": ElementSpec(
-                [78, 0], transformer=lambda x: [i[3][2] for i in x] if x else []
-            ),
-            "video": ElementSpec([100, 0, 0, 3, 2]),
-            "content_rating": ElementSpec([9, 0]),
-            "released": ElementSpec([10, 0]),
-            "updated": ElementSpec([145, 0, 1, 0], transformer=_ts_to_date),
-            "version": ElementSpec([140, 0, 0, 0]),
-            "recent_changes": ElementSpec([144, 1, 1]),
-        }
-        data = extract_from_spec(root, specs)
+        data = _APP_DETAILS_PLAN.extract(root)
 
         if not data.get("description"):
-            data["description"] = ElementSpec(
-                [12, 0, 0, 1], transformer=_clean_desc
-            ).extract(root)
-            data["description_html"] = ElementSpec([12, 0, 0, 1]).extract(root)
+            data["description"] = _DESCRIPTION_FALLBACK_SPEC.extract(root)
+            data["description_html"] = _DESCRIPTION_HTML_FALLBACK_SPEC.extract(root)
 
         data["app_id"] = app_id
         data["url"] = f"{Requester.BASE_URL}/store/apps/details?id={app_id}"
 
-        return AppDetails(**data)
+        return self._build_model(AppDetails, data)
 
-    def _parse_search_results(self, html: str, num: int) -> List[AppOverview]:
-        data_map = ScriptDataParser.parse(html)
+    def _split_search_page(self, html: str) -> tuple[Any, Optional[str]]:
+        """Raw result items and pagination token of a search page, before model building."""
+        # Results and the pagination token both live in `ds:1`, so parse it once.
+        data_map = ScriptDataParser.parse(html, keys={"ds:1"})
         ds1 = data_map.get("ds:1")
         if not ds1:
-            return []
+            return None, None
 
         try:
             sections = ds1[0][1][0][0]
         except (IndexError, TypeError):
-            return []
+            return None, None
 
         try:
             items = sections[0]
         except (IndexError, TypeError):
-            return []
+            items = None
 
-        return self._extract_search_results(items, num)
+        return items, self._extract_search_token(sections)
 
     def _extract_search_results(self, items: Any, num: int | None = None) -> List[AppOverview]:
-        results = []
-        specs = {
-            "title": ElementSpec([2]),
-            "app_id": ElementSpec([12, 0]),
-            "icon": ElementSpec([1, 1, 0, 3, 2]),
-            "developer": ElementSpec([4, 0, 0, 0]),
-            "developer_id": ElementSpec(
-                [4, 0, 0, 1, 4, 2],
-                transformer=lambda x: x.split("id=")[1] if "id=" in x else x,
-            ),
-            "score": ElementSpec([6, 0, 2, 1, 1]),
-            "score_text": ElementSpec([6, 0, 2, 1, 0]),
-            "price_text": ElementSpec([7, 0, 3, 2, 1, 0, 2]),
-            "free": ElementSpec([7, 0, 3, 2, 1, 0, 0], transformer=lambda x: x == 0),
-            "summary": ElementSpec([4, 1, 1, 1, 1]),
-        }
-
         if not items:
             return []
 
+        results = []
         items_to_process = items if num is None else items[:num]
         for item in items_to_process:
-            data = extract_from_spec(item, specs)
+            data = _SEARCH_RESULT_PLAN.extract(item)
             if data.get("app_id"):
-                results.append(AppOverview(**data))
+                results.append(self._build_model(AppOverview, data))
 
         return results
 
-    def _extract_search_token(self, html: str) -> Optional[str]:
-        data_map = ScriptDataParser.parse(html)
-        ds1 = data_map.get("ds:1")
-        if not ds1:
-            return None
-
-        try:
-            sections = ds1[0][1][0][0]
-        except (IndexError, TypeError):
-            return None
-
+    def _extract_search_token(self, sections: Any) -> Optional[str]:
         if not isinstance(sections, list):
             return None
 
         for section in sections:
-            token = ElementSpec([1]).extract(section)
+            token = _SEARCH_SECTION_TOKEN_SPEC.extract(section)
             if isinstance(token, str):
                 return token
         return None
 
-    def _parse_paginated_search_results(
-        self, response_text: str
-    ) -> tuple[List[AppOverview], Optional[str]]:
+    def _split_paginated_search_results(self, response_text: str) -> tuple[Any, Optional[str]]:
         data = ScriptDataParser.parse_batchexecute_response(response_text)
         if not data:
-            return [], None
+            return None, None
 
-        items = ElementSpec([0, 0, 0]).extract(data)
+        items = _SEARCH_PAGE_ITEMS_SPEC.extract(data)
         if not items:
-            return [], None
+            return None, None
 
-        token = ElementSpec([0, 0, 7, 1]).extract(data)
+        token = _SEARCH_PAGE_TOKEN_SPEC.extract(data)
         if not isinstance(token, str):
             token = None
 
-        return self._extract_search_results(items), token
+        return items, token
 
     def _build_search_pagination_request(
         self, token: str, lang: str, country: str
@@ -284,90 +626,142 @@ class GooglePlayClient:
         return form_data, params
 
     def _search_with_pagination(
-        self, html: str, num: int, lang: str, country: str
-    ) -> List[AppOverview]:
-        results = self._parse_search_results(html, num)
-        if len(results) >= num:
+        self,
+        html: str,
+        num: int,
+        lang: str,
+        country: str,
+        stop_when: Optional[SearchStopCallback] = None,
+        extract: Optional[SearchExtractor] = None,
+    ) -> List[Any]:
+        """Collect up to `num` results from a search page and the pages following it.
+
+        `extract(items, limit)` turns raw result items into results and defaults to
+        building `AppOverview` models.
+        """
+        items, token = self._split_search_page(html)
+        return self._follow_pages(
+            items, token, num, lang, country, extract or self._extract_search_results, stop_when
+        )
+
+    async def _asearch_with_pagination(
+        self,
+        html: str,
+        num: int,
+        lang: str,
+        country: str,
+        stop_when: Optional[SearchStopCallback] = None,
+        extract: Optional[SearchExtractor] = None,
+    ) -> List[Any]:
+        items, token = self._split_search_page(html)
+        return await self._afollow_pages(
+            items, token, num, lang, country, extract or self._extract_search_results, stop_when
+        )
+
+    def _follow_pages(
+        self,
+        items: Any,
+        token: Optional[str],
+        num: int,
+        lang: str,
+        country: str,
+        extract: SearchExtractor,
+        stop_when: Optional[SearchStopCallback] = None,
+    ) -> List[Any]:
+        """Extract a first page of items, then follow `qnKhOb` tokens until `num` results."""
+        results = extract(items, num)
+        if len(results) >= num or (stop_when and stop_when(results)):
             return results[:num]
 
-        token = self._extract_search_token(html)
         while token and len(results) < num:
             form_data, params = self._build_search_pagination_request(token, lang, country)
             response_text = self._requester.post(
                 "/_/PlayStoreUi/data/batchexecute", params=params, data=form_data
             )
-            page_results, token = self._parse_paginated_search_results(response_text)
-            if not page_results:
+            items, token = self._split_paginated_search_results(response_text)
+            if not items:
+                break
+            results.extend(extract(items, None))
+            if stop_when and stop_when(results):
                 break
-            results.extend(page_results)
 
         return results[:num]
 
-    async def _asearch_with_pagination(
-        self, html: str, num: int, lang: str, country: str
-    ) -> List[AppOverview]:
-        results = self._parse_search_results(html, num)
-        if len(results) >= num:
-            return results[:num]
-
-        token = self._extract_search_token(html)
-        while token and len(results) < num:
-            form_data, params = self._build_search_pagination_request(token, lang, country)
-            response_text = await self._requester.apost(
-                "/_/PlayStoreUi/data/batchexecute", params=params, data=form_data
-            )
-            page_results, token = self._parse_paginated_search_results(response_text)
-            if not page_results:
-                break
-            results.extend(page_results)
+    async def _afollow_pages(
+        self,
+        items: Any,
+        token: Optional[str],
+        num: int,
+        lang: str,
+        country: str,
+        extract: SearchExtractor,
+        stop_when: Optional[SearchStopCallback] = None,
+    ) -> List[Any]:
+        # The next page is requested as soon as its token is known, so building the
+        # models of one page overlaps with the round trip for the next.
+        pending = None
+        if token and len(items or ()) < num:
+            pending = self._aprefetch_search_page(token, lang, country)
+        results = extract(items, num)
+        try:
+            if stop_when and stop_when(results):
+                return results[:num]
+            if pending is None and token and len(results) < num:
+                pending = self._aprefetch_search_page(token, lang, country)
+
+            while pending is not None:
+                items, token = self._split_paginated_search_results(await pending)
+                pending = None
+                if not items:
+                    break
+                if token and len(results) + len(items) < num:
+                    pending = self._aprefetch_search_page(token, lang, country)
+                results.extend(extract(items, None))
+                if len(results) >= num or (stop_when and stop_when(results)):
+                    break
+                if pending is None and token:
+                    pending = self._aprefetch_search_page(token, lang, country)
+        finally:
+            if pending is not None:
+                _discard_task(pending)
 
         return results[:num]
 
-    def _parse_list_results(self, response_text: str) -> List[AppOverview]:
-        data = ScriptDataParser.parse_batchexecute_response(response_text)
-        if not data:
-            return []
+    def _aprefetch_search_page(self, token: str, lang: str, country: str) -> asyncio.Task:
+        form_data, params = self._build_search_pagination_request(token, lang, country)
+        return asyncio.ensure_future(self._requester.apost(
+            "/_/PlayStoreUi/data/batchexecute", params=params, data=form_data
+        ))
 
-        root_path = [0, 1, 0, 28, 0]
-        try:
-            apps_root = ElementSpec(root_path).extract(data)
-        except Exception:
+    def _extract_list_results(self, data: list) -> List[AppOverview]:
+        return [
+            self._build_model(AppOverview, entry) for entry in self._extract_list_entries(data)
+        ]
+
+    def _extract_list_entries(self, data: list) -> List[Dict[str, Any]]:
+        """Raw field dicts of a chart's apps in rank order, before model building."""
+        if not data:
             return []
 
+        apps_root = _LIST_ITEMS_SPEC.extract(data)
         if not apps_root:
             return []
 
-        results = []
-        specs = {
-            "title": ElementSpec([0, 3]),
-            "app_id": ElementSpec([0, 0, 0]),
-            "url": ElementSpec(
-                [0, 10, 4, 2], transformer=lambda x: f"{Requester.BASE_URL}{x}"
-            ),
-            "icon": ElementSpec([0, 1, 3, 2]),
-            "developer": ElementSpec([0, 14]),
-            "developer_id": ElementSpec([0, 14]),
-            "currency": ElementSpec([0, 8, 1, 0, 1]),
-            "price": ElementSpec(
-                [0, 8, 1, 0, 0], transformer=lambda x: x / 1000000 if x else 0
-            ),
-            "free": ElementSpec([0, 8, 1, 0, 0], transformer=lambda x: x == 0),
-            "summary": ElementSpec([0, 13, 1]),
-            "score_text": ElementSpec([0, 4, 0]),
-            "score": ElementSpec([0, 4, 1]),
-        }
-
+        entries = []
         for app_raw in apps_root:
-            extracted = extract_from_spec(app_raw, specs)
+            extracted = _LIST_RESULT_PLAN.extract(app_raw)
             if extracted.get("app_id"):
-                results.append(AppOverview(**extracted))
+                entries.append(extracted)
 
-        return results
+        return entries
 
     def _parse_reviews(
         self, response_text: str
     ) -> tuple[List[Review], Optional[str]]:
         data_arr = ScriptDataParser.parse_batchexecute_response(response_text)
+        return self._extract_reviews(data_arr)
+
+    def _extract_reviews(self, data_arr: list) -> tuple[List[Review], Optional[str]]:
         if not data_arr:
             return [], None
 
@@ -381,32 +775,18 @@ class GooglePlayClient:
             return [], None
 
         results = []
-        specs = {
-            "id": ElementSpec([0]),
-            "user_name": ElementSpec([1, 0]),
-            "user_image": ElementSpec([1, 1, 3, 2]),
-            "date": ElementSpec(
-                [5, 0], transformer=lambda x: datetime.fromtimestamp(x) if x else None
-            ),
-            "score": ElementSpec([2]),
-            "text": ElementSpec([4]),
-            "reply_date": ElementSpec(
-                [7, 2, 0], transformer=lambda x: datetime.fromtimestamp(x) if x else None
-            ),
-            "reply_text": ElementSpec([7, 1]),
-            "thumbs_up": ElementSpec([6]),
-            "version": ElementSpec([10]),
-        }
-
         for raw_review in reviews_root:
-            data = extract_from_spec(raw_review, specs)
+            data = _REVIEW_PLAN.extract(raw_review)
             if data.get("id"):
-                results.append(Review(**data))
+                results.append(self._build_model(Review, data))
 
         return results, token
 
     def _parse_suggestions(self, response_text: str) -> List[str]:
         data = ScriptDataParser.parse_batchexecute_response(response_text)
+        return self._extract_suggestions(data)
+
+    def _extract_suggestions(self, data: list) -> List[str]:
         if not data:
             return []
 
@@ -421,20 +801,123 @@ class GooglePlayClient:
     def app(self, app_id: str, lang: str = None, country: str = None) -> AppDetails:
         if not app_id:
             raise ValueError("app_id cannot be empty")
-        html = self._requester.get(
-            "/store/apps/details", params={"id": app_id, "hl": lang, "gl": country}
-        )
-        return self._parse_app_details(html, app_id)
+        key = ("app", app_id, *self._resolve_locale(lang, country))
+        cached = self._cached_object(key)
+        if cached is not None:
+            return cached
+        if not self._coalesce:
+            return self._fetch_app(key, app_id, lang, country)
+        return self._flights.do(key, lambda: self._fetch_app(key, app_id, lang, country))
 
     async def aapp(
         self, app_id: str, lang: str = None, country: str = None
     ) -> AppDetails:
         if not app_id:
             raise ValueError("app_id cannot be empty")
-        html = await self._requester.aget(
-            "/store/apps/details", params={"id": app_id, "hl": lang, "gl": country}
+        key = ("app", app_id, *self._resolve_locale(lang, country))
+        cached = self._cached_object(key)
+        if cached is not None:
+            return cached
+        if not self._coalesce:
+            return await self._afetch_app(key, app_id, lang, country)
+        return await self._flights.ado(
+            key, lambda: self._afetch_app(key, app_id, lang, country)
         )
-        return self._parse_app_details(html, app_id)
+
+    def _fetch_app(
+        self, key: tuple, app_id: str, lang: Optional[str], country: Optional[str]
+    ) -> AppDetails:
+        params = {"id": app_id, "hl": lang, "gl": country}
+        if self._stream_html:
+            data_map = self._requester.get_script_data(
+                "/store/apps/details", _APP_DETAILS_KEYS, params=params
+            )
+            details = self._app_details_from(data_map, app_id)
+        else:
+            html = self._requester.get("/store/apps/details", params=params)
+            details = self._parse_app_details(html, app_id)
+        self._store_object(key, details)
+        return details
+
+    async def _afetch_app(
+        self, key: tuple, app_id: str, lang: Optional[str], country: Optional[str]
+    ) -> AppDetails:
+        params = {"id": app_id, "hl": lang, "gl": country}
+        if self._stream_html:
+            data_map = await self._requester.aget_script_data(
+                "/store/apps/details", _APP_DETAILS_KEYS, params=params
+            )
+            details = self._app_details_from(data_map, app_id)
+        else:
+            html = await self._requester.aget("/store/apps/details", params=params)
+            details = self._parse_app_details(html, app_id)
+        self._store_object(key, details)
+        return details
+
+    def apps_many(
+        self,
+        apps: Iterable[AppRequest],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Iterator[tuple[str, Union[AppDetails, Exception]]]:
+        """Fetch details for many apps on a bounded thread pool.
+
+        `apps` items are either app ids or `(app_id, lang, country)` tuples. Yields
+        `(app_id, AppDetails | exception)` in completion order, so a single failing
+        app (e.g. `AppNotFound`) does not abort the batch. Requests still go through
+        the shared session and the client throttle.
+        """
+        requests = (_normalize_app_request(app) for app in apps)
+        for (app_id, _, _), result in bounded_map(
+            lambda req: self.app(*req), requests, concurrency
+        ):
+            yield app_id, result
+
+    async def aapps_many(
+        self,
+        apps: Iterable[AppRequest],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[tuple[str, Union[AppDetails, Exception]]]:
+        """Async counterpart of `apps_many` sharing the client's `httpx.AsyncClient`."""
+        requests = (_normalize_app_request(app) for app in apps)
+        async for (app_id, _, _), result in abounded_map(
+            lambda req: self.aapp(*req), requests, concurrency
+        ):
+            yield app_id, result
+
+    def app_localized(
+        self,
+        app_id: str,
+        locales: Iterable[tuple[str, str]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> LocalizedAppDetails:
+        """Fetch one app in many `(lang, country)` storefronts concurrently.
+
+        Requests share the client's session and rate limiter. Locale-invariant
+        fields are kept once and every locale stores only what differs; a failing
+        locale is reported in `errors` instead of aborting the others.
+        """
+        if not app_id:
+            raise ValueError("app_id cannot be empty")
+        locales = list(dict.fromkeys(locales))
+        results = dict(bounded_map(lambda loc: self.app(app_id, *loc), locales, concurrency))
+        return _localize(app_id, locales, results)
+
+    async def aapp_localized(
+        self,
+        app_id: str,
+        locales: Iterable[tuple[str, str]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> LocalizedAppDetails:
+        if not app_id:
+            raise ValueError("app_id cannot be empty")
+        locales = list(dict.fromkeys(locales))
+        results = {
+            locale: result
+            async for locale, result in abounded_map(
+                lambda loc: self.aapp(app_id, *loc), locales, concurrency
+            )
+        }
+        return _localize(app_id, locales, results)
 
     def search(
         self,
@@ -443,12 +926,23 @@ class GooglePlayClient:
         price: str = "all",
         lang: str = None,
         country: str = None,
+        stop_when: Optional[SearchStopCallback] = None,
     ) -> List[AppOverview]:
-        price_map = {"free": 1, "paid": 2, "all": 0}
-        p_val = price_map.get(price, 0)
-        params = {"q": term, "price": p_val, "hl": lang, "gl": country}
-        html = self._requester.get("/work/search", params=params)
-        return self._search_with_pagination(html, num, lang, country)
+        """Search apps, following pagination until `num` results are collected.
+
+        `stop_when` is called with the results collected so far after every page;
+        returning True stops paging early.
+        """
+        p_val = _SEARCH_PRICES.get(price, 0)
+        # Results cut short by `stop_when` are not a reusable answer for the query.
+        key = None if stop_when else ("search", term, num, p_val, *self._resolve_locale(lang, country))
+        cached = self._cached_object(key) if key else None
+        if cached is not None:
+            return cached
+        results = self._fetch_search(term, num, p_val, lang, country, stop_when)
+        if key:
+            self._store_object(key, results)
+        return results
 
     async def asearch(
         self,
@@ -457,12 +951,93 @@ class GooglePlayClient:
         price: str = "all",
         lang: str = None,
         country: str = None,
+        stop_when: Optional[SearchStopCallback] = None,
     ) -> List[AppOverview]:
-        price_map = {"free": 1, "paid": 2, "all": 0}
-        p_val = price_map.get(price, 0)
+        p_val = _SEARCH_PRICES.get(price, 0)
+        # Results cut short by `stop_when` are not a reusable answer for the query.
+        key = None if stop_when else ("search", term, num, p_val, *self._resolve_locale(lang, country))
+        cached = self._cached_object(key) if key else None
+        if cached is not None:
+            return cached
+        results = await self._afetch_search(term, num, p_val, lang, country, stop_when)
+        if key:
+            self._store_object(key, results)
+        return results
+
+    def search_many(
+        self,
+        terms: Iterable[str],
+        num: int = 20,
+        price: str = "all",
+        lang: str = None,
+        country: str = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> SearchRankings:
+        """Run many search terms concurrently in one storefront.
+
+        Returns each term's ranked app ids plus one table of `AppOverview` models
+        shared by all terms, so an app returned by several terms is built and kept
+        once. A failing term is reported in `errors` instead of aborting the others.
+        """
+        terms = list(dict.fromkeys(terms))
+        p_val = _SEARCH_PRICES.get(price, 0)
+        collector = _SearchCollector(self._build_model)
+        results = dict(bounded_map(
+            lambda term: self._fetch_search(term, num, p_val, lang, country, extract=collector),
+            terms,
+            concurrency,
+        ))
+        return _rankings(terms, results, collector)
+
+    async def asearch_many(
+        self,
+        terms: Iterable[str],
+        num: int = 20,
+        price: str = "all",
+        lang: str = None,
+        country: str = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> SearchRankings:
+        terms = list(dict.fromkeys(terms))
+        p_val = _SEARCH_PRICES.get(price, 0)
+        collector = _SearchCollector(self._build_model)
+        results = {
+            term: result
+            async for term, result in abounded_map(
+                lambda term: self._afetch_search(term, num, p_val, lang, country, extract=collector),
+                terms,
+                concurrency,
+            )
+        }
+        return _rankings(terms, results, collector)
+
+    def _fetch_search(
+        self,
+        term: str,
+        num: int,
+        p_val: int,
+        lang: Optional[str],
+        country: Optional[str],
+        stop_when: Optional[SearchStopCallback] = None,
+        extract: Optional[SearchExtractor] = None,
+    ) -> List[Any]:
+        params = {"q": term, "price": p_val, "hl": lang, "gl": country}
+        html = self._requester.get("/work/search", params=params)
+        return self._search_with_pagination(html, num, lang, country, stop_when, extract)
+
+    async def _afetch_search(
+        self,
+        term: str,
+        num: int,
+        p_val: int,
+        lang: Optional[str],
+        country: Optional[str],
+        stop_when: Optional[SearchStopCallback] = None,
+        extract: Optional[SearchExtractor] = None,
+    ) -> List[Any]:
         params = {"q": term, "price": p_val, "hl": lang, "gl": country}
         html = await self._requester.aget("/work/search", params=params)
-        return await self._asearch_with_pagination(html, num, lang, country)
+        return await self._asearch_with_pagination(html, num, lang, country, stop_when, extract)
 
     def list(
         self,
@@ -483,7 +1058,9 @@ class GooglePlayClient:
             data=payload,
             headers={"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"},
         )
-        return self._parse_list_results(response_text)
+        return self._extract_list_results(
+            ScriptDataParser.parse_batchexecute_response(response_text)
+        )
 
     async def alist(
         self,
@@ -504,13 +1081,15 @@ class GooglePlayClient:
             data=payload,
             headers={"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"},
         )
-        return self._parse_list_results(response_text)
+        return self._extract_list_results(
+            ScriptDataParser.parse_batchexecute_response(response_text)
+        )
 
     def _build_list_params(
         self, age: Union[Age, str], lang: str, country: str
     ) -> Dict[str, Any]:
         params = {
-            "rpcids": "vyAe2",
+            "rpcids": LIST_RPC_ID,
             "source-path": "/store/apps",
             "f.sid": "-4178618388443751758",
             "bl": "boq_playuiserver_20220612.08_p0",
@@ -527,6 +1106,76 @@ class GooglePlayClient:
             params["age"] = age
         return params
 
+    def charts_snapshot(
+        self,
+        countries: Iterable[str],
+        categories: Optional[Iterable[Union[Category, str]]] = None,
+        collections: Optional[Iterable[Union[Collection, str]]] = None,
+        num: int = 50,
+        lang: str = None,
+        age: Union[Age, str] = None,
+        sink: Optional[ChartSink] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> ChartSink:
+        """Fetch every country x category x collection chart and feed them to `sink`.
+
+        `categories` and `collections` default to all known values. Charts of one
+        country are multiplexed `batch_size` at a time into single `batchexecute`
+        requests, which run `concurrency` at a time under the client's rate limiter.
+        Apps are passed to the sink as raw field dicts, never as models. Without a
+        `sink` the charts are collected into a columnar `ChartSnapshot`, which is
+        returned; a failing request is reported through `sink.fail` for its charts.
+        """
+        sink = ChartSnapshot() if sink is None else sink
+        chunks = _chart_chunks(countries, categories, collections, batch_size)
+        for charts, result in bounded_map(
+            lambda chunk: self._fetch_charts(chunk, num, lang, age), chunks, concurrency
+        ):
+            _write_charts(sink, charts, result)
+        return sink
+
+    async def acharts_snapshot(
+        self,
+        countries: Iterable[str],
+        categories: Optional[Iterable[Union[Category, str]]] = None,
+        collections: Optional[Iterable[Union[Collection, str]]] = None,
+        num: int = 50,
+        lang: str = None,
+        age: Union[Age, str] = None,
+        sink: Optional[ChartSink] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> ChartSink:
+        sink = ChartSnapshot() if sink is None else sink
+        chunks = _chart_chunks(countries, categories, collections, batch_size)
+        async for charts, result in abounded_map(
+            lambda chunk: self._afetch_charts(chunk, num, lang, age), chunks, concurrency
+        ):
+            _write_charts(sink, charts, result)
+        return sink
+
+    def _chart_batch(
+        self, charts: tuple[ChartKey, ...], num: int, lang: Optional[str], age: Union[Age, str, None]
+    ) -> RpcBatch:
+        batch = RpcBatch(self, max_size=len(charts))
+        for chart in charts:
+            batch._queue_list(
+                chart.collection, chart.category, age, num, lang, chart.country,
+                self._extract_list_entries,
+            )
+        return batch
+
+    def _fetch_charts(
+        self, charts: tuple[ChartKey, ...], num: int, lang: Optional[str], age: Union[Age, str, None]
+    ) -> List[Union[List[Dict[str, Any]], Exception]]:
+        return self._chart_batch(charts, num, lang, age).execute()
+
+    async def _afetch_charts(
+        self, charts: tuple[ChartKey, ...], num: int, lang: Optional[str], age: Union[Age, str, None]
+    ) -> List[Union[List[Dict[str, Any]], Exception]]:
+        return await self._chart_batch(charts, num, lang, age).aexecute()
+
     def reviews(
         self,
         app_id: str,
@@ -561,6 +1210,84 @@ class GooglePlayClient:
         )
         return self._parse_reviews(resp_text)
 
+    def iter_reviews(
+        self,
+        app_id: str,
+        lang: str = None,
+        country: str = None,
+        sort: Sort = Sort.NEWEST,
+        limit: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until_review_id: Optional[str] = None,
+        page_size: int = REVIEWS_PAGE_SIZE,
+    ) -> Iterator[Review]:
+        """Stream reviews page by page, following pagination tokens.
+
+        Stops after `limit` reviews, at the first review older than `since`
+        (requires `Sort.NEWEST`), or right before the review with id
+        `until_review_id`. Only one page is held in memory at a time.
+        """
+        since = self._check_review_stream_args(sort, since, page_size)
+        token = None
+        count = 0
+        while limit is None or count < limit:
+            num = page_size if limit is None else min(page_size, limit - count)
+            page, token = self.reviews(app_id, lang, country, sort, num, token)
+            for review in page:
+                if self._is_review_stream_end(review, since, until_review_id):
+                    return
+                yield review
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+            if not page or not token:
+                return
+
+    async def aiter_reviews(
+        self,
+        app_id: str,
+        lang: str = None,
+        country: str = None,
+        sort: Sort = Sort.NEWEST,
+        limit: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until_review_id: Optional[str] = None,
+        page_size: int = REVIEWS_PAGE_SIZE,
+    ) -> AsyncIterator[Review]:
+        since = self._check_review_stream_args(sort, since, page_size)
+        token = None
+        count = 0
+        while limit is None or count < limit:
+            num = page_size if limit is None else min(page_size, limit - count)
+            page, token = await self.areviews(app_id, lang, country, sort, num, token)
+            for review in page:
+                if self._is_review_stream_end(review, since, until_review_id):
+                    return
+                yield review
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+            if not page or not token:
+                return
+
+    @staticmethod
+    def _check_review_stream_args(
+        sort: Sort, since: Optional[datetime], page_size: int
+    ) -> Optional[datetime]:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if since is not None and sort != Sort.NEWEST:
+            raise ValueError("since= requires sort=Sort.NEWEST")
+        return _local_naive(since)
+
+    @staticmethod
+    def _is_review_stream_end(
+        review: Review, since: Optional[datetime], until_review_id: Optional[str]
+    ) -> bool:
+        if until_review_id is not None and review.id == until_review_id:
+            return True
+        return since is not None and review.date is not None and review.date < since
+
     def _build_reviews_request(
         self,
         app_id: str,
@@ -570,14 +1297,19 @@ class GooglePlayClient:
         num: int,
         pagination_token: str,
     ) -> tuple[Dict[str, str], Dict[str, str]]:
-        rpc_id = "UsvDTd"
-        req_json = json.dumps(
-            [None, None, [2, int(sort), [num, None, pagination_token], None, []], [app_id, 7]]
-        )
+        rpc_id, req_json = self._build_reviews_rpc(app_id, sort, num, pagination_token)
         form_data = {"f.req": json.dumps([[[rpc_id, req_json, None, "generic"]]])}
         params = {"rpcids": rpc_id, "hl": lang, "gl": country}
         return form_data, params
 
+    def _build_reviews_rpc(
+        self, app_id: str, sort: Sort, num: int, pagination_token: Optional[str]
+    ) -> tuple[str, str]:
+        req_json = json.dumps(
+            [None, None, [2, int(sort), [num, None, pagination_token], None, []], [app_id, 7]]
+        )
+        return REVIEWS_RPC_ID, req_json
+
     def suggest(self, term: str, lang: str = None, country: str = None) -> List[str]:
         if not term:
             raise ValueError("Term cannot be empty")
@@ -601,8 +1333,7 @@ class GooglePlayClient:
     def _build_suggest_request(
         self, term: str, lang: str, country: str
     ) -> tuple[Dict[str, str], Dict[str, str]]:
-        rpc_id = "IJ4APc"
-        inner_json = json.dumps([[None, [term], [10], [2], 4]])
+        rpc_id, inner_json = self._build_suggest_rpc(term)
         outer_json = json.dumps([[[rpc_id, inner_json, None, "generic"]]])
         form_data = {"f.req": outer_json}
         params = {
@@ -617,3 +1348,24 @@ class GooglePlayClient:
             "rt": "c",
         }
         return form_data, params
+
+    def _build_suggest_rpc(self, term: str) -> tuple[str, str]:
+        return SUGGEST_RPC_ID, json.dumps([[None, [term], [10], [2], 4]])
+
+    def _build_list_rpc(
+        self,
+        collection: Union[Collection, str],
+        category: Union[Category, str],
+        num: int,
+    ) -> tuple[str, str]:
+        # The list payload only exists as a pre-encoded form body, so pull the
+        # RPC entry back out of it for multiplexed requests.
+        payload = LIST_PAYLOAD_TEMPLATE.format(
+            num=num, collection=collection, category=category
+        )
+        entry = json.loads(parse_qs(payload)["f.req"][0])[0][0]
+        return entry[0], entry[1]
+
+    def batch(self, max_size: int = DEFAULT_BATCH_SIZE) -> RpcBatch:
+        """Start a batch that multiplexes queued RPC calls into few `batchexecute` POSTs."""
+        return RpcBatch(self, max_size=max_size)
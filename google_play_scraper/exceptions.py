@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class GooglePlayError(Exception):
     """Base exception for the library."""
     pass
@@ -10,9 +13,26 @@ class AppNotFound(GooglePlayError):
 
 class QuotaExceeded(GooglePlayError):
     """Raised when Google blocks the request (429/503)."""
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds to wait before retrying, from the `Retry-After` header if sent.
+        self.retry_after = retry_after
+
+
+class NetworkError(GooglePlayError):
+    """Raised when the request fails before a response arrives (DNS, connect, timeout)."""
     pass
 
 
+class ServerError(GooglePlayError):
+    """Raised on 5xx responses other than 503."""
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class ParsingError(GooglePlayError):
     """Raised when the scraper fails to parse the Google Play response."""
     pass
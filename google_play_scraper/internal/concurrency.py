@@ -0,0 +1,178 @@
+import asyncio
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Requests in flight at once for the bulk helpers built on `bounded_map`/`abounded_map`.
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+def _check_limit(limit: int) -> None:
+    if limit < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def bounded_map(
+        func: Callable[[T], R],
+        items: Iterable[T],
+        limit: int,
+) -> Iterator[tuple[T, Union[R, Exception]]]:
+    """
+    Runs `func` over `items` on a thread pool with at most `limit` calls in flight.
+
+    Yields `(item, result)` pairs in completion order. Exceptions raised by `func`
+    are yielded in place of the result so one failure does not abort the batch.
+    Items are pulled lazily, so `items` may be a large generator.
+    """
+    _check_limit(limit)
+    iterator = iter(items)
+    pending: dict[Future, T] = {}
+
+    with ThreadPoolExecutor(max_workers=limit) as executor:
+        def _fill() -> None:
+            while len(pending) < limit:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                pending[executor.submit(func, item)] = item
+
+        try:
+            _fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    error = future.exception()
+                    yield item, (error if error is not None else future.result())
+                _fill()
+        finally:
+            # Generator closed early: drop whatever has not started yet.
+            for future in pending:
+                future.cancel()
+
+
+async def abounded_map(
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        limit: int,
+) -> AsyncIterator[tuple[T, Union[R, Exception]]]:
+    """Async counterpart of `bounded_map` running coroutines as event loop tasks."""
+    _check_limit(limit)
+    iterator = iter(items)
+    pending: dict[asyncio.Task, T] = {}
+
+    def _fill() -> None:
+        while len(pending) < limit:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            pending[asyncio.ensure_future(func(item))] = item
+
+    try:
+        _fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                error: Any = task.exception()
+                yield item, (error if error is not None else task.result())
+            _fill()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls sharing a key into one execution.
+
+    The first caller for a key runs the work; callers arriving while it is in
+    flight wait for and receive the same result (or exception). Nothing is kept
+    once the call finishes, so this is deduplication, not caching. Threads use
+    `do`, coroutines `ado`; the two never share calls. An `ado` call is cancelled
+    once every coroutine waiting on it has been cancelled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    async def ado(self, key: Hashable, func: Callable[[], Awaitable[R]]) -> R:
+        # Tasks belong to one event loop, so loops never join each other's calls.
+        key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(func())
+                self._waiters[key] = 0
+                task.add_done_callback(lambda done: self._discard_task(key, done))
+            self._waiters[key] += 1
+        try:
+            # Shield the shared task: one caller being cancelled must not cancel it
+            # for everyone else waiting on it.
+            return await asyncio.shield(task)
+        finally:
+            self._leave(key, task)
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def _leave(self, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(key) is not task:
+                return
+            self._waiters[key] -= 1
+            if self._waiters[key] or task.done():
+                return
+            # Nobody is waiting any more: stop the work and let the next caller
+            # start a fresh call instead of joining the cancelled one.
+            del self._tasks[key]
+            del self._waiters[key]
+        task.cancel()
+
+    def _discard_task(self, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+                del self._waiters[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every waiter was cancelled.
+            task.exception()
@@ -59,3 +59,93 @@ class ElementSpec:
 def extract_from_spec(source: Any, specs: dict[str, ElementSpec]) -> dict[str, Any]:
     """Applies a dictionary of ElementSpecs to a source object."""
     return {key: spec.extract(source) for key, spec in specs.items()}
+
+
+class _PlanNode:
+    __slots__ = ("terminals", "int_children", "str_children")
+
+    def __init__(self):
+        # (result key, transformer) pairs whose path ends at this node.
+        self.terminals: list[tuple[str, Optional[Callable[[Any], Any]]]] = []
+        self.int_children: list[tuple[int, "_PlanNode"]] = []
+        self.str_children: list[tuple[str, "_PlanNode"]] = []
+
+    def child(self, segment: Any) -> Optional["_PlanNode"]:
+        if isinstance(segment, int):
+            children = self.int_children
+        elif isinstance(segment, str):
+            children = self.str_children
+        else:
+            # Matches `ElementSpec._lookup`: unknown segment types never resolve.
+            return None
+
+        for existing, node in children:
+            if existing == segment:
+                return node
+        node = _PlanNode()
+        children.append((segment, node))
+        return node
+
+
+class ExtractionPlan:
+    """
+    A set of ElementSpecs compiled once into a trie of path segments.
+
+    Specs that share a path prefix (e.g. everything under `[57, 0, 0, 0, 0, 1, 0]`)
+    walk it once per record, and segment types are resolved at compile time instead
+    of on every lookup. `extract` returns the same dictionary as `extract_from_spec`.
+    """
+
+    def __init__(self, specs: dict[str, ElementSpec]):
+        self.specs = dict(specs)
+        self._keys = tuple(specs)
+        self._root = _PlanNode()
+        self._fallbacks: list[tuple[str, ElementSpec]] = []
+
+        for key, spec in specs.items():
+            node: Optional[_PlanNode] = self._root
+            for segment in spec.path:
+                node = node.child(segment)
+                if node is None:
+                    break
+            if node is not None:
+                node.terminals.append((key, spec.transformer))
+            if spec.fallback_path:
+                self._fallbacks.append((key, spec))
+
+    def extract(self, source: Any) -> dict[str, Any]:
+        result = dict.fromkeys(self._keys)
+        if source is not None:
+            self._walk(self._root, source, result)
+
+        for key, spec in self._fallbacks:
+            # Fallbacks only apply when the primary path is missing, not when its
+            # transformer produced None; these specs are rare, so re-check directly.
+            if result[key] is None and spec._lookup(source, spec.path) is None:
+                result[key] = spec.extract(source)
+        return result
+
+    @classmethod
+    def _walk(cls, node: _PlanNode, current: Any, result: dict[str, Any]) -> None:
+        for key, transformer in node.terminals:
+            if transformer is None:
+                result[key] = current
+            else:
+                try:
+                    result[key] = transformer(current)
+                except Exception:
+                    result[key] = None
+
+        if node.int_children and isinstance(current, list):
+            size = len(current)
+            for index, child in node.int_children:
+                if -size <= index < size:
+                    value = current[index]
+                    if value is not None:
+                        cls._walk(child, value, result)
+
+        if node.str_children and isinstance(current, dict):
+            for name, child in node.str_children:
+                value = current.get(name)
+                if value is not None:
+                    cls._walk(child, value, result)
@@ -0,0 +1,69 @@
+"""
+JSON decoding backend for the parsers.
+
+The fastest installed decoder is picked at import time: `orjson`, then
+`msgspec`, then the standard library. Set `GOOGLE_PLAY_SCRAPER_JSON` to one of
+`BACKENDS` to force a choice, or call `use` at runtime. Callers must go through
+the module (`jsonlib.loads(...)`) so a switch takes effect everywhere.
+
+The fast decoders are stricter than the standard library: orjson rejects lone
+surrogate escapes such as `"\\ud83d"`, which appear in user-written text. A
+document they reject is decoded again with `json.loads` before `DecodeError`
+reaches the caller. orjson also reads integers wider than 64 bits as floats;
+Play payloads carry none, but select `stdlib` if exact big integers matter.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+# Every backend signals an invalid document with a `ValueError` subclass
+# (`json.JSONDecodeError`, `orjson.JSONDecodeError`, `msgspec.DecodeError`).
+DecodeError = ValueError
+
+loads: Callable[[Union[str, bytes]], Any] = json.loads
+backend = "stdlib"
+
+
+def _with_fallback(decode: Callable[[Union[str, bytes]], Any]) -> Callable[[Union[str, bytes]], Any]:
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return decode(data)
+        except DecodeError:
+            return json.loads(data)
+
+    return loads
+
+
+def _load_backend(name: str) -> Optional[Callable[[Union[str, bytes]], Any]]:
+    if name == "stdlib":
+        return json.loads
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            return None
+        return _with_fallback(orjson.loads)
+    if name == "msgspec":
+        try:
+            import msgspec
+        except ImportError:
+            return None
+        return _with_fallback(msgspec.json.decode)
+    raise ValueError(f"Unknown JSON backend {name!r}; expected one of {', '.join(BACKENDS)}")
+
+
+def use(name: Optional[str] = None) -> str:
+    """Switch to backend `name`, or to the fastest installed one; returns its name."""
+    global loads, backend
+    for candidate in BACKENDS if name is None else (name,):
+        decode = _load_backend(candidate)
+        if decode is not None:
+            loads, backend = decode, candidate
+            return candidate
+    raise ImportError(f"JSON backend {name!r} is not installed")
+
+
+use(os.environ.get("GOOGLE_PLAY_SCRAPER_JSON") or None)
@@ -1,92 +1,153 @@
-import json
+import codecs
 import re
-from typing import Any
+import sys
+from typing import Any, Iterable, Iterator, Optional, Union
 
+from google_play_scraper.internal import jsonlib
 
-class ScriptDataParser:
-    # Regex to find the <script> block
-    _SCRIPT_REGEX = re.compile(r">AF_initDataCallback[\s\S]*?</script")
-    # Regex to extract the 'ds:X' key
-    _KEY_REGEX = re.compile(r"(ds:.*?)'")
-    # Regex to extract the JSON data value
-    _VALUE_REGEX = re.compile(r"data:([\s\S]*?), sideChannel: {}}\);</")
 
-    # For Service Requests (RPC responses)
-    _SERVICE_REGEX = re.compile(r"; var AF_dataServiceRequests[\s\S]*?; var AF_initDataChunkQueue")
-    _SERVICE_VALUE_REGEX = re.compile(r"{'ds:[\s\S]*}}")
+class ScriptDataParser:
+    # Markers delimiting an `AF_initDataCallback({key: 'ds:X', data: ..., sideChannel: {}});`
+    # script block. Blocks are located with `str.find`, which is much cheaper than
+    # lazy regexes on ~1 MB pages.
+    _CALLBACK_MARKER = ">AF_initDataCallback"
+    _SCRIPT_END = "</script"
+    _KEY_MARKER = "ds:"
+    _KEY_END = "'"
+    _VALUE_MARKER = "data:"
+    _VALUE_END = ", sideChannel: {}});</"
 
     @classmethod
-    def parse(cls, html_response: str) -> dict[str, list | dict]:
+    def parse(
+            cls,
+            html_response: str,
+            keys: Optional[Iterable[str]] = None,
+    ) -> dict[str, list | dict]:
         """
         Parses the HTML response and returns a dictionary where keys are 'ds:x'
         and values are the parsed JSON arrays.
+
+        When `keys` is given, only those blocks are JSON-decoded and scanning stops
+        as soon as all of them have been found.
         """
+        wanted = None if keys is None else set(keys)
         data_map = {}
 
-        # 1. Parse standard AF_initDataCallback
-        matches = cls._SCRIPT_REGEX.findall(html_response)
-        for match in matches:
-            key_m = cls._KEY_REGEX.search(match)
-            val_m = cls._VALUE_REGEX.search(match)
+        pos = 0
+        while True:
+            block_start = html_response.find(cls._CALLBACK_MARKER, pos)
+            if block_start < 0:
+                break
+            block_end = html_response.find(cls._SCRIPT_END, block_start)
+            if block_end < 0:
+                break
+            block_end += len(cls._SCRIPT_END)
+            pos = block_end
 
-            if key_m and val_m:
-                key = key_m.group(1)
-                try:
-                    data = json.loads(val_m.group(1))
-                    data_map[key] = data
-                except json.JSONDecodeError:
-                    continue
-
-        # 2. Parse service requests (found in some dynamic pages)
-        service_match = cls._SERVICE_REGEX.search(html_response)
-        if service_match:
-            val_m = cls._SERVICE_VALUE_REGEX.search(service_match.group(0))
-            if val_m:
-                # The service request data is often raw JS object syntax, not valid JSON
-                # (e.g. single quotes). However, Google usually sends valid JSON structure
-                # inside the value regex. If it fails, we skip.
-                # In the Node lib, they use `eval`. In Python, we must be careful.
-                # Usually, this is handled by batchexecute response parsing separately.
-                pass
+            if cls._decode_block(html_response, block_start, block_end, wanted, data_map):
+                if wanted is not None and wanted.issubset(data_map):
+                    break
 
         return data_map
 
+    @classmethod
+    def _decode_block(
+            cls,
+            text: str,
+            block_start: int,
+            block_end: int,
+            wanted: Optional[set],
+            data_map: dict,
+    ) -> bool:
+        """Decodes one script block into `data_map`; returns whether it was stored."""
+        key = cls._find_key(text, block_start, block_end)
+        if key is None or (wanted is not None and key not in wanted):
+            return False
+
+        value_start = text.find(cls._VALUE_MARKER, block_start, block_end)
+        if value_start < 0:
+            return False
+        value_start += len(cls._VALUE_MARKER)
+        value_end = text.find(cls._VALUE_END, value_start, block_end)
+        if value_end < 0:
+            return False
+
+        try:
+            data_map[key] = jsonlib.loads(text[value_start:value_end])
+        except jsonlib.DecodeError:
+            return False
+        return True
+
+    @classmethod
+    def _find_key(cls, html_response: str, block_start: int, block_end: int) -> Optional[str]:
+        key_start = html_response.find(cls._KEY_MARKER, block_start, block_end)
+        if key_start < 0:
+            return None
+        key_end = html_response.find(cls._KEY_END, key_start, block_end)
+        if key_end < 0:
+            return None
+        key = html_response[key_start:key_end]
+        return None if "\n" in key else key
+
     @staticmethod
     def parse_batchexecute_response(response_text: str) -> list[Any]:
         """
         Parses the batchexecute RPC response.
         Handles both clean JSON and chunked/streamed formats (prefixed with lengths).
+        Returns the payload of the first `wrb.fr` envelope.
         """
-        if response_text.startswith(")]}'"):
-            response_text = response_text[4:].strip()
+        for envelope in ScriptDataParser._iter_envelopes(response_text):
+            return ScriptDataParser._extract_inner_data([envelope])
+        return []
 
-        # Strategy 1: Try parsing the whole text as JSON
-        try:
-            return ScriptDataParser._extract_inner_data(json.loads(response_text))
-        except json.JSONDecodeError:
-            pass
+    @staticmethod
+    def parse_batchexecute_envelopes(response_text: str) -> list[list]:
+        """
+        Returns every `wrb.fr` envelope of a batchexecute response, in order.
 
-        # Strategy 2: Handle chunked format (Length \n JSON \n Length \n JSON)
-        # We look for the chunk containing the standard envelope [["wrb.fr", ...]]
-        lines = response_text.splitlines()
-        for line in lines:
+        A multiplexed request gets one envelope per RPC entry, either all in one
+        JSON document or spread over several chunks of an `rt=c` response.
+        """
+        return list(ScriptDataParser._iter_envelopes(response_text))
+
+    @staticmethod
+    def _iter_envelopes(response_text: str) -> Iterator[list]:
+        decoder = BatchexecuteDecoder()
+        for data in decoder.feed(response_text) + decoder.close():
+            if not isinstance(data, list):
+                continue
+            for entry in data:
+                if isinstance(entry, list) and entry and entry[0] == "wrb.fr":
+                    yield entry
+
+    @staticmethod
+    def demultiplex_batchexecute_response(response_text: str) -> dict[str, list[Any]]:
+        """
+        Maps the request identifier of every `wrb.fr` envelope to its decoded payload.
+
+        The identifier is the fourth element of the request entry
+        (`[rpc_id, req_json, None, identifier]`), echoed back at index 6 of the
+        envelope. Envelopes without one are keyed by their RPC id.
+        """
+        result = {}
+        for envelope in ScriptDataParser.parse_batchexecute_envelopes(response_text):
+            identifier = envelope[6] if len(envelope) > 6 and envelope[6] else envelope[1]
+            result[str(identifier)] = ScriptDataParser._extract_inner_data([envelope])
+        return result
+
+    @staticmethod
+    def _iter_chunks(response_text: str):
+        """Yields the JSON documents of a chunked response, skipping length lines."""
+        for line in response_text.splitlines():
             line = line.strip()
             # Fast check: valid envelopes usually start with [[
             if not line.startswith("[["):
                 continue
-
             try:
-                data = json.loads(line)
-                # Verify it is the correct envelope type
-                if isinstance(data, list) and len(data) > 0 and isinstance(data[0], list):
-                    # Check for "wrb.fr" marker which indicates the payload container
-                    if len(data[0]) > 0 and data[0][0] == "wrb.fr":
-                        return ScriptDataParser._extract_inner_data(data)
-            except json.JSONDecodeError:
+                yield jsonlib.loads(line)
+            except jsonlib.DecodeError:
                 continue
 
-        return []
-
     @staticmethod
     def _extract_inner_data(outer_json: list) -> list[Any]:
         """Helper to extract the stringified JSON inside the RPC envelope."""
@@ -94,7 +155,231 @@ class ScriptDataParser:
             # Standard format: [["wrb.fr", "RPC_ID", "INNER_JSON_STRING", ...]]
             inner_data_str = outer_json[0][2]
             if inner_data_str:
-                return json.loads(inner_data_str)
-        except (IndexError, TypeError, json.JSONDecodeError):
+                return jsonlib.loads(inner_data_str)
+        except (IndexError, TypeError, jsonlib.DecodeError):
             pass
         return []
+
+
+class ScriptDataScanner:
+    """
+    Incremental counterpart of `ScriptDataParser.parse` for streamed pages.
+
+    Text chunks are passed to `feed` as they arrive. Only the unfinished script
+    block (or the tail that could start one) is kept between calls, so the whole
+    page is never held in memory, and each character is scanned a bounded number
+    of times. `feed` returns True once every wanted key has been decoded; the
+    rest of the page can then be left unread.
+    """
+
+    _MARKER_OVERLAP = len(ScriptDataParser._CALLBACK_MARKER) - 1
+    _END_OVERLAP = len(ScriptDataParser._SCRIPT_END) - 1
+
+    def __init__(self, keys: Iterable[str]):
+        self._wanted = set(keys)
+        if not self._wanted:
+            raise ValueError("At least one key is required")
+        # Chunks of a block whose end has not arrived yet, joined once it does.
+        self._block: list[str] = []
+        self._block_tail = ""
+        self._carry = ""
+        self.data_map: dict[str, list | dict] = {}
+
+    @property
+    def done(self) -> bool:
+        return self._wanted.issubset(self.data_map)
+
+    def feed(self, chunk: str) -> bool:
+        if self.done:
+            return True
+        if self._block:
+            window = self._block_tail + chunk
+            if window.find(ScriptDataParser._SCRIPT_END) < 0:
+                self._block.append(chunk)
+                self._block_tail = window[-self._END_OVERLAP:]
+                return False
+            text = "".join(self._block) + chunk
+            self._block = []
+        else:
+            text = self._carry + chunk
+        return self._scan(text)
+
+    def _scan(self, text: str) -> bool:
+        pos = 0
+        while True:
+            block_start = text.find(ScriptDataParser._CALLBACK_MARKER, pos)
+            if block_start < 0:
+                # Keep just enough of the tail to recognise a marker split across chunks.
+                self._carry = text[max(pos, len(text) - self._MARKER_OVERLAP):]
+                return False
+            block_end = text.find(ScriptDataParser._SCRIPT_END, block_start)
+            if block_end < 0:
+                block = text[block_start:]
+                self._block, self._block_tail, self._carry = [block], block[-self._END_OVERLAP:], ""
+                return False
+            block_end += len(ScriptDataParser._SCRIPT_END)
+            pos = block_end
+
+            ScriptDataParser._decode_block(text, block_start, block_end, self._wanted, self.data_map)
+            if self.done:
+                self._carry = ""
+                return True
+
+
+# Characters outside the BMP take two UTF-16 code units in frame lengths.
+_ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+_FRAME_HEADER = re.compile(r"\s*(\d+)[ \t\r]*\n")
+_WHITESPACE = re.compile(r"\s*")
+_XSSI_PREFIX = ")]}'"
+# `_need` while buffering input that can only be decoded once it is complete.
+_UNTIL_CLOSE = sys.maxsize
+
+
+def _frame_body(text: str, start: int, units: int, final: bool) -> Optional[tuple[str, int]]:
+    """
+    The `units` UTF-16 code units of `text` from `start` and the index they end at.
+
+    Returns None while the frame may still be incomplete.
+    """
+    end = start + units
+    if end <= len(text):
+        body = text[start:end]
+        # Without astral characters every code unit is one character.
+        if body.isascii() or len(body.encode("utf-16-le")) == 2 * len(body):
+            return body, end
+    elif not final:
+        # Astral characters make a frame shorter than `units` characters, so it
+        # may already be complete; waiting for the full count only costs latency.
+        return None
+    end = _unit_offset(text, start, units)
+    return None if end is None else (text[start:end], end)
+
+
+def _unit_offset(text: str, start: int, units: int) -> Optional[int]:
+    """Index `units` UTF-16 code units after `start`, or None if `text` ends first."""
+    pos, remaining = start, units
+    for match in _ASTRAL.finditer(text, start):
+        span = match.start() - pos
+        if span >= remaining:
+            return pos + remaining
+        remaining -= span
+        # A length ending inside a surrogate pair still includes the character.
+        pos, remaining = match.start() + 1, max(remaining - 2, 0)
+        if not remaining:
+            return pos
+    end = pos + remaining
+    return end if end <= len(text) else None
+
+
+class BatchexecuteDecoder:
+    """
+    Incremental decoder for batchexecute responses.
+
+    Chunked (`rt=c`) responses are a sequence of frames, each a decimal length
+    in UTF-16 code units followed by a JSON document. Frames are sliced straight
+    out of the buffered text by their length and decoded as soon as they are
+    complete, so a response is parsed in one linear pass. Unframed responses are
+    decoded as one JSON document on `close`, and text that does not follow the
+    framing falls back to the line-based scan.
+
+    `feed` accepts decoded text or raw UTF-8 bytes (e.g. `httpx` stream chunks)
+    and returns the documents completed by that chunk; `close` returns the rest.
+    """
+
+    def __init__(self):
+        self._text = ""
+        # Input received while waiting for `_need` characters; joined once there.
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self._need = 0
+        self._mode: Optional[str] = None
+        self._bytes = None
+
+    def feed(self, data: Union[str, bytes]) -> list[Any]:
+        if isinstance(data, bytes):
+            if self._bytes is None:
+                self._bytes = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            data = self._bytes.decode(data)
+        self._pending.append(data)
+        self._pending_len += len(data)
+        if len(self._text) + self._pending_len < self._need:
+            return []
+        return self._decode(final=False)
+
+    def close(self) -> list[Any]:
+        if self._bytes is not None:
+            self._pending.append(self._bytes.decode(b"", final=True))
+        return self._decode(final=True)
+
+    def _decode(self, final: bool) -> list[Any]:
+        text = self._text + "".join(self._pending)
+        self._pending, self._pending_len = [], 0
+        documents: list[Any] = []
+        pos = 0
+
+        if self._mode is None:
+            pos = _WHITESPACE.match(text).end()
+            if text.startswith(_XSSI_PREFIX, pos):
+                pos = _WHITESPACE.match(text, pos + len(_XSSI_PREFIX)).end()
+            elif not final and len(text) - pos < len(_XSSI_PREFIX) and _XSSI_PREFIX.startswith(text[pos:]):
+                # Possibly a prefix cut short by the chunk boundary.
+                return self._wait(text, pos, 0)
+            if pos >= len(text):
+                return self._wait(text, pos, 0) if not final else documents
+            self._mode = "frames" if text[pos].isdigit() else "document"
+
+        if self._mode == "frames":
+            pos = self._decode_frames(text, pos, final, documents)
+            if self._mode == "frames":
+                return documents
+
+        if not final:
+            return documents + self._wait(text, pos, _UNTIL_CLOSE)
+        self._text = ""
+        if self._mode == "document":
+            try:
+                return documents + [jsonlib.loads(text[pos:])]
+            except jsonlib.DecodeError:
+                pass
+        return documents + list(ScriptDataParser._iter_chunks(text[pos:]))
+
+    def _decode_frames(self, text: str, pos: int, final: bool, documents: list[Any]) -> int:
+        """Decodes complete frames into `documents`; returns where decoding stopped."""
+        while True:
+            header = _FRAME_HEADER.match(text, pos)
+            if header is None:
+                if _WHITESPACE.match(text, pos).end() == len(text):
+                    pos = len(text)
+                elif final or not text[pos:].strip().isdigit():
+                    self._mode = "lines"
+                    return pos
+                self._wait(text, pos, 0 if final else len(text) - pos + 1)
+                return pos
+
+            units = int(header.group(1))
+            # Lengths count from the line break after the digits; some producers
+            # count from after it instead, so that is tried when the first fails.
+            for start in (header.end() - 1, header.end()):
+                frame = _frame_body(text, start, units, final)
+                if frame is None:
+                    if final:
+                        self._mode = "lines"
+                        return pos
+                    self._wait(text, pos, start - pos + units)
+                    return pos
+                body, end = frame
+                if not body or body.isspace():
+                    break
+                try:
+                    documents.append(jsonlib.loads(body))
+                    break
+                except jsonlib.DecodeError:
+                    continue
+            else:
+                self._mode = "lines"
+                return pos
+            pos = end
+
+    def _wait(self, text: str, pos: int, need: int) -> list[Any]:
+        self._text, self._need = text[pos:], need
+        return []
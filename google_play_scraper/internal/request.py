@@ -1,10 +1,31 @@
 import asyncio
+import threading
 import time
-from typing import Optional, Any, Dict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Optional, Any, Awaitable, Callable, Dict, Iterable, Iterator, Mapping, TypeVar
 
 import httpx
 
-from google_play_scraper.exceptions import GooglePlayError, AppNotFound, QuotaExceeded
+from google_play_scraper.cache import DEFAULT_TTLS, ResponseCache, make_key, resolve_ttl
+from google_play_scraper.exceptions import (
+    GooglePlayError,
+    AppNotFound,
+    QuotaExceeded,
+    NetworkError,
+    ServerError,
+)
+from google_play_scraper.internal.concurrency import SingleFlight
+from google_play_scraper.internal.parser import ScriptDataScanner
+from google_play_scraper.ratelimit import AdaptiveRateLimiter, TokenBucket
+from google_play_scraper.retry import RequestMetrics, RetryPolicy
+
+T = TypeVar("T")
+
+# Requesters whose cache reads are skipped in the current context. One module-level
+# variable serves every instance, since context variables are never released.
+_BYPASS_CACHE: ContextVar[frozenset] = ContextVar("bypass_cache", default=frozenset())
 
 
 class Requester:
@@ -12,17 +33,47 @@ class Requester:
 
     def __init__(
             self,
-            session: httpx.Client,
-            throttle: Optional[int],
+            session: Optional[httpx.Client],
+            throttle: Optional[float],
             default_lang: str,
             default_country: str,
             async_session: Optional[httpx.AsyncClient] = None,
+            cache: Optional[ResponseCache] = None,
+            cache_ttls: Optional[Mapping[str, float]] = None,
+            coalesce: bool = True,
+            rate_limiter: Optional[TokenBucket] = None,
+            adaptive_throttle: bool = False,
+            retry_policy: Optional[RetryPolicy] = None,
+            session_factory: Optional[Callable[[], httpx.Client]] = None,
+            async_session_factory: Optional[Callable[[], httpx.AsyncClient]] = None,
     ):
+        # Sessions passed in are used as-is; otherwise they are built by the factories
+        # on first use, and only those are closed by `close`/`aclose`.
         self._session = session
         self._async_session = async_session
-        self._throttle_delay = 1.0 / throttle if throttle else 0
-        self._last_request_time = 0.0
-        self._last_async_request_time = 0.0
+        self._session_factory = session_factory
+        self._async_session_factory = async_session_factory
+        self._created_sessions: list = []
+        self._session_lock = threading.Lock()
+        self._cache = cache
+        self._cache_ttls = {**DEFAULT_TTLS, **(cache_ttls or {})}
+        # Identical requests in flight at the same time share one round trip.
+        self._coalesce = coalesce
+        self._flights = SingleFlight()
+        # One bucket paces both `request` and `arequest`; pass `rate_limiter` to share
+        # it between clients (or processes, with a `FileLockBackend`).
+        if adaptive_throttle and rate_limiter is not None:
+            raise ValueError(
+                "adaptive_throttle cannot be combined with rate_limiter; "
+                "pass an AdaptiveRateLimiter as rate_limiter instead"
+            )
+        if adaptive_throttle and not throttle:
+            raise ValueError("adaptive_throttle requires a throttle rate to start from")
+        if rate_limiter is None and throttle:
+            rate_limiter = AdaptiveRateLimiter(throttle) if adaptive_throttle else TokenBucket(throttle)
+        self._limiter = rate_limiter
+        self._retry = retry_policy
+        self.metrics = RequestMetrics()
         self._lang = default_lang
         self._country = default_country
         self._headers = {
@@ -47,20 +98,95 @@ class Requester:
 
         return merged
 
+    @contextmanager
+    def bypass_cache(self) -> Iterator[None]:
+        """Skip cache reads inside the block; fresh responses still refresh the cache."""
+        token = _BYPASS_CACHE.set(_BYPASS_CACHE.get() | {self})
+        try:
+            yield
+        finally:
+            _BYPASS_CACHE.reset(token)
+
+    def _get_session(self) -> httpx.Client:
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    if self._session_factory is None:
+                        raise GooglePlayError("Sync session is not configured for this Requester")
+                    self._session = self._session_factory()
+                    self._created_sessions.append(self._session)
+        return self._session
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        if self._async_session is None:
+            with self._session_lock:
+                if self._async_session is None:
+                    if self._async_session_factory is None:
+                        raise GooglePlayError("Async session is not configured for this Requester")
+                    self._async_session = self._async_session_factory()
+                    self._created_sessions.append(self._async_session)
+        return self._async_session
+
+    def close(self) -> None:
+        """Close the sync session if this requester created it."""
+        with self._session_lock:
+            if self._session is not None and self._session in self._created_sessions:
+                self._created_sessions.remove(self._session)
+                self._session.close()
+                self._session = None
+
+    async def aclose(self) -> None:
+        """Close every session this requester created."""
+        self.close()
+        with self._session_lock:
+            session = self._async_session
+            if session is None or session not in self._created_sessions:
+                return
+            self._created_sessions.remove(session)
+            self._async_session = None
+        await session.aclose()
+
+    @property
+    def bypassing_cache(self) -> bool:
+        return self in _BYPASS_CACHE.get()
+
+    def _cache_lookup(
+            self, method: str, path: str, params: Dict[str, Any], data: Any
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Returns `(key, cached_text)`; the key is None when the response is not cacheable."""
+        if self._cache is None or resolve_ttl(path, params, self._cache_ttls) <= 0:
+            return None, None
+        key = make_key(method, path, params, data)
+        if self.bypassing_cache:
+            return key, None
+        return key, self._cache.get(key)
+
+    def _cache_store(self, key: Optional[str], path: str, params: Dict[str, Any], text: str) -> None:
+        if key is not None:
+            self._cache.set(key, text, resolve_ttl(path, params, self._cache_ttls))
+
+    @property
+    def effective_rate(self) -> Optional[float]:
+        """Current requests/second allowed by the limiter, None when unthrottled."""
+        return self._limiter.rate if self._limiter is not None else None
+
+    def _quota_exceeded(self, response: httpx.Response) -> QuotaExceeded:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if self._limiter is not None:
+            self._limiter.record_throttled(retry_after)
+        return QuotaExceeded("Too many requests or server unavailable.", retry_after=retry_after)
+
+    def _record_success(self) -> None:
+        if self._limiter is not None:
+            self._limiter.record_success()
+
     def _wait_for_throttle(self):
-        if self._throttle_delay > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self._throttle_delay:
-                time.sleep(self._throttle_delay - elapsed)
-        self._last_request_time = time.time()
+        if self._limiter is not None:
+            self._limiter.acquire()
 
     async def _await_for_throttle(self):
-        if self._throttle_delay > 0:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self._last_async_request_time
-            if elapsed < self._throttle_delay:
-                await asyncio.sleep(self._throttle_delay - elapsed)
-        self._last_async_request_time = asyncio.get_event_loop().time()
+        if self._limiter is not None:
+            await self._limiter.aacquire()
 
     def request(
             self,
@@ -69,6 +195,118 @@ class Requester:
             params: Dict[str, Any] = None,
             data: Any = None,
             headers: Optional[Dict[str, str]] = None
+    ) -> str:
+        params = self._merge_locale_params(params)
+        cache_key, cached = self._cache_lookup(method, path, params, data)
+        if cached is not None:
+            return cached
+
+        if not self._coalesce:
+            return self._send(method, path, params, data, headers, cache_key)
+        return self._flights.do(
+            self._flight_key(method, path, params, data, headers, cache_key),
+            lambda: self._send(method, path, params, data, headers, cache_key),
+        )
+
+    async def arequest(
+            self,
+            method: str,
+            path: str,
+            params: Dict[str, Any] = None,
+            data: Any = None,
+            headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        if self._async_session is None and self._async_session_factory is None:
+            raise GooglePlayError("Async session is not configured for this Requester")
+
+        params = self._merge_locale_params(params)
+        cache_key, cached = self._cache_lookup(method, path, params, data)
+        if cached is not None:
+            return cached
+
+        if not self._coalesce:
+            return await self._asend(method, path, params, data, headers, cache_key)
+        return await self._flights.ado(
+            self._flight_key(method, path, params, data, headers, cache_key),
+            lambda: self._asend(method, path, params, data, headers, cache_key),
+        )
+
+    @staticmethod
+    def _flight_key(
+            method: str,
+            path: str,
+            params: Dict[str, Any],
+            data: Any,
+            headers: Optional[Dict[str, str]],
+            cache_key: Optional[str],
+    ) -> tuple:
+        key = cache_key or make_key(method, path, params, data)
+        return key, tuple(sorted(headers.items())) if headers else None
+
+    def _send(
+            self,
+            method: str,
+            path: str,
+            params: Dict[str, Any],
+            data: Any,
+            headers: Optional[Dict[str, str]],
+            cache_key: Optional[str],
+    ) -> str:
+        return self._retrying(
+            lambda: self._send_once(method, path, params, data, headers, cache_key)
+        )
+
+    async def _asend(
+            self,
+            method: str,
+            path: str,
+            params: Dict[str, Any],
+            data: Any,
+            headers: Optional[Dict[str, str]],
+            cache_key: Optional[str],
+    ) -> str:
+        return await self._aretrying(
+            lambda: self._asend_once(method, path, params, data, headers, cache_key)
+        )
+
+    def _retrying(self, attempt_once: Callable[[], T]) -> T:
+        self.metrics._add(requests=1)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.metrics._add(attempts=1)
+            try:
+                return attempt_once()
+            except GooglePlayError as e:
+                if self._retry is None or not self._retry.should_retry(e, attempt):
+                    self.metrics._add(failures=1)
+                    raise
+                self.metrics._add(retries=1)
+                time.sleep(self._retry.backoff(attempt, e))
+
+    async def _aretrying(self, attempt_once: Callable[[], Awaitable[T]]) -> T:
+        self.metrics._add(requests=1)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.metrics._add(attempts=1)
+            try:
+                return await attempt_once()
+            except GooglePlayError as e:
+                if self._retry is None or not self._retry.should_retry(e, attempt):
+                    self.metrics._add(failures=1)
+                    raise
+                self.metrics._add(retries=1)
+                await asyncio.sleep(self._retry.backoff(attempt, e))
+
+    def _send_once(
+            self,
+            method: str,
+            path: str,
+            params: Dict[str, Any],
+            data: Any,
+            headers: Optional[Dict[str, str]],
+            cache_key: Optional[str],
     ) -> str:
         self._wait_for_throttle()
 
@@ -77,10 +315,8 @@ class Requester:
         if headers:
             final_headers.update(headers)
 
-        params = self._merge_locale_params(params)
-
         try:
-            response = self._session.request(
+            response = self._get_session().request(
                 method=method,
                 url=url,
                 params=params,
@@ -88,29 +324,24 @@ class Requester:
                 headers=final_headers
             )
             response.raise_for_status()
+            self._record_success()
+            self._cache_store(cache_key, path, params, response.text)
             return response.text
 
         except httpx.HTTPStatusError as e:
-            code = e.response.status_code
-            if code == 404:
-                raise AppNotFound(f"App not found: {url}") from e
-            if code == 429 or code == 503:
-                raise QuotaExceeded("Too many requests or server unavailable.") from e
-            raise GooglePlayError(f"HTTP Error {code}") from e
+            raise self._status_error(e.response, url) from e
         except httpx.RequestError as e:
-            raise GooglePlayError(f"Network error: {str(e)}") from e
+            raise NetworkError(f"Network error: {str(e)}") from e
 
-    async def arequest(
+    async def _asend_once(
             self,
             method: str,
             path: str,
-            params: Dict[str, Any] = None,
-            data: Any = None,
-            headers: Optional[Dict[str, str]] = None,
+            params: Dict[str, Any],
+            data: Any,
+            headers: Optional[Dict[str, str]],
+            cache_key: Optional[str],
     ) -> str:
-        if self._async_session is None:
-            raise GooglePlayError("Async session is not configured for this Requester")
-
         await self._await_for_throttle()
 
         url = f"{self.BASE_URL}{path}"
@@ -118,10 +349,8 @@ class Requester:
         if headers:
             final_headers.update(headers)
 
-        params = self._merge_locale_params(params)
-
         try:
-            response = await self._async_session.request(
+            response = await self._get_async_session().request(
                 method=method,
                 url=url,
                 params=params,
@@ -129,16 +358,135 @@ class Requester:
                 headers=final_headers,
             )
             response.raise_for_status()
+            self._record_success()
+            self._cache_store(cache_key, path, params, response.text)
             return response.text
         except httpx.HTTPStatusError as e:
-            code = e.response.status_code
-            if code == 404:
-                raise AppNotFound(f"App not found: {url}") from e
-            if code == 429 or code == 503:
-                raise QuotaExceeded("Too many requests or server unavailable.") from e
-            raise GooglePlayError(f"HTTP Error {code}") from e
+            raise self._status_error(e.response, url) from e
         except httpx.RequestError as e:
-            raise GooglePlayError(f"Network error: {str(e)}") from e
+            raise NetworkError(f"Network error: {str(e)}") from e
+
+    def _status_error(self, response: httpx.Response, url: str) -> GooglePlayError:
+        code = response.status_code
+        if code == 404:
+            return AppNotFound(f"App not found: {url}")
+        if code == 429 or code == 503:
+            return self._quota_exceeded(response)
+        if code >= 500:
+            return ServerError(f"HTTP Error {code}", status_code=code)
+        return GooglePlayError(f"HTTP Error {code}")
+
+    def get_script_data(
+            self,
+            path: str,
+            keys: Iterable[str],
+            params: Dict[str, Any] = None,
+            headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        GETs an HTML page and returns its decoded `AF_initDataCallback` blocks for `keys`.
+
+        The body is streamed through a `ScriptDataScanner` and the connection is
+        closed as soon as every key has been found, so the rest of the page is
+        never downloaded. Streamed pages are not stored in the response cache.
+        """
+        keys = frozenset(keys)
+        params = self._merge_locale_params(params)
+
+        def fetch() -> Dict[str, Any]:
+            return self._retrying(lambda: self._scan_once(path, keys, params, headers))
+
+        if not self._coalesce:
+            return fetch()
+        return self._flights.do(self._scan_flight_key(path, keys, params, headers), fetch)
+
+    async def aget_script_data(
+            self,
+            path: str,
+            keys: Iterable[str],
+            params: Dict[str, Any] = None,
+            headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        if self._async_session is None and self._async_session_factory is None:
+            raise GooglePlayError("Async session is not configured for this Requester")
+
+        keys = frozenset(keys)
+        params = self._merge_locale_params(params)
+
+        def fetch() -> Awaitable[Dict[str, Any]]:
+            return self._aretrying(lambda: self._ascan_once(path, keys, params, headers))
+
+        if not self._coalesce:
+            return await fetch()
+        return await self._flights.ado(self._scan_flight_key(path, keys, params, headers), fetch)
+
+    def _scan_flight_key(
+            self,
+            path: str,
+            keys: frozenset,
+            params: Dict[str, Any],
+            headers: Optional[Dict[str, str]],
+    ) -> tuple:
+        return "scan", keys, self._flight_key("GET", path, params, None, headers, None)
+
+    def _scan_once(
+            self,
+            path: str,
+            keys: frozenset,
+            params: Dict[str, Any],
+            headers: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        self._wait_for_throttle()
+
+        url = f"{self.BASE_URL}{path}"
+        final_headers = self._headers.copy()
+        if headers:
+            final_headers.update(headers)
+
+        scanner = ScriptDataScanner(keys)
+        try:
+            # Leaving the block before the body is exhausted closes the connection.
+            with self._get_session().stream(
+                "GET", url, params=params, headers=final_headers
+            ) as response:
+                if response.is_error:
+                    raise self._status_error(response, url)
+                for chunk in response.iter_text():
+                    if scanner.feed(chunk):
+                        break
+            self._record_success()
+            return scanner.data_map
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network error: {str(e)}") from e
+
+    async def _ascan_once(
+            self,
+            path: str,
+            keys: frozenset,
+            params: Dict[str, Any],
+            headers: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        await self._await_for_throttle()
+
+        url = f"{self.BASE_URL}{path}"
+        final_headers = self._headers.copy()
+        if headers:
+            final_headers.update(headers)
+
+        scanner = ScriptDataScanner(keys)
+        try:
+            async with self._get_async_session().stream(
+                "GET", url, params=params, headers=final_headers
+            ) as response:
+                if response.is_error:
+                    raise self._status_error(response, url)
+                async for chunk in response.aiter_text():
+                    if scanner.feed(chunk):
+                        break
+            self._record_success()
+            return scanner.data_map
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network error: {str(e)}") from e
 
     def get(
             self,
@@ -173,3 +521,17 @@ class Requester:
             headers: Optional[Dict[str, str]] = None,
     ) -> str:
         return await self.arequest("POST", path, params=params, data=data, headers=headers)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """`Retry-After` as seconds; the header holds either a delay or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -1,9 +1,14 @@
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from functools import lru_cache
+from types import NoneType
+from typing import Optional, Dict, List, Any, Callable, TypeVar, get_args, get_origin
 
 from pydantic import BaseModel, HttpUrl, Field, BeforeValidator
+from pydantic_core import PydanticUndefined
 from typing_extensions import Annotated
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 # -- Helpers for Validators --
 
@@ -107,3 +112,119 @@ class Review(BaseModel):
     reply_text: Optional[str] = None
     version: Optional[str] = None
     thumbs_up: int = 0
+
+
+def locale_key(lang: str, country: str) -> str:
+    return f"{lang}_{country}"
+
+
+class LocalizedAppDetails(BaseModel):
+    """
+    One app across several storefronts.
+
+    `base` holds the details of the first locale that could be fetched. `deltas`
+    maps each fetched locale (`"lang_country"`) to the fields that differ from
+    `base` (typically title, description, price, currency and ratings), so
+    locale-invariant data is stored once. Locales that failed are listed in
+    `errors` with their error message.
+    """
+    app_id: str
+    base_locale: Optional[str] = None
+    base: Optional[AppDetails] = None
+    deltas: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def locales(self) -> List[str]:
+        return list(self.deltas)
+
+    def for_locale(self, lang: str, country: str) -> AppDetails:
+        """Full `AppDetails` of one fetched locale, rebuilt from `base` and its delta."""
+        key = locale_key(lang, country)
+        if key not in self.deltas:
+            raise KeyError(f"Locale {key} was not fetched")
+        return self.base.model_copy(update=self.deltas[key])
+
+
+class SearchRankings(BaseModel):
+    """
+    Results of several search terms in one storefront.
+
+    `rankings` maps each term to the app ids it returned, in rank order. Every app
+    appears once in `apps`, however many terms returned it. Terms that failed are
+    listed in `errors` with their error message.
+    """
+    rankings: Dict[str, List[str]] = Field(default_factory=dict)
+    apps: Dict[str, AppOverview] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+
+    def results(self, term: str) -> List[AppOverview]:
+        """Overviews of one term's results, in rank order."""
+        return [self.apps[app_id] for app_id in self.rankings[term]]
+
+
+# -- Trusted construction --
+
+def _find_coercer(annotation: Any, metadata: List[Any]) -> Optional[Callable[[Any], Any]]:
+    for item in metadata:
+        if isinstance(item, BeforeValidator):
+            return item.func
+    for arg in get_args(annotation):
+        if get_origin(arg) is Annotated:
+            found = _find_coercer(arg, list(arg.__metadata__))
+            if found:
+                return found
+    return None
+
+
+def _allows_none(annotation: Any) -> bool:
+    return annotation is Any or NoneType in get_args(annotation)
+
+
+@lru_cache(maxsize=None)
+def _construction_plan(model_cls: type) -> tuple:
+    plan = []
+    for name, field in model_cls.model_fields.items():
+        plan.append((
+            name,
+            _find_coercer(field.annotation, field.metadata),
+            _allows_none(field.annotation),
+            field.default,
+            field.default_factory,
+        ))
+    return tuple(plan)
+
+
+def construct_trusted(model_cls: type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Builds a model from already-extracted parser output without running validation.
+
+    The cheap `Coerced*` helpers still run, so numeric and boolean fields get the
+    same values as with validation, and `None` falls back to the field default
+    wherever validation would have rejected it. URL fields stay plain strings
+    instead of `HttpUrl`, which is where most of the validation cost goes; dump
+    such models with `warnings=False` to silence Pydantic's serializer warnings.
+    """
+    values = {}
+    fields_set = set()
+    for name, coercer, allows_none, default, default_factory in _construction_plan(model_cls):
+        value = data.get(name)
+        if value is not None or (name in data and allows_none):
+            values[name] = value if coercer is None or value is None else coercer(value)
+            fields_set.add(name)
+        elif name in data and coercer is not None:
+            values[name] = coercer(value)
+            fields_set.add(name)
+        elif default_factory is not None:
+            values[name] = default_factory()
+        else:
+            values[name] = None if default is PydanticUndefined else default
+
+    # Same state `BaseModel.model_construct` sets up, minus its per-call
+    # introspection of default factories, which dominates its cost.
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
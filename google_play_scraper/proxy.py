@@ -0,0 +1,200 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import httpx
+
+from .ratelimit import TokenBucket
+
+STRATEGIES = ("round_robin", "weighted", "least_loaded")
+# Responses that count against a proxy, the same ones `Requester` maps to `QuotaExceeded`.
+THROTTLED_STATUS_CODES = (429, 503)
+
+
+@dataclass(frozen=True)
+class ProxyStatus:
+    url: str
+    healthy: bool
+    in_flight: int
+    consecutive_failures: int
+    requests: int
+    failures: int
+
+
+@dataclass(eq=False)
+class _Proxy:
+    url: str
+    weight: float
+    bucket: Optional[TokenBucket]
+    in_flight: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+
+
+class ProxyPool:
+    """
+    Spreads requests over several egress proxies.
+
+    Proxies are picked `round_robin`, `weighted` (by the weights given as a mapping
+    of url to weight) or `least_loaded` (fewest requests in flight). A proxy that
+    fails `max_failures` times in a row (network error, 429 or 503) is ejected for
+    `cooldown` seconds; if every proxy is ejected the one recovering first is
+    used. `rate_per_proxy` gives each proxy its own `TokenBucket`, so the total
+    budget grows with the size of the pool.
+
+    Plug it into a client with `GooglePlayClient(proxy_pool=pool)`.
+    """
+
+    def __init__(
+            self,
+            proxies: Union[Sequence[str], Mapping[str, float]],
+            strategy: str = "round_robin",
+            max_failures: int = 3,
+            cooldown: float = 60.0,
+            rate_per_proxy: Optional[float] = None,
+            burst_per_proxy: float = 1.0,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}")
+        weights = dict(proxies) if isinstance(proxies, Mapping) else dict.fromkeys(proxies, 1.0)
+        if not weights:
+            raise ValueError("ProxyPool needs at least one proxy")
+        self._proxies = [
+            _Proxy(url, weight, TokenBucket(rate_per_proxy, burst_per_proxy) if rate_per_proxy else None)
+            for url, weight in weights.items()
+        ]
+        self._strategy = strategy
+        self._max_failures = max_failures
+        self._cooldown = cooldown
+        self._turn = count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def status(self) -> List[ProxyStatus]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                ProxyStatus(
+                    p.url, p.ejected_until <= now, p.in_flight,
+                    p.consecutive_failures, p.requests, p.failures,
+                )
+                for p in self._proxies
+            ]
+
+    def transport(self, **options: Any) -> "PooledTransport":
+        """Sync transport; `options` (`verify`, `http2`, `limits`) go to each proxy transport."""
+        return PooledTransport(self, options)
+
+    def async_transport(self, **options: Any) -> "AsyncPooledTransport":
+        return AsyncPooledTransport(self, options)
+
+    def _checkout(self) -> _Proxy:
+        now = time.monotonic()
+        with self._lock:
+            healthy = [p for p in self._proxies if p.ejected_until <= now]
+            if not healthy:
+                proxy = min(self._proxies, key=lambda p: p.ejected_until)
+            elif self._strategy == "weighted":
+                proxy = random.choices(healthy, weights=[p.weight for p in healthy])[0]
+            elif self._strategy == "least_loaded":
+                start = next(self._turn)
+                rotated = [healthy[(start + i) % len(healthy)] for i in range(len(healthy))]
+                proxy = min(rotated, key=lambda p: p.in_flight)
+            else:
+                proxy = healthy[next(self._turn) % len(healthy)]
+            proxy.in_flight += 1
+            proxy.requests += 1
+            return proxy
+
+    def _release(self, proxy: _Proxy, failed: bool) -> None:
+        with self._lock:
+            proxy.in_flight -= 1
+            if not failed:
+                proxy.consecutive_failures = 0
+                return
+            proxy.failures += 1
+            proxy.consecutive_failures += 1
+            if proxy.consecutive_failures >= self._max_failures:
+                proxy.consecutive_failures = 0
+                proxy.ejected_until = time.monotonic() + self._cooldown
+
+
+class _ProxyTransports:
+    """
+    Connections to the proxies of a pool, owned by one pooled transport.
+
+    Each client gets its own, built on first use with that client's options, so
+    clients sharing a pool share its health and rate state but never each
+    other's connections.
+    """
+
+    transport_cls: type = httpx.HTTPTransport
+
+    def __init__(self, pool: ProxyPool, options: Dict[str, Any]):
+        self._pool = pool
+        self._options = options
+        self._transports: Dict[_Proxy, Any] = {}
+        self._lock = threading.Lock()
+
+    def _proxy_transport(self, proxy: _Proxy) -> Any:
+        with self._lock:
+            transport = self._transports.get(proxy)
+            if transport is None:
+                transport = self._transports[proxy] = self._open(proxy)
+            return transport
+
+    def _open(self, proxy: _Proxy) -> Any:
+        return self.transport_cls(proxy=proxy.url, **self._options)
+
+    def _detach(self) -> List[Any]:
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        return transports
+
+
+class PooledTransport(_ProxyTransports, httpx.BaseTransport):
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        proxy = self._pool._checkout()
+        failed = True
+        try:
+            if proxy.bucket is not None:
+                proxy.bucket.acquire()
+            transport = self._proxy_transport(proxy)
+            response = transport.handle_request(request)
+            failed = response.status_code in THROTTLED_STATUS_CODES
+            return response
+        finally:
+            self._pool._release(proxy, failed)
+
+    def close(self) -> None:
+        for transport in self._detach():
+            transport.close()
+
+
+class AsyncPooledTransport(_ProxyTransports, httpx.AsyncBaseTransport):
+    transport_cls = httpx.AsyncHTTPTransport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        proxy = self._pool._checkout()
+        failed = True
+        try:
+            if proxy.bucket is not None:
+                await proxy.bucket.aacquire()
+            transport = self._proxy_transport(proxy)
+            response = await transport.handle_async_request(request)
+            failed = response.status_code in THROTTLED_STATUS_CODES
+            return response
+        finally:
+            self._pool._release(proxy, failed)
+
+    async def aclose(self) -> None:
+        for transport in self._detach():
+            await transport.aclose()
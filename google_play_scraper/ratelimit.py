@@ -0,0 +1,217 @@
+import asyncio
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+T = TypeVar("T")
+
+# (tokens, updated_at). Tokens may go negative: the debt is the queue of callers
+# that already hold a reservation and are sleeping until their turn.
+BucketState = tuple[float, float]
+
+
+class BucketBackend(ABC):
+    """Where a `TokenBucket` keeps its state; `transact` must be atomic."""
+
+    @abstractmethod
+    def now(self) -> float:
+        ...
+
+    @abstractmethod
+    def transact(self, func: Callable[[Optional[BucketState]], tuple[BucketState, T]]) -> T:
+        """Apply `func` to the current state (None when empty), store the new state, return the result."""
+
+
+class MemoryBackend(BucketBackend):
+    """State shared by the threads and event loops of one process."""
+
+    def __init__(self):
+        self._state: Optional[BucketState] = None
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def transact(self, func):
+        with self._lock:
+            self._state, result = func(self._state)
+            return result
+
+
+class FileLockBackend(BucketBackend):
+    """
+    State kept in a small file guarded by `flock`, shared by every process on the
+    host that uses the same `path` (POSIX only). Timestamps use the wall clock.
+    """
+
+    _FORMAT = "<dd"
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise RuntimeError("FileLockBackend requires fcntl (POSIX)")
+        self._path = path
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return time.time()
+
+    def transact(self, func):
+        size = struct.calcsize(self._FORMAT)
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.pread(fd, size, 0)
+                state = struct.unpack(self._FORMAT, raw) if len(raw) == size else None
+                new_state, result = func(state)
+                os.pwrite(fd, struct.pack(self._FORMAT, *new_state), 0)
+                return result
+            finally:
+                os.close(fd)  # also releases the flock
+
+
+class TokenBucket:
+    """
+    Token bucket limiter allowing `rate` requests per second with bursts of up to
+    `burst` requests.
+
+    Every `acquire` takes a reservation under the backend lock, then sleeps outside
+    it until the reserved slot. Callers are therefore served in arrival order, and
+    threads and coroutines sharing one bucket draw from the same budget.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, backend: Optional[BucketBackend] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._rate = float(rate)
+        self._burst = float(burst)
+        self._backend = backend if backend is not None else MemoryBackend()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        return self._burst
+
+    def record_success(self) -> None:
+        """Feedback hook called after each successful request; no-op for a fixed rate."""
+
+    def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        """Feedback hook called when Google answers 429/503; no-op for a fixed rate."""
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every new reservation for at least `seconds`."""
+
+        def _drain(state: Optional[BucketState]) -> tuple[BucketState, None]:
+            now = self._backend.now()
+            available, updated_at = state if state is not None else (self._burst, now)
+            available = min(self._burst, available + max(0.0, now - updated_at) * self._rate)
+            # One token short of `seconds` worth of refill: the next caller waits it out.
+            return (min(available, 1.0 - seconds * self._rate), max(now, updated_at)), None
+
+        self._backend.transact(_drain)
+
+    def _set_rate(self, rate: float) -> None:
+        def _settle(state: Optional[BucketState]) -> tuple[Optional[BucketState], None]:
+            # Credit the time elapsed so far at the old rate before switching.
+            if state is None:
+                return None, None
+            now = self._backend.now()
+            available, updated_at = state
+            available = min(self._burst, available + max(0.0, now - updated_at) * self._rate)
+            return (available, max(now, updated_at)), None
+
+        self._backend.transact(_settle)
+        self._rate = rate
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` now and return how many seconds to wait before using them."""
+        rate, burst = self._rate, self._burst
+
+        def _take(state: Optional[BucketState]) -> tuple[BucketState, float]:
+            # Read the clock under the lock so other processes' updates are ordered.
+            now = self._backend.now()
+            available, updated_at = state if state is not None else (burst, now)
+            available = min(burst, available + max(0.0, now - updated_at) * rate) - tokens
+            return (available, max(now, updated_at)), max(0.0, -available / rate)
+
+        return self._backend.transact(_take)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: float = 1.0) -> None:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket whose rate follows server feedback (AIMD).
+
+    Each 429/503 multiplies the rate by `decrease_factor` (at most once per
+    `cooldown` seconds, since a burst of in-flight requests tends to be rejected
+    together) and honours `Retry-After` by pausing the bucket. Each success adds
+    `increase / rate` requests/second, i.e. roughly `increase` more requests/second
+    for every second of healthy traffic. The rate stays within
+    `[min_rate, max_rate]`; `rate` reports the current effective value.
+
+    With a shared backend the token state is shared, but each process adapts its
+    own rate.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: float = 1.0,
+            min_rate: float = 0.1,
+            max_rate: Optional[float] = None,
+            increase: float = 0.1,
+            decrease_factor: float = 0.5,
+            cooldown: float = 1.0,
+            backend: Optional[BucketBackend] = None,
+    ):
+        super().__init__(rate, burst, backend)
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if min_rate <= 0 or (max_rate is not None and max_rate < min_rate):
+            raise ValueError("rate bounds must satisfy 0 < min_rate <= max_rate")
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._cooldown = cooldown
+        self._last_decrease: Optional[float] = None
+        self._feedback_lock = threading.Lock()
+
+    def record_success(self) -> None:
+        with self._feedback_lock:
+            rate = self._rate + self._increase / self._rate
+            if self._max_rate is not None:
+                rate = min(rate, self._max_rate)
+            if rate != self._rate:
+                self._set_rate(rate)
+
+    def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        with self._feedback_lock:
+            now = time.monotonic()
+            if self._last_decrease is None or now - self._last_decrease >= self._cooldown:
+                self._last_decrease = now
+                self._set_rate(max(self._min_rate, self._rate * self._decrease_factor))
+        if retry_after:
+            self.pause(retry_after)
@@ -0,0 +1,52 @@
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .exceptions import NetworkError, QuotaExceeded, ServerError
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    `max_attempts` counts the first try. Delays use "full jitter": a uniform draw
+    from `[0, min(backoff_cap, backoff_base * 2 ** (attempt - 1))]`, which spreads
+    out clients that failed together. A `Retry-After` sent with a 429/503 is used
+    as the lower bound of the delay when `respect_retry_after` is set.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    retry_on: tuple[type[BaseException], ...] = (NetworkError, ServerError, QuotaExceeded)
+    respect_retry_after: bool = True
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+    def backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+
+@dataclass
+class RequestMetrics:
+    """Counters for the requests sent by a client (cache hits are not counted)."""
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _add(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from .constants import Sort
+from .models import Review
+
+if TYPE_CHECKING:
+    from .client import GooglePlayClient
+
+
+@dataclass(frozen=True)
+class Watermark:
+    """The newest review seen for an app in a given locale."""
+    review_id: str
+    date: Optional[datetime] = None
+
+
+class WatermarkStore(ABC):
+    """Persists one `Watermark` per `(app_id, lang, country)`."""
+
+    @abstractmethod
+    def get(self, app_id: str, lang: str, country: str) -> Optional[Watermark]:
+        ...
+
+    @abstractmethod
+    def set(self, app_id: str, lang: str, country: str, watermark: Watermark) -> None:
+        ...
+
+
+class MemoryWatermarkStore(WatermarkStore):
+    """Process-local store, mostly useful for tests and one-off scripts."""
+
+    def __init__(self):
+        self._data: Dict[tuple[str, str, str], Watermark] = {}
+        self._lock = threading.Lock()
+
+    def get(self, app_id: str, lang: str, country: str) -> Optional[Watermark]:
+        with self._lock:
+            return self._data.get((app_id, lang, country))
+
+    def set(self, app_id: str, lang: str, country: str, watermark: Watermark) -> None:
+        with self._lock:
+            self._data[(app_id, lang, country)] = watermark
+
+
+class SQLiteWatermarkStore(WatermarkStore):
+    """Stores watermarks in a SQLite database file (`":memory:"` works too)."""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS review_watermarks ("
+                " app_id TEXT NOT NULL,"
+                " lang TEXT NOT NULL,"
+                " country TEXT NOT NULL,"
+                " review_id TEXT NOT NULL,"
+                " review_date TEXT,"
+                " PRIMARY KEY (app_id, lang, country))"
+            )
+
+    def get(self, app_id: str, lang: str, country: str) -> Optional[Watermark]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT review_id, review_date FROM review_watermarks"
+                " WHERE app_id = ? AND lang = ? AND country = ?",
+                (app_id, lang, country),
+            ).fetchone()
+        if row is None:
+            return None
+        review_id, review_date = row
+        return Watermark(review_id, datetime.fromisoformat(review_date) if review_date else None)
+
+    def set(self, app_id: str, lang: str, country: str, watermark: Watermark) -> None:
+        review_date = watermark.date.isoformat() if watermark.date else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO review_watermarks"
+                " (app_id, lang, country, review_id, review_date) VALUES (?, ?, ?, ?, ?)",
+                (app_id, lang, country, watermark.review_id, review_date),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ReviewSyncer:
+    """
+    Fetches only the reviews posted since the previous sync of an app.
+
+    Reviews are read newest first and paging stops at the stored watermark (the
+    newest review seen last time), or at the first review older than it. The
+    watermark only moves forward once a sync completes, so a failed run is simply
+    retried in full next time. Apps without a watermark get their `initial_limit`
+    newest reviews.
+
+    `store` is either a `WatermarkStore` or the path of a SQLite database, which
+    is opened as a `SQLiteWatermarkStore` so watermarks survive across runs.
+    """
+
+    def __init__(
+        self,
+        client: "GooglePlayClient",
+        store: Union[WatermarkStore, str],
+        initial_limit: Optional[int] = 100,
+        page_size: int = 100,
+    ):
+        self._client = client
+        self._store = SQLiteWatermarkStore(store) if isinstance(store, str) else store
+        self._initial_limit = initial_limit
+        self._page_size = page_size
+
+    def fetch_new(self, app_id: str, lang: str = None, country: str = None) -> List[Review]:
+        lang, country = self._client._resolve_locale(lang, country)
+        watermark = self._store.get(app_id, lang, country)
+        delta = list(self._client.iter_reviews(
+            app_id, lang, country, sort=Sort.NEWEST, **self._stream_args(watermark)
+        ))
+        self._advance(app_id, lang, country, delta)
+        return delta
+
+    async def afetch_new(self, app_id: str, lang: str = None, country: str = None) -> List[Review]:
+        lang, country = self._client._resolve_locale(lang, country)
+        watermark = self._store.get(app_id, lang, country)
+        delta = [
+            review
+            async for review in self._client.aiter_reviews(
+                app_id, lang, country, sort=Sort.NEWEST, **self._stream_args(watermark)
+            )
+        ]
+        self._advance(app_id, lang, country, delta)
+        return delta
+
+    def _stream_args(self, watermark: Optional[Watermark]) -> dict:
+        if watermark is None:
+            return {"limit": self._initial_limit, "page_size": self._page_size}
+        return {
+            "since": watermark.date,
+            "until_review_id": watermark.review_id,
+            "page_size": self._page_size,
+        }
+
+    def _advance(self, app_id: str, lang: str, country: str, delta: List[Review]) -> None:
+        if delta:
+            newest = delta[0]
+            self._store.set(app_id, lang, country, Watermark(newest.id, newest.date))
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from google_play_scraper.cache import (
+    BATCHEXECUTE_PATH,
+    DEFAULT_TTL,
+    DEFAULT_TTLS,
+    MemoryCache,
+    SQLiteCache,
+    make_key,
+    resolve_ttl,
+)
+
+
+class MemoryCacheTest(unittest.TestCase):
+    def test_counts_hits_and_misses(self):
+        cache = MemoryCache()
+        cache.set("a", "A", ttl=60)
+
+        self.assertEqual(cache.get("a"), "A")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+        self.assertEqual(cache.stats.hit_rate, 0.5)
+
+    def test_counts_concurrent_gets(self):
+        cache = MemoryCache()
+        cache.set("a", "A", ttl=60)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: cache.get("a" if i % 2 else "b"), range(2000)))
+
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1000, 1000))
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", "A", ttl=60)
+        cache.set("b", "B", ttl=60)
+        cache.get("a")
+        cache.set("c", "C", ttl=60)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(cache.get("c"), "C")
+
+    def test_expired_entries_are_misses(self):
+        cache = MemoryCache()
+        with patch("google_play_scraper.cache.time.time", return_value=1000.0):
+            cache.set("a", "A", ttl=10)
+        with patch("google_play_scraper.cache.time.time", return_value=1011.0):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_zero_ttl_is_not_stored(self):
+        cache = MemoryCache()
+        cache.set("a", "A", ttl=0)
+        self.assertEqual(len(cache), 0)
+
+
+class SQLiteCacheTest(unittest.TestCase):
+    def test_persists_expires_and_evicts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            cache = SQLiteCache(path, max_entries=2)
+            with patch("google_play_scraper.cache.time.time", return_value=1000.0):
+                cache.set("a", "A", ttl=100)
+                cache.set("short", "S", ttl=5)
+            with patch("google_play_scraper.cache.time.time", return_value=1010.0):
+                self.assertIsNone(cache.get("short"))
+                cache.set("b", "B", ttl=100)
+            with patch("google_play_scraper.cache.time.time", return_value=1020.0):
+                cache.get("a")
+            with patch("google_play_scraper.cache.time.time", return_value=1030.0):
+                cache.set("c", "C", ttl=100)
+            cache.close()
+
+            reopened = SQLiteCache(path)
+            with patch("google_play_scraper.cache.time.time", return_value=1040.0):
+                self.assertEqual(reopened.get("a"), "A")
+                self.assertIsNone(reopened.get("b"))
+                self.assertEqual(reopened.get("c"), "C")
+            reopened.clear()
+            self.assertIsNone(reopened.get("a"))
+            reopened.close()
+
+
+class CacheKeyAndTtlTest(unittest.TestCase):
+    def test_key_ignores_param_order_and_tracks_body(self):
+        a = make_key("get", "/p", {"id": "x", "hl": "en"}, None)
+        b = make_key("GET", "/p", {"hl": "en", "id": "x"}, None)
+        c = make_key("POST", "/p", {"hl": "en", "id": "x"}, {"f.req": "1"})
+        d = make_key("POST", "/p", {"hl": "en", "id": "x"}, {"f.req": "2"})
+
+        self.assertEqual(a, b)
+        self.assertNotEqual(c, d)
+
+    def test_ttl_by_path_and_rpc_id(self):
+        self.assertEqual(resolve_ttl("/store/apps/details", {}, DEFAULT_TTLS), 6 * 3600)
+        self.assertEqual(resolve_ttl("/unknown", {}, DEFAULT_TTLS), DEFAULT_TTL)
+        self.assertEqual(
+            resolve_ttl(BATCHEXECUTE_PATH, {"rpcids": "IJ4APc"}, DEFAULT_TTLS), 3 * 86400
+        )
+        self.assertEqual(
+            resolve_ttl(BATCHEXECUTE_PATH, {"rpcids": "IJ4APc,UsvDTd"}, DEFAULT_TTLS), 300
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
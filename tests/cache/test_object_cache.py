@@ -0,0 +1,48 @@
+import pickle
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.cache import ObjectCache
+from google_play_scraper.models import AppOverview
+
+
+class ObjectCacheTest(unittest.TestCase):
+    def test_returns_independent_copies(self):
+        cache = ObjectCache()
+        app = AppOverview(app_id="com.a", title="A", icon="https://example.com/i.png")
+        cache.set("k", app)
+
+        first = cache.get("k")
+        first.title = "changed"
+
+        self.assertEqual(cache.get("k"), app)
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (2, 0))
+
+    def test_evicts_by_size_in_lru_order(self):
+        blob_size = len(pickle.dumps("x" * 100, protocol=pickle.HIGHEST_PROTOCOL))
+        cache = ObjectCache(max_bytes=blob_size * 2)
+        cache.set("a", "x" * 100)
+        cache.set("b", "x" * 100)
+        cache.get("a")
+        cache.set("c", "x" * 100)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "x" * 100)
+        self.assertEqual(cache.nbytes, blob_size * 2)
+
+    def test_oversized_values_are_skipped(self):
+        cache = ObjectCache(max_bytes=10)
+        cache.set("a", "x" * 100)
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+    def test_entries_expire(self):
+        cache = ObjectCache(ttl=10)
+        with patch("google_play_scraper.cache.time.time", return_value=1000.0):
+            cache.set("a", 1)
+        with patch("google_play_scraper.cache.time.time", return_value=1011.0):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.nbytes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
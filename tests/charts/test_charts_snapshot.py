@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+import re
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.charts import COLUMNS, ChartKey, ChartSnapshot, CsvChartSink
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.constants import Category, Collection
+from google_play_scraper.exceptions import NetworkError
+
+
+def chart_payload(app_ids):
+    apps = [[[[app_id], None, None, f"Title {app_id}"]] for app_id in app_ids]
+    return [[None, [[None] * 28 + [[apps]]]]]
+
+
+def chart_response(params, form_data, depth=3):
+    """Answers every list entry with `depth` apps named after its chart."""
+    entries = json.loads(form_data["f.req"])[0]
+    chunks = [")]}'", ""]
+    for rpc_id, req_json, _, identifier in entries:
+        collection, category = re.search(r'\[2,"([^"]+)","([^"]+)"\]', req_json).groups()
+        app_ids = [f"{params['gl']}.{category}.{collection}.{rank}" for rank in range(1, depth + 1)]
+        body = json.dumps([["wrb.fr", rpc_id, json.dumps(chart_payload(app_ids)), None, None, None, identifier]])
+        chunks.extend([str(len(body)), body])
+    return "\n".join(chunks)
+
+
+class TestChartsSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_snapshot_covers_matrix_in_columnar_form(self, mock_post):
+        mock_post.side_effect = lambda path, params, data: chart_response(params, data)
+
+        snapshot = self.client.charts_snapshot(
+            ["us", "de"], categories=[Category.GAME, Category.TOOLS], concurrency=2
+        )
+
+        # 2 categories x 3 collections per country, one request each.
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertIsInstance(snapshot, ChartSnapshot)
+        self.assertEqual(len(snapshot), 2 * 2 * 3 * 3)
+        self.assertEqual(
+            snapshot.ranking("de", Category.TOOLS, Collection.GROSSING),
+            ["de.TOOLS.topgrossing.1", "de.TOOLS.topgrossing.2", "de.TOOLS.topgrossing.3"],
+        )
+        row = next(r for r in snapshot.rows() if r["app_id"] == "us.GAME.topselling_paid.2")
+        self.assertEqual(
+            (row["country"], row["category"], row["collection"], row["rank"], row["title"]),
+            ("us", "GAME", "topselling_paid", 2, "Title us.GAME.topselling_paid.2"),
+        )
+        self.assertEqual(snapshot.errors, {})
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_batch_size_splits_country_charts_into_requests(self, mock_post):
+        mock_post.side_effect = lambda path, params, data: chart_response(params, data)
+
+        self.client.charts_snapshot(["us"], batch_size=50)
+
+        self.assertEqual(mock_post.call_count, -(-len(Category) * len(Collection) // 50))
+        for call in mock_post.call_args_list:
+            self.assertEqual(call.kwargs["params"]["gl"], "us")
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_failed_request_is_reported_per_chart(self, mock_post):
+        def respond(path, params, data):
+            if params["gl"] == "fr":
+                raise NetworkError("Network error: boom")
+            return chart_response(params, data)
+
+        mock_post.side_effect = respond
+
+        snapshot = self.client.charts_snapshot(
+            ["us", "fr"], categories=["GAME"], collections=[Collection.TOP_FREE]
+        )
+
+        self.assertEqual(snapshot.columns["country"], ["us"] * 3)
+        self.assertEqual(
+            snapshot.errors,
+            {ChartKey("fr", "GAME", "topselling_free"): "NetworkError: Network error: boom"},
+        )
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_csv_sink_streams_rows(self, mock_post):
+        mock_post.side_effect = lambda path, params, data: chart_response(params, data, depth=2)
+        out = io.StringIO()
+
+        sink = self.client.charts_snapshot(
+            ["us"], categories=["GAME"], collections=["topselling_free"], sink=CsvChartSink(out)
+        )
+
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertIsInstance(sink, CsvChartSink)
+        self.assertEqual(tuple(rows[0]), COLUMNS)
+        self.assertEqual(rows[1][:5], ["us", "GAME", "topselling_free", "1", "us.GAME.topselling_free.1"])
+        self.assertEqual(len(rows), 3)
+
+    def test_invalid_batch_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.client.charts_snapshot(["us"], batch_size=0)
+
+
+class TestAsyncChartsSnapshot(unittest.IsolatedAsyncioTestCase):
+    @patch("google_play_scraper.client.Requester.apost")
+    async def test_snapshot_covers_matrix(self, mock_apost):
+        async def respond(path, params, data):
+            return chart_response(params, data)
+
+        mock_apost.side_effect = respond
+
+        snapshot = await GooglePlayClient().acharts_snapshot(["us", "jp"], categories=["GAME"])
+
+        self.assertEqual(mock_apost.call_count, 2)
+        self.assertEqual(len(snapshot), 2 * 3 * 3)
+        self.assertEqual(snapshot.ranking("jp", "GAME", "topselling_free")[0], "jp.GAME.topselling_free.1")
+
+
+if __name__ == "__main__":
+    unittest.main()
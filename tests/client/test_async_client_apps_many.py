@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import AppNotFound
+from google_play_scraper.models import AppDetails
+
+
+class TestAsyncClientAppsMany(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    async def test_yields_results_and_errors_with_bounded_concurrency(self):
+        state = {"active": 0, "peak": 0}
+        calls = []
+
+        async def _aapp(app_id, lang=None, country=None):
+            calls.append((app_id, lang, country))
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            if app_id == "missing":
+                raise AppNotFound("nope")
+            return AppDetails(app_id=app_id, title=app_id.upper())
+
+        apps = ["a", ("b", "fr", "ca"), "missing"] + [f"app{i}" for i in range(5)]
+        with patch.object(self.client, "aapp", side_effect=_aapp):
+            results = {
+                app_id: result
+                async for app_id, result in self.client.aapps_many(apps, concurrency=2)
+            }
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(results["a"].title, "A")
+        self.assertIsInstance(results["missing"], AppNotFound)
+        self.assertIn(("b", "fr", "ca"), calls)
+        self.assertLessEqual(state["peak"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, AsyncMock
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import NetworkError
+
+
+class TestAsyncClientBatch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    @patch("google_play_scraper.client.Requester.apost", new_callable=AsyncMock)
+    async def test_aexecute_sends_one_post_per_group(self, mock_apost):
+        async def _apost(path, params, data):
+            entries = json.loads(data["f.req"])[0]
+            return json.dumps([
+                ["wrb.fr", rpc_id, json.dumps([[[[params["hl"] + ":" + ident]]]]), None, None, None, ident]
+                for rpc_id, _, _, ident in entries
+            ])
+
+        mock_apost.side_effect = _apost
+
+        batch = self.client.batch()
+        batch.suggest("a", lang="en")
+        batch.suggest("b", lang="fr")
+        batch.suggest("c", lang="en")
+        results = await batch.aexecute()
+
+        self.assertEqual(mock_apost.await_count, 2)
+        self.assertEqual(results, [["en:1"], ["fr:1"], ["en:2"]])
+
+    @patch("google_play_scraper.client.Requester.apost", new_callable=AsyncMock)
+    async def test_aexecute_bounds_requests_in_flight(self, mock_apost):
+        in_flight = peak = 0
+
+        async def _apost(path, params, data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            entries = json.loads(data["f.req"])[0]
+            return json.dumps([
+                ["wrb.fr", rpc_id, json.dumps([[[[params["hl"]]]]]), None, None, None, ident]
+                for rpc_id, _, _, ident in entries
+            ])
+
+        mock_apost.side_effect = _apost
+
+        batch = self.client.batch()
+        for lang in ("en", "fr", "de", "es"):
+            batch.suggest("a", lang=lang)
+        results = await batch.aexecute(concurrency=2)
+
+        self.assertEqual(mock_apost.await_count, 4)
+        self.assertEqual(peak, 2)
+        self.assertEqual(results, [["en"], ["fr"], ["de"], ["es"]])
+
+    @patch("google_play_scraper.client.Requester.apost", new_callable=AsyncMock)
+    async def test_failed_request_fills_its_calls_and_keeps_the_rest(self, mock_apost):
+        async def _apost(path, params, data):
+            if params["hl"] == "de":
+                raise NetworkError("boom")
+            entries = json.loads(data["f.req"])[0]
+            return json.dumps([
+                ["wrb.fr", rpc_id, json.dumps([[[["ok"]]]]), None, None, None, ident]
+                for rpc_id, _, _, ident in entries
+            ])
+
+        mock_apost.side_effect = _apost
+
+        batch = self.client.batch()
+        batch.suggest("a", lang="de")
+        batch.suggest("b", lang="en")
+        results = await batch.aexecute()
+
+        self.assertIsInstance(results[0], NetworkError)
+        self.assertEqual(results[1], ["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
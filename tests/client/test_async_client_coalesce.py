@@ -0,0 +1,29 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.models import AppDetails
+
+
+class TestAsyncClientCoalesce(unittest.IsolatedAsyncioTestCase):
+    @patch.object(GooglePlayClient, "_parse_app_details")
+    @patch("google_play_scraper.client.Requester.aget")
+    async def test_concurrent_aapp_calls_share_fetch_and_parse(self, mock_aget, mock_parse):
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return "<html>"
+
+        mock_aget.side_effect = slow_get
+        mock_parse.return_value = AppDetails(app_id="com.a", title="A")
+        client = GooglePlayClient()
+
+        results = await asyncio.gather(*(client.aapp("com.a") for _ in range(30)))
+
+        self.assertEqual({r.title for r in results}, {"A"})
+        self.assertEqual(mock_aget.call_count, 1)
+        self.assertEqual(mock_parse.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
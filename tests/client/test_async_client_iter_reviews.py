@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch, AsyncMock
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.models import Review
+
+BASE = datetime(2024, 1, 10, 12, 0, 0)
+
+
+def make_page(start: int, size: int) -> list[Review]:
+    return [
+        Review(id=f"r{i}", user_name="u", score=5, date=BASE - timedelta(hours=i))
+        for i in range(start, start + size)
+    ]
+
+
+class TestAsyncClientIterReviews(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    @patch.object(GooglePlayClient, "areviews", new_callable=AsyncMock)
+    async def test_follows_tokens_and_respects_limit(self, mock_areviews):
+        mock_areviews.side_effect = [(make_page(0, 2), "T1"), (make_page(2, 2), "T2")]
+
+        ids = [r.id async for r in self.client.aiter_reviews("com.example", limit=3, page_size=2)]
+
+        self.assertEqual(ids, ["r0", "r1", "r2"])
+        self.assertEqual([c.args[5] for c in mock_areviews.call_args_list], [None, "T1"])
+        self.assertEqual([c.args[4] for c in mock_areviews.call_args_list], [2, 1])
+
+    @patch.object(GooglePlayClient, "areviews", new_callable=AsyncMock)
+    async def test_stops_at_since_and_watermark(self, mock_areviews):
+        mock_areviews.return_value = (make_page(0, 5), "T1")
+
+        by_date = [r.id async for r in self.client.aiter_reviews(
+            "com.example", since=BASE - timedelta(hours=1, minutes=30)
+        )]
+        by_id = [r.id async for r in self.client.aiter_reviews("com.example", until_review_id="r3")]
+
+        self.assertEqual(by_date, ["r0", "r1"])
+        self.assertEqual(by_id, ["r0", "r1", "r2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
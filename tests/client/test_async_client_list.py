@@ -118,10 +118,11 @@ class TestAsyncClientList(unittest.IsolatedAsyncioTestCase):
         new_callable=AsyncMock,
         return_value="OK",
     )
-    async def test_extract_exception_returns_empty(
+    async def test_extract_exception_propagates(
         self, mock_apost, mock_parse, mock_extract
     ):
-        self.assertEqual(await self.client.alist(), [])
+        with self.assertRaisesRegex(Exception, "boom"):
+            await self.client.alist()
 
     @patch("google_play_scraper.client.ScriptDataParser.parse_batchexecute_response")
     @patch(
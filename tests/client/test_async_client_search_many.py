@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import NetworkError
+
+
+def raw_item(app_id):
+    item = [None] * 13
+    item[2] = f"Title {app_id}"
+    item[12] = [app_id]
+    return item
+
+
+PAGES = {
+    "chess": [raw_item("com.chess"), raw_item("com.shared")],
+    "puzzle": [raw_item("com.shared"), raw_item("com.sudoku")],
+}
+
+
+class TestAsyncClientSearchMany(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+        async def fake_aget(path, params=None, **kwargs):
+            if params["q"] == "broken":
+                raise NetworkError("Network error: boom")
+            return params["q"]
+
+        patches = [
+            patch("google_play_scraper.client.Requester.aget", side_effect=fake_aget),
+            patch.object(
+                GooglePlayClient, "_split_search_page", side_effect=lambda html: (PAGES[html], None)
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_rankings_are_per_term_and_apps_are_deduplicated(self):
+        result = await self.client.asearch_many(["chess", "puzzle", "broken"], num=10)
+
+        self.assertEqual(result.rankings, {
+            "chess": ["com.chess", "com.shared"],
+            "puzzle": ["com.shared", "com.sudoku"],
+        })
+        self.assertEqual(sorted(result.apps), ["com.chess", "com.shared", "com.sudoku"])
+        self.assertEqual(result.errors["broken"], "NetworkError: Network error: boom")
+
+
+if __name__ == "__main__":
+    unittest.main()
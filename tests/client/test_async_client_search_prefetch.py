@@ -0,0 +1,155 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.models import AppOverview
+
+# tests/conftest.py blocks real requests; restored where the stack runs against
+# an in-process `httpx.MockTransport`.
+_REAL_ASYNC_REQUEST = httpx.AsyncClient.request
+
+
+def make_items(start, count):
+    return [f"com.example.{i}" for i in range(start, start + count)]
+
+
+def fake_extract(items, num=None):
+    apps = [AppOverview(app_id=item, title=item) for item in items or []]
+    return apps[:num] if num else apps
+
+
+class TestAsyncClientSearchPrefetch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+        self.events = []
+        # page token -> (items, next token)
+        self.pages = {
+            "T1": (make_items(10, 10), "T2"),
+            "T2": (make_items(20, 10), "T3"),
+            "T3": (make_items(30, 10), None),
+        }
+
+        def fake_apost(path, params=None, data=None):
+            # Logged when the request is issued, not when its coroutine first runs.
+            token = next(t for t in self.pages if t in data["f.req"])
+            self.events.append(f"post {token}")
+
+            async def respond():
+                await asyncio.sleep(0)
+                return token
+
+            return respond()
+
+        def split_page(response_text):
+            return self.pages[response_text]
+
+        def extract(items, num=None):
+            self.events.append(f"extract {items[0]}")
+            return fake_extract(items, num)
+
+        patches = [
+            patch("google_play_scraper.client.Requester.aget", new_callable=AsyncMock, return_value="<html>"),
+            patch("google_play_scraper.client.Requester.apost", new_callable=Mock, side_effect=fake_apost),
+            patch.object(GooglePlayClient, "_split_search_page", return_value=(make_items(0, 10), "T1")),
+            patch.object(GooglePlayClient, "_split_paginated_search_results", side_effect=split_page),
+            patch.object(GooglePlayClient, "_extract_search_results", side_effect=extract),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_next_page_is_requested_before_current_page_is_extracted(self):
+        results = await self.client.asearch("query", num=40)
+
+        self.assertEqual(len(results), 40)
+        self.assertEqual(
+            self.events,
+            [
+                "post T1", "extract com.example.0",
+                "post T2", "extract com.example.10",
+                "post T3", "extract com.example.20",
+                "extract com.example.30",
+            ],
+        )
+
+    async def test_does_not_prefetch_past_num(self):
+        results = await self.client.asearch("query", num=20)
+
+        self.assertEqual(len(results), 20)
+        self.assertNotIn("post T2", self.events)
+
+    async def test_stop_when_ends_paging_and_cancels_prefetch(self):
+        seen = []
+
+        def stop_when(results):
+            seen.append(len(results))
+            return len(results) >= 20
+
+        results = await self.client.asearch("query", num=100, stop_when=stop_when)
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(seen, [10, 20])
+        # T2 was prefetched while page T1 was being extracted, but T3 never was.
+        self.assertNotIn("post T3", self.events)
+
+    async def test_stop_when_results_are_not_cached(self):
+        from google_play_scraper.cache import ObjectCache
+
+        self.client._object_cache = ObjectCache()
+        await self.client.asearch("query", num=100, stop_when=lambda results: True)
+
+        self.assertEqual(len(self.client._object_cache), 0)
+
+
+class TestAsyncClientAbandonedPrefetch(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_search_abandons_prefetch(self):
+        started, completed = [], []
+
+        async def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, text="<html>")
+            started.append(request.url.params["rpcids"])
+            await asyncio.sleep(0.05)
+            completed.append(request.url.params["rpcids"])
+            return httpx.Response(200, text="")
+
+        # Coalescing stays on, so the prefetch runs as a shared single-flight task.
+        client = GooglePlayClient(async_transport=httpx.MockTransport(handler))
+        with patch.object(httpx.AsyncClient, "request", _REAL_ASYNC_REQUEST), \
+                patch.object(GooglePlayClient, "_split_search_page", return_value=(make_items(0, 10), "T1")), \
+                patch.object(GooglePlayClient, "_extract_search_results", side_effect=fake_extract):
+            search = asyncio.ensure_future(client.asearch("query", num=100))
+            while not started:
+                await asyncio.sleep(0.001)
+            search.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await search
+            await asyncio.sleep(0.1)
+
+        self.assertEqual(started, ["qnKhOb"])
+        self.assertEqual(completed, [])
+
+
+class ClientSearchStopWhenTest(unittest.TestCase):
+    @patch.object(GooglePlayClient, "_extract_search_results", side_effect=fake_extract)
+    @patch.object(GooglePlayClient, "_split_paginated_search_results")
+    @patch.object(GooglePlayClient, "_split_search_page")
+    @patch("google_play_scraper.client.Requester.post", return_value="batchexecute")
+    @patch("google_play_scraper.client.Requester.get", return_value="<html>")
+    def test_sync_search_honours_stop_when(self, _get, mock_post, mock_first, mock_next, _extract):
+        mock_first.return_value = (make_items(0, 10), "T1")
+        mock_next.side_effect = [(make_items(10, 10), "T2"), (make_items(20, 10), None)]
+
+        results = GooglePlayClient().search(
+            "query", num=100, stop_when=lambda results: results[-1].app_id == "com.example.19"
+        )
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(mock_post.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import AppNotFound
+from google_play_scraper.models import AppDetails
+
+SHARED = dict(app_id="com.a", developer="Dev", icon="https://example.com/icon.png", installs="1,000+")
+
+
+def fake_app(app_id, lang, country):
+    if country == "kp":
+        raise AppNotFound("not available")
+    if country == "de":
+        return AppDetails(**SHARED, title="Die App", price=1.99, currency="EUR", ratings=20)
+    return AppDetails(**SHARED, title="The App", price=1.99, currency="USD", ratings=100)
+
+
+class ClientAppLocalizedTest(unittest.TestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    @patch.object(GooglePlayClient, "app", side_effect=fake_app)
+    def test_stores_shared_fields_once_and_per_locale_deltas(self, mock_app):
+        result = self.client.app_localized(
+            "com.a", [("en", "us"), ("de", "de"), ("en", "gb"), ("en", "us")]
+        )
+
+        self.assertEqual(mock_app.call_count, 3)
+        self.assertEqual(result.base_locale, "en_us")
+        self.assertEqual(result.base.developer, "Dev")
+        self.assertEqual(result.locales, ["en_us", "de_de", "en_gb"])
+        self.assertEqual(result.deltas["en_us"], {})
+        self.assertEqual(result.deltas["en_gb"], {})
+        self.assertEqual(
+            result.deltas["de_de"], {"title": "Die App", "currency": "EUR", "ratings": 20}
+        )
+
+    @patch.object(GooglePlayClient, "app", side_effect=fake_app)
+    def test_for_locale_rebuilds_full_details(self, _):
+        result = self.client.app_localized("com.a", [("en", "us"), ("de", "de")])
+
+        german = result.for_locale("de", "de")
+
+        self.assertEqual(german, fake_app("com.a", "de", "de"))
+        with self.assertRaises(KeyError):
+            result.for_locale("fr", "fr")
+
+    @patch.object(GooglePlayClient, "app", side_effect=fake_app)
+    def test_failed_locales_are_reported(self, _):
+        result = self.client.app_localized("com.a", [("ko", "kp"), ("de", "de")])
+
+        self.assertEqual(result.base_locale, "de_de")
+        self.assertEqual(result.errors, {"ko_kp": "AppNotFound: not available"})
+
+    def test_empty_app_id_raises(self):
+        with self.assertRaises(ValueError):
+            self.client.app_localized("", [("en", "us")])
+
+
+class TestAsyncClientAppLocalized(unittest.IsolatedAsyncioTestCase):
+    async def test_aapp_localized_matches_sync_result(self):
+        async def fake_aapp(app_id, lang, country):
+            return fake_app(app_id, lang, country)
+
+        client = GooglePlayClient()
+        with patch.object(GooglePlayClient, "aapp", side_effect=fake_aapp):
+            result = await client.aapp_localized("com.a", [("de", "de"), ("en", "us"), ("ko", "kp")])
+
+        self.assertEqual(result.base_locale, "de_de")
+        self.assertEqual(result.deltas["en_us"]["title"], "The App")
+        self.assertIn("ko_kp", result.errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
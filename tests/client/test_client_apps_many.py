@@ -0,0 +1,78 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import AppNotFound
+from google_play_scraper.models import AppDetails
+
+
+def fake_details(app_id: str) -> AppDetails:
+    return AppDetails(app_id=app_id, title=f"Title {app_id}")
+
+
+class ClientAppsManyTest(unittest.TestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    @patch.object(GooglePlayClient, "app", autospec=True)
+    def test_yields_results_and_errors_without_aborting(self, mock_app):
+        def _app(_self, app_id, lang=None, country=None):
+            if app_id == "missing":
+                raise AppNotFound("nope")
+            return fake_details(app_id)
+
+        mock_app.side_effect = _app
+
+        results = dict(self.client.apps_many(["a", "missing", "b"], concurrency=2))
+
+        self.assertEqual(set(results), {"a", "missing", "b"})
+        self.assertEqual(results["a"].title, "Title a")
+        self.assertEqual(results["b"].title, "Title b")
+        self.assertIsInstance(results["missing"], AppNotFound)
+
+    @patch.object(GooglePlayClient, "app", autospec=True)
+    def test_passes_per_app_locale(self, mock_app):
+        mock_app.side_effect = lambda _self, app_id, lang=None, country=None: fake_details(
+            f"{app_id}:{lang}:{country}"
+        )
+
+        results = list(
+            self.client.apps_many(["a", ("b", "de", "at")], concurrency=1)
+        )
+
+        self.assertEqual(
+            sorted(details.app_id for _, details in results),
+            ["a:None:None", "b:de:at"],
+        )
+        self.assertEqual(sorted(app_id for app_id, _ in results), ["a", "b"])
+
+    @patch.object(GooglePlayClient, "app", autospec=True)
+    def test_concurrency_is_bounded(self, mock_app):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def _app(_self, app_id, lang=None, country=None):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return fake_details(app_id)
+
+        mock_app.side_effect = _app
+
+        results = list(self.client.apps_many([f"app{i}" for i in range(12)], concurrency=3))
+
+        self.assertEqual(len(results), 12)
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_invalid_concurrency_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            list(self.client.apps_many(["a"], concurrency=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
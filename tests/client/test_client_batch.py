@@ -0,0 +1,113 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import NetworkError
+
+
+def envelope(rpc_id, payload, identifier):
+    return ["wrb.fr", rpc_id, json.dumps(payload), None, None, None, identifier]
+
+
+def echo_response(form_data, payloads):
+    """Builds a chunked response answering every entry of `form_data` in order."""
+    entries = json.loads(form_data["f.req"])[0]
+    chunks = [")]}'", ""]
+    for (rpc_id, _, _, identifier), payload in zip(entries, payloads):
+        body = json.dumps([envelope(rpc_id, payload, identifier)])
+        chunks.extend([str(len(body)), body])
+    return "\n".join(chunks)
+
+
+class ClientBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_multiplexes_calls_into_one_post_and_routes_results(self, mock_post):
+        mock_post.side_effect = lambda path, params, data: echo_response(
+            data,
+            [
+                [[[["video editor"], ["video player"]]]],
+                [[[["music"]]]],
+                [[["R1", ["Bob"], 4, None, "ok", [1_600_000_000], 3]], [None, "NEXT"]],
+            ],
+        )
+
+        batch = self.client.batch()
+        first = batch.suggest("video")
+        second = batch.suggest("music")
+        third = batch.reviews("com.example", num=10)
+        results = batch.execute()
+
+        mock_post.assert_called_once()
+        _, kwargs = mock_post.call_args
+        self.assertEqual(kwargs["params"]["rpcids"], "IJ4APc,UsvDTd")
+        entries = json.loads(kwargs["data"]["f.req"])[0]
+        self.assertEqual([e[3] for e in entries], ["1", "2", "3"])
+
+        self.assertEqual(results[first], ["video editor", "video player"])
+        self.assertEqual(results[second], ["music"])
+        reviews, token = results[third]
+        self.assertEqual(token, "NEXT")
+        self.assertEqual(reviews[0].user_name, "Bob")
+        self.assertEqual(len(batch), 0)
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_splits_by_locale_and_max_size(self, mock_post):
+        mock_post.side_effect = lambda path, params, data: echo_response(data, [])
+
+        batch = self.client.batch(max_size=2)
+        for term in ("a", "b", "c"):
+            batch.suggest(term, lang="en", country="us")
+        batch.suggest("d", lang="de", country="de")
+        results = batch.execute()
+
+        self.assertEqual(mock_post.call_count, 3)
+        locales = [(c.kwargs["params"]["hl"], c.kwargs["params"]["gl"]) for c in mock_post.call_args_list]
+        self.assertEqual(locales, [("en", "us"), ("en", "us"), ("de", "de")])
+        # Missing envelopes fall back to the same empty result as single calls.
+        self.assertEqual(results, [[], [], [], []])
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_list_calls_carry_age_and_reuse_list_payload(self, mock_post):
+        mock_post.side_effect = lambda path, params, data: echo_response(data, [])
+
+        batch = self.client.batch()
+        batch.list(collection="topselling_paid", category="GAME", age="AGE_RANGE1", num=5)
+        batch.execute()
+
+        _, kwargs = mock_post.call_args
+        self.assertEqual(kwargs["params"]["age"], "AGE_RANGE1")
+        rpc_id, req_json, _, _ = json.loads(kwargs["data"]["f.req"])[0][0]
+        self.assertEqual(rpc_id, "vyAe2")
+        self.assertIn('[2,"topselling_paid","GAME"]', req_json)
+        self.assertIn("[20,5]", req_json)
+
+    @patch("google_play_scraper.client.Requester.post")
+    def test_failed_request_fills_its_calls_and_keeps_the_rest(self, mock_post):
+        def post(path, params, data):
+            if params["hl"] == "de":
+                raise NetworkError("boom")
+            return echo_response(data, [[[[["music"]]]]])
+
+        mock_post.side_effect = post
+
+        batch = self.client.batch()
+        batch.suggest("a", lang="de")
+        batch.suggest("b", lang="en")
+        batch.suggest("c", lang="de")
+        results = batch.execute()
+
+        self.assertIsInstance(results[0], NetworkError)
+        self.assertIs(results[0], results[2])
+        self.assertEqual(results[1], ["music"])
+
+    def test_invalid_max_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.client.batch(max_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
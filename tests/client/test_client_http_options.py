@@ -0,0 +1,68 @@
+import importlib.util
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from google_play_scraper.client import GooglePlayClient
+
+_REAL_SYNC_REQUEST = httpx.Client.request
+
+
+class ClientHttpOptionsTest(unittest.TestCase):
+    def test_limits_and_timeout_reach_both_clients(self):
+        limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+        client = GooglePlayClient(limits=limits, timeout=12.5)
+
+        for session in (client._requester._get_session(), client._requester._get_async_session()):
+            self.assertEqual(session._transport._pool._max_connections, 7)
+            self.assertEqual(session._transport._pool._max_keepalive_connections, 3)
+            self.assertEqual(session.timeout, httpx.Timeout(12.5))
+
+    def test_proxy_transports_share_pool_options(self):
+        limits = httpx.Limits(max_connections=4)
+        client = GooglePlayClient(proxies={"https": "http://localhost:8001"}, limits=limits)
+
+        mounted = [
+            transport for pattern, transport in client._requester._get_session()._mounts.items()
+            if pattern.pattern == "https://"
+        ]
+        self.assertEqual(mounted[0]._pool._max_connections, 4)
+
+    def test_injected_clients_are_used_as_is(self):
+        sync_client = httpx.Client()
+        async_client = httpx.AsyncClient()
+
+        client = GooglePlayClient(http_client=sync_client, async_http_client=async_client)
+
+        self.assertIs(client._requester._session, sync_client)
+        self.assertIs(client._requester._async_session, async_client)
+
+    def test_injected_transport_serves_requests(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, text="[]")
+
+        client = GooglePlayClient(transport=httpx.MockTransport(handler))
+        with patch.object(httpx.Client, "request", _REAL_SYNC_REQUEST):
+            client._requester.get("/store/apps/details", params={"id": "com.a"})
+
+        self.assertEqual(seen[0].url.params["id"], "com.a")
+        self.assertEqual(seen[0].url.params["hl"], "en")
+
+    @unittest.skipIf(importlib.util.find_spec("h2") is not None, "h2 is installed")
+    def test_http2_without_h2_points_to_extra(self):
+        with self.assertRaises(ImportError) as ctx:
+            GooglePlayClient(http2=True)
+        self.assertIn("[http2]", str(ctx.exception))
+
+    @unittest.skipIf(importlib.util.find_spec("h2") is None, "h2 is not installed")
+    def test_http2_enables_http2_pools(self):
+        client = GooglePlayClient(http2=True)
+        self.assertTrue(client._requester._get_session()._transport._pool._http2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.constants import Sort
+from google_play_scraper.models import Review
+
+BASE = datetime(2024, 1, 10, 12, 0, 0)
+
+
+def make_page(start: int, size: int) -> list[Review]:
+    # Newest first: review N is N hours older than BASE.
+    return [
+        Review(id=f"r{i}", user_name="u", score=5, date=BASE - timedelta(hours=i))
+        for i in range(start, start + size)
+    ]
+
+
+class ClientIterReviewsTest(unittest.TestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+    def _pages(self, mock_reviews, pages):
+        responses = iter(pages)
+        mock_reviews.side_effect = lambda *args, **kwargs: next(responses)
+
+    @patch.object(GooglePlayClient, "reviews")
+    def test_follows_tokens_until_exhausted(self, mock_reviews):
+        self._pages(mock_reviews, [(make_page(0, 2), "T1"), (make_page(2, 2), "T2"), (make_page(4, 1), None)])
+
+        ids = [r.id for r in self.client.iter_reviews("com.example", page_size=2)]
+
+        self.assertEqual(ids, ["r0", "r1", "r2", "r3", "r4"])
+        tokens = [c.args[5] for c in mock_reviews.call_args_list]
+        self.assertEqual(tokens, [None, "T1", "T2"])
+
+    @patch.object(GooglePlayClient, "reviews")
+    def test_limit_caps_results_and_last_page_size(self, mock_reviews):
+        self._pages(mock_reviews, [(make_page(0, 3), "T1"), (make_page(3, 2), "T2")])
+
+        ids = [r.id for r in self.client.iter_reviews("com.example", limit=5, page_size=3)]
+
+        self.assertEqual(ids, ["r0", "r1", "r2", "r3", "r4"])
+        self.assertEqual([c.args[4] for c in mock_reviews.call_args_list], [3, 2])
+
+    @patch.object(GooglePlayClient, "reviews")
+    def test_since_stops_at_first_older_review(self, mock_reviews):
+        self._pages(mock_reviews, [(make_page(0, 3), "T1"), (make_page(3, 3), "T2")])
+        since = BASE - timedelta(hours=3, minutes=30)
+
+        ids = [r.id for r in self.client.iter_reviews("com.example", since=since, page_size=3)]
+
+        self.assertEqual(ids, ["r0", "r1", "r2", "r3"])
+        self.assertEqual(mock_reviews.call_count, 2)
+
+    @patch.object(GooglePlayClient, "reviews")
+    def test_since_accepts_aware_datetime(self, mock_reviews):
+        self._pages(mock_reviews, [(make_page(0, 3), None)])
+        since = (BASE - timedelta(hours=1, minutes=30)).astimezone(timezone.utc)
+
+        ids = [r.id for r in self.client.iter_reviews("com.example", since=since)]
+
+        self.assertEqual(ids, ["r0", "r1"])
+
+    @patch.object(GooglePlayClient, "reviews")
+    def test_until_review_id_is_exclusive_watermark(self, mock_reviews):
+        self._pages(mock_reviews, [(make_page(0, 3), "T1"), (make_page(3, 3), "T2")])
+
+        ids = [r.id for r in self.client.iter_reviews("com.example", until_review_id="r4", page_size=3)]
+
+        self.assertEqual(ids, ["r0", "r1", "r2", "r3"])
+
+    def test_since_requires_newest_sort(self):
+        with self.assertRaises(ValueError):
+            next(self.client.iter_reviews("com.example", sort=Sort.RATING, since=BASE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from google_play_scraper.client import GooglePlayClient
+
+
+class ClientLifecycleTest(unittest.TestCase):
+    def test_sessions_are_created_on_first_use(self):
+        with patch("google_play_scraper.client.httpx.Client") as client_cls, \
+                patch("google_play_scraper.client.httpx.AsyncClient") as async_client_cls:
+            client = GooglePlayClient()
+            client_cls.assert_not_called()
+            async_client_cls.assert_not_called()
+
+            session = client._requester._get_session()
+            self.assertIs(client._requester._get_session(), session)
+
+        client_cls.assert_called_once()
+        async_client_cls.assert_not_called()
+
+    def test_ssl_context_is_shared_between_clients(self):
+        first = GooglePlayClient()._requester._get_session()
+        second = GooglePlayClient()._requester._get_session()
+
+        self.assertIs(
+            first._transport._pool._ssl_context, second._transport._pool._ssl_context
+        )
+
+    def test_with_block_closes_only_created_sessions(self):
+        with GooglePlayClient() as client:
+            session = client._requester._get_session()
+        self.assertTrue(session.is_closed)
+        self.assertIsNone(client._requester._async_session)
+
+    def test_injected_client_is_left_open(self):
+        injected = httpx.Client()
+        with GooglePlayClient(http_client=injected):
+            pass
+        self.assertFalse(injected.is_closed)
+        injected.close()
+
+    def test_closed_client_recreates_session_on_next_use(self):
+        client = GooglePlayClient()
+        first = client._requester._get_session()
+        client.close()
+
+        self.assertIsNot(client._requester._get_session(), first)
+
+
+class AsyncClientLifecycleTest(unittest.IsolatedAsyncioTestCase):
+    async def test_async_with_closes_created_sessions(self):
+        async with GooglePlayClient() as client:
+            session = client._requester._get_session()
+            async_session = client._requester._get_async_session()
+
+        self.assertTrue(session.is_closed)
+        self.assertTrue(async_session.is_closed)
+
+    async def test_async_with_without_use_creates_nothing(self):
+        with patch("google_play_scraper.client.httpx.AsyncClient") as async_client_cls:
+            async with GooglePlayClient():
+                pass
+        async_client_cls.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -125,11 +125,12 @@ class ClientListTest(unittest.TestCase):
     @patch("google_play_scraper.client.ElementSpec.extract", side_effect=Exception("boom"))
     @patch("google_play_scraper.client.ScriptDataParser.parse_batchexecute_response")
     @patch("google_play_scraper.client.Requester.post")
-    def test_extract_exception_returns_empty(self, mock_post, mock_parse, _mock_extract):
+    def test_extract_exception_propagates(self, mock_post, mock_parse, _mock_extract):
         mock_post.return_value = "OK"
         # Any non-empty value to reach the extract call
         mock_parse.return_value = [1]
-        self.assertEqual(self.client.list(), [])
+        with self.assertRaisesRegex(Exception, "boom"):
+            self.client.list()
 
     @patch("google_play_scraper.client.ScriptDataParser.parse_batchexecute_response")
     @patch("google_play_scraper.client.Requester.post")
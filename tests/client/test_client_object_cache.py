@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch, AsyncMock
+
+from google_play_scraper.cache import ObjectCache
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.models import AppDetails, AppOverview
+
+
+class ClientObjectCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ObjectCache()
+        self.client = GooglePlayClient(lang="en", country="us", object_cache=self.cache)
+
+    @patch.object(GooglePlayClient, "_parse_app_details")
+    @patch("google_play_scraper.client.Requester.get", return_value="<html>")
+    def test_app_is_parsed_once_per_locale(self, mock_get, mock_parse):
+        mock_parse.return_value = AppDetails(app_id="com.a", title="A")
+
+        first = self.client.app("com.a")
+        second = self.client.app("com.a", lang="en", country="us")
+        self.client.app("com.a", country="de")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_parse.call_count, 2)
+
+    @patch.object(GooglePlayClient, "_parse_app_details")
+    @patch("google_play_scraper.client.Requester.get", return_value="<html>")
+    def test_bypass_skips_object_cache(self, mock_get, mock_parse):
+        mock_parse.return_value = AppDetails(app_id="com.a", title="A")
+
+        self.client.app("com.a")
+        with self.client.bypass_cache():
+            self.client.app("com.a")
+
+        self.assertEqual(mock_parse.call_count, 2)
+
+    @patch.object(GooglePlayClient, "_search_with_pagination")
+    @patch("google_play_scraper.client.Requester.get", return_value="<html>")
+    def test_search_results_are_cached_by_query(self, mock_get, mock_search):
+        mock_search.return_value = [AppOverview(app_id="com.a", title="A")]
+
+        self.client.search("todo", num=10)
+        cached = self.client.search("todo", num=10)
+        self.client.search("todo", num=10, price="free")
+
+        self.assertEqual([a.app_id for a in cached], ["com.a"])
+        self.assertEqual(mock_search.call_count, 2)
+
+
+class AsyncClientObjectCacheTest(unittest.IsolatedAsyncioTestCase):
+    @patch.object(GooglePlayClient, "_parse_app_details")
+    @patch("google_play_scraper.client.Requester.aget", new_callable=AsyncMock, return_value="<html>")
+    async def test_aapp_shares_cache_with_app(self, mock_aget, mock_parse):
+        mock_parse.return_value = AppDetails(app_id="com.a", title="A")
+        client = GooglePlayClient(object_cache=ObjectCache())
+
+        with patch("google_play_scraper.client.Requester.get", return_value="<html>"):
+            client.app("com.a")
+        result = await client.aapp("com.a")
+
+        self.assertEqual(result.title, "A")
+        mock_aget.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
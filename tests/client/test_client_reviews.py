@@ -96,6 +96,28 @@ class ClientReviewsTest(unittest.TestCase):
         self.assertEqual(r.thumbs_up, 42)
         self.assertEqual(r.version, "1.2.3")
 
+    @patch("google_play_scraper.client.ScriptDataParser.parse_batchexecute_response")
+    @patch("google_play_scraper.client.Requester.post")
+    def test_validate_false_builds_same_reviews_without_validation(self, mock_post, mock_parse):
+        raw = [None] * 11
+        raw[0] = "RID_1"
+        raw[1] = ["Alice", [None, None, None, [None, None, "https://img.test/user.png"]]]
+        raw[2] = 4
+        raw[5] = [1_600_000_000]
+        mock_parse.return_value = [[raw], None]
+
+        client = GooglePlayClient(validate=False)
+        with patch("google_play_scraper.client.Review.__init__") as validated_init:
+            reviews, _ = client.reviews(app_id="com.example")
+        validated_init.assert_not_called()
+
+        r = reviews[0]
+        self.assertEqual(r.id, "RID_1")
+        self.assertEqual(r.score, 4)
+        self.assertEqual(r.thumbs_up, 0)
+        self.assertEqual(r.user_image, "https://img.test/user.png")
+        self.assertEqual(r.date, datetime.fromtimestamp(1_600_000_000))
+
     @patch("google_play_scraper.client.ScriptDataParser.parse_batchexecute_response")
     @patch("google_play_scraper.client.Requester.post")
     def test_edge_empty_parsed_data(self, mock_post, mock_parse):
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import NetworkError
+from google_play_scraper.models import SearchRankings
+
+
+def raw_item(app_id):
+    item = [None] * 13
+    item[2] = f"Title {app_id}"
+    item[12] = [app_id]
+    return item
+
+
+PAGES = {
+    "chess": [raw_item("com.chess"), raw_item("com.lichess"), raw_item("com.shared")],
+    "puzzle": [raw_item("com.shared"), raw_item("com.sudoku")],
+}
+
+
+class TestClientSearchMany(unittest.TestCase):
+    def setUp(self):
+        self.client = GooglePlayClient()
+
+        def fake_get(path, params=None, **kwargs):
+            if params["q"] == "broken":
+                raise NetworkError("Network error: boom")
+            return params["q"]
+
+        patches = [
+            patch("google_play_scraper.client.Requester.get", side_effect=fake_get),
+            patch.object(
+                GooglePlayClient, "_split_search_page", side_effect=lambda html: (PAGES[html], None)
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_rankings_are_per_term_and_apps_are_deduplicated(self):
+        result = self.client.search_many(["chess", "puzzle"], num=10)
+
+        self.assertIsInstance(result, SearchRankings)
+        self.assertEqual(result.rankings["chess"], ["com.chess", "com.lichess", "com.shared"])
+        self.assertEqual(result.rankings["puzzle"], ["com.shared", "com.sudoku"])
+        self.assertEqual(
+            sorted(result.apps), ["com.chess", "com.lichess", "com.shared", "com.sudoku"]
+        )
+        self.assertEqual(result.apps["com.shared"].title, "Title com.shared")
+        self.assertEqual([app.app_id for app in result.results("puzzle")], ["com.shared", "com.sudoku"])
+
+    def test_each_app_is_built_once(self):
+        with patch.object(
+            GooglePlayClient, "_build_model", autospec=True, side_effect=GooglePlayClient._build_model
+        ) as mock_build:
+            self.client.search_many(["chess", "puzzle", "chess"], num=10, concurrency=2)
+
+        self.assertEqual(mock_build.call_count, 4)
+
+    def test_num_limits_each_term(self):
+        result = self.client.search_many(["chess"], num=2)
+
+        self.assertEqual(result.rankings["chess"], ["com.chess", "com.lichess"])
+        self.assertNotIn("com.shared", result.apps)
+
+    def test_failed_term_is_reported_in_errors(self):
+        result = self.client.search_many(["chess", "broken"], num=10)
+
+        self.assertIn("chess", result.rankings)
+        self.assertNotIn("broken", result.rankings)
+        self.assertEqual(result.errors["broken"], "NetworkError: Network error: boom")
+
+
+if __name__ == "__main__":
+    unittest.main()
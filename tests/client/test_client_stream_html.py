@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import AppNotFound
+
+DATA_MAP = {"ds:5": [None, [None, None, ["root"]]]}
+
+
+class TestClientStreamHtml(unittest.TestCase):
+    @patch.object(GooglePlayClient, "_app_details_from", return_value="details")
+    @patch("google_play_scraper.client.Requester.get")
+    @patch("google_play_scraper.client.Requester.get_script_data", return_value=DATA_MAP)
+    def test_app_streams_only_the_details_block(self, mock_scan, mock_get, mock_build):
+        client = GooglePlayClient(stream_html=True)
+
+        details = client.app("com.example.app", lang="de", country="de")
+
+        self.assertEqual(details, "details")
+        mock_build.assert_called_once_with(DATA_MAP, "com.example.app")
+        mock_get.assert_not_called()
+        args, kwargs = mock_scan.call_args
+        self.assertEqual(args, ("/store/apps/details", frozenset({"ds:5"})))
+        self.assertEqual(kwargs["params"], {"id": "com.example.app", "hl": "de", "gl": "de"})
+
+    @patch("google_play_scraper.client.Requester.get_script_data", return_value={})
+    def test_missing_block_raises_app_not_found(self, _scan):
+        with self.assertRaises(AppNotFound):
+            GooglePlayClient(stream_html=True).app("com.example.app")
+
+
+class TestAsyncClientStreamHtml(unittest.IsolatedAsyncioTestCase):
+    @patch.object(GooglePlayClient, "_app_details_from", return_value="details")
+    @patch(
+        "google_play_scraper.client.Requester.aget_script_data",
+        new_callable=AsyncMock,
+        return_value=DATA_MAP,
+    )
+    async def test_aapp_streams_only_the_details_block(self, mock_scan, mock_build):
+        details = await GooglePlayClient(stream_html=True).aapp("com.example.app")
+
+        self.assertEqual(details, "details")
+        mock_scan.assert_awaited_once()
+        mock_build.assert_called_once_with(DATA_MAP, "com.example.app")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import asyncio
+import itertools
+import unittest
+
+from google_play_scraper.internal.concurrency import abounded_map, bounded_map
+
+
+class BoundedMapTest(unittest.TestCase):
+    def test_pulls_items_lazily(self):
+        consumed = []
+
+        def _items():
+            for i in itertools.count():
+                consumed.append(i)
+                yield i
+
+        gen = bounded_map(lambda x: x * 2, _items(), limit=2)
+        item, result = next(gen)
+        gen.close()
+
+        self.assertEqual(result, item * 2)
+        self.assertLess(len(consumed), 10)
+
+    def test_exception_is_yielded_in_place_of_result(self):
+        def _boom(x):
+            raise RuntimeError(str(x))
+
+        [(item, result)] = list(bounded_map(_boom, [1], limit=1))
+        self.assertEqual(item, 1)
+        self.assertIsInstance(result, RuntimeError)
+
+
+class AsyncBoundedMapTest(unittest.IsolatedAsyncioTestCase):
+    async def test_exception_is_yielded_in_place_of_result(self):
+        async def _maybe_fail(x):
+            await asyncio.sleep(0)
+            if x == 2:
+                raise RuntimeError("boom")
+            return x
+
+        results = dict([pair async for pair in abounded_map(_maybe_fail, [1, 2, 3], limit=2)])
+        self.assertEqual(results[1], 1)
+        self.assertEqual(results[3], 3)
+        self.assertIsInstance(results[2], RuntimeError)
+
+    async def test_invalid_limit_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            async for _ in abounded_map(asyncio.sleep, [1], limit=0):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
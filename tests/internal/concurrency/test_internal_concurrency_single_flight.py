@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from google_play_scraper.internal.concurrency import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_concurrent_threads_share_one_call(self):
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            leader = pool.submit(flights.do, "k", work)
+            started.wait(5)
+            followers = [pool.submit(flights.do, "k", work) for _ in range(4)]
+            # Give followers time to join the in-flight call before releasing it.
+            threading.Event().wait(0.05)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+
+    def test_exception_is_shared_and_key_is_released(self):
+        flights = SingleFlight()
+
+        with self.assertRaises(KeyError):
+            flights.do("k", lambda: {}["missing"])
+        self.assertEqual(flights.do("k", lambda: 2), 2)
+
+    def test_sequential_calls_are_not_cached(self):
+        flights = SingleFlight()
+        counter = iter(range(10))
+
+        self.assertEqual(flights.do("k", lambda: next(counter)), 0)
+        self.assertEqual(flights.do("k", lambda: next(counter)), 1)
+
+
+class AsyncSingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_coroutines_share_one_call(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flights.ado("k", work) for _ in range(30)))
+
+        self.assertEqual(results, ["result"] * 30)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((flights._tasks, flights._waiters), ({}, {}))
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "result"
+
+        first = asyncio.ensure_future(flights.ado("k", work))
+        second = asyncio.ensure_future(flights.ado("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "result")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_call_is_cancelled_when_every_waiter_is(self):
+        flights = SingleFlight()
+        finished = []
+
+        async def work():
+            await asyncio.sleep(10)
+            finished.append(1)
+
+        waiters = [asyncio.ensure_future(flights.ado("k", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        [task] = flights._tasks.values()
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        self.assertTrue(task.cancelled())
+        self.assertEqual(finished, [])
+        self.assertEqual((flights._tasks, flights._waiters), ({}, {}))
+
+    async def test_exception_propagates_to_all_waiters(self):
+        flights = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.ado("k", work), flights.ado("k", work), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from google_play_scraper.internal.extractor import (
+    ElementSpec,
+    ExtractionPlan,
+    extract_from_spec,
+)
+
+
+class ExtractionPlanTest(unittest.TestCase):
+
+    def assert_matches_extract_from_spec(self, specs, source):
+        self.assertEqual(ExtractionPlan(specs).extract(source), extract_from_spec(source, specs))
+
+    def test_shared_prefixes_match_per_spec_extraction(self):
+        source = [None, [[10, "USD", "$1.99"], ["x"]], {"k": [1, 2]}]
+        specs = {
+            "price": ElementSpec([1, 0, 0], transformer=lambda v: v / 10),
+            "currency": ElementSpec([1, 0, 1]),
+            "text": ElementSpec([1, 0, 2]),
+            "other": ElementSpec([1, 1, 0]),
+            "dict": ElementSpec([2, "k", 1]),
+            "last": ElementSpec([1, -1, 0]),
+            "missing": ElementSpec([1, 5, 0]),
+            "through_none": ElementSpec([0, 1]),
+        }
+        result = ExtractionPlan(specs).extract(source)
+
+        self.assertEqual(result["price"], 1.0)
+        self.assertEqual(result["currency"], "USD")
+        self.assertEqual(result["dict"], 2)
+        self.assertEqual(result["last"], "x")
+        self.assertIsNone(result["missing"])
+        self.assertIsNone(result["through_none"])
+        self.assert_matches_extract_from_spec(specs, source)
+
+    def test_same_path_with_different_transformers(self):
+        specs = {
+            "raw": ElementSpec([0]),
+            "doubled": ElementSpec([0], transformer=lambda v: v * 2),
+        }
+        self.assertEqual(ExtractionPlan(specs).extract([4]), {"raw": 4, "doubled": 8})
+
+    def test_wrong_container_types_and_unknown_segments_return_none(self):
+        class Weird:
+            pass
+
+        specs = {
+            "str_on_list": ElementSpec(["a"]),
+            "int_on_dict": ElementSpec([0]),
+            "weird": ElementSpec([Weird()]),  # type: ignore[list-item]
+            "negative_out_of_range": ElementSpec([-5]),
+        }
+        for source in ({"a": 1}, [1, 2], None):
+            with self.subTest(source=source):
+                self.assert_matches_extract_from_spec(specs, source)
+
+    def test_transformer_exception_is_swallowed(self):
+        def boom(_):
+            raise ValueError("boom")
+
+        self.assertEqual(ExtractionPlan({"x": ElementSpec([0], transformer=boom)}).extract([1]), {"x": None})
+
+    def test_fallback_only_used_when_primary_is_missing(self):
+        specs = {
+            "value": ElementSpec(
+                ["primary"], transformer=lambda v: None, fallback_path=["alt"]
+            ),
+            "fallback": ElementSpec(["missing"], fallback_path=["alt"]),
+        }
+        source = {"primary": 1, "alt": 2}
+        self.assertEqual(ExtractionPlan(specs).extract(source), {"value": None, "fallback": 2})
+        self.assert_matches_extract_from_spec(specs, source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import importlib.util
+import json
+import unittest
+
+from google_play_scraper.internal import jsonlib
+from google_play_scraper.internal.parser import ScriptDataParser
+
+INSTALLED = [
+    name for name in jsonlib.BACKENDS
+    if name == "stdlib" or importlib.util.find_spec(name) is not None
+]
+
+BATCHEXECUTE = ")]}'\n\n" + "\n".join([
+    "42",
+    json.dumps([["wrb.fr", "UsvDTd", json.dumps([[["R1", "ünï", 4]], [None, "NEXT"]]), None, None, None, "1"]]),
+    "25",
+    json.dumps([["di", 42], ["af.httprm", 41, "1", 7]]),
+])
+
+
+class JsonlibTest(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(jsonlib.use, jsonlib.backend)
+
+    def test_default_is_fastest_installed_backend(self):
+        self.assertEqual(jsonlib.use(), INSTALLED[0])
+
+    def test_every_installed_backend_parses_the_same(self):
+        expected = [[["R1", "ünï", 4]], [None, "NEXT"]]
+        for name in INSTALLED:
+            with self.subTest(backend=name):
+                self.assertEqual(jsonlib.use(name), name)
+                self.assertEqual(jsonlib.backend, name)
+                self.assertEqual(ScriptDataParser.parse_batchexecute_response(BATCHEXECUTE), expected)
+                with self.assertRaises(jsonlib.DecodeError):
+                    jsonlib.loads("[1,")
+
+    def test_lone_surrogate_falls_back_to_stdlib(self):
+        html = (
+            "<script>AF_initDataCallback({key: 'ds:5', data:"
+            '[["com.example", "Emoji \\ud83d cut off"]], sideChannel: {}});</script>'
+        )
+        for name in INSTALLED:
+            with self.subTest(backend=name):
+                jsonlib.use(name)
+                self.assertEqual(jsonlib.loads('"\\ud83d"'), "\ud83d")
+                self.assertEqual(
+                    ScriptDataParser.parse(html, keys={"ds:5"})["ds:5"],
+                    [["com.example", "Emoji \ud83d cut off"]],
+                )
+
+    def test_unknown_backend_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            jsonlib.use("simdjson")
+
+    def test_missing_backend_raises_import_error(self):
+        missing = [name for name in jsonlib.BACKENDS if name not in INSTALLED]
+        if not missing:
+            self.skipTest("every backend is installed")
+        with self.assertRaises(ImportError):
+            jsonlib.use(missing[0])
+        self.assertIn(jsonlib.backend, INSTALLED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.internal.parser import BatchexecuteDecoder, ScriptDataParser
+
+
+def envelope(rpc_id, payload, identifier):
+    return ["wrb.fr", rpc_id, json.dumps(payload, ensure_ascii=False), None, None, None, identifier]
+
+
+def frame(document, extra=1):
+    body = json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+    # Length in UTF-16 code units, counted from the line break after the digits.
+    return f"{len(body.encode('utf-16-le')) // 2 + extra}\n{body}\n"
+
+
+DOCUMENTS = [
+    [envelope("vyAe2", [["ünïcødé", "😀 emoji", "中文"]], "1")],
+    [envelope("IJ4APc", [["𝄞 music"]], "2"), envelope("UsvDTd", [[1, 2, 3]], "3")],
+    [["di", 42], ["af.httprm", 41, "-1234567890", 7]],
+    [["e", 4, None, None, 1234]],
+]
+RESPONSE = ")]}'\n\n" + "".join(frame(document) for document in DOCUMENTS)
+
+
+def decode(chunks):
+    decoder = BatchexecuteDecoder()
+    documents = []
+    for chunk in chunks:
+        documents.extend(decoder.feed(chunk))
+    return documents + decoder.close()
+
+
+class BatchexecuteDecoderTest(unittest.TestCase):
+    def test_decodes_every_frame_by_length(self):
+        with patch.object(ScriptDataParser, "_iter_chunks") as lines:
+            self.assertEqual(decode([RESPONSE]), DOCUMENTS)
+        lines.assert_not_called()
+
+    def test_any_text_chunking_gives_the_same_documents(self):
+        for size in (1, 2, 5, 17, 64):
+            with self.subTest(size=size):
+                chunks = [RESPONSE[i:i + size] for i in range(0, len(RESPONSE), size)]
+                self.assertEqual(decode(chunks), DOCUMENTS)
+
+    def test_byte_chunks_split_inside_characters(self):
+        data = RESPONSE.encode("utf-8")
+        for size in (1, 3, 7):
+            with self.subTest(size=size):
+                self.assertEqual(decode([data[i:i + size] for i in range(0, len(data), size)]), DOCUMENTS)
+
+    def test_frames_are_returned_as_soon_as_they_are_complete(self):
+        decoder = BatchexecuteDecoder()
+        first = ")]}'\n\n" + frame(DOCUMENTS[0])
+
+        self.assertEqual(decoder.feed(first), [DOCUMENTS[0]])
+        self.assertEqual(decoder.feed(frame(DOCUMENTS[1])[:10]), [])
+        self.assertEqual(decoder.feed(frame(DOCUMENTS[1])[10:]), [DOCUMENTS[1]])
+        self.assertEqual(decoder.close(), [])
+
+    def test_lengths_counted_without_the_line_break(self):
+        response = ")]}'\n\n" + "".join(frame(document, extra=0) for document in DOCUMENTS)
+        self.assertEqual(decode([response]), DOCUMENTS)
+
+    def test_unframed_document(self):
+        self.assertEqual(decode([")]}'\n", json.dumps(DOCUMENTS[1])]), [DOCUMENTS[1]])
+
+    def test_wrong_lengths_fall_back_to_lines(self):
+        response = "\n".join(["3", json.dumps(DOCUMENTS[0]), "999", json.dumps(DOCUMENTS[2])])
+        self.assertEqual(decode([response]), [DOCUMENTS[0], DOCUMENTS[2]])
+
+    def test_truncated_frame_falls_back_on_close(self):
+        self.assertEqual(decode([RESPONSE[:-20]]), DOCUMENTS[:3])
+
+
+class ParseBatchexecuteFramesTest(unittest.TestCase):
+    def test_envelopes_from_every_frame(self):
+        envelopes = ScriptDataParser.parse_batchexecute_envelopes(RESPONSE)
+        self.assertEqual([e[6] for e in envelopes], ["1", "2", "3"])
+
+    def test_response_payload_of_first_envelope(self):
+        self.assertEqual(
+            ScriptDataParser.parse_batchexecute_response(RESPONSE), [["ünïcødé", "😀 emoji", "中文"]]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import unittest
+
+from google_play_scraper.internal.parser import ScriptDataParser
+
+
+def envelope(rpc_id, payload, identifier=None):
+    env = ["wrb.fr", rpc_id, json.dumps(payload), None, None, None]
+    if identifier is not None:
+        env.append(identifier)
+    return env
+
+
+class ScriptDataParserDemultiplexTest(unittest.TestCase):
+
+    def test_clean_json_with_multiple_envelopes(self):
+        text = ")]}'\n" + json.dumps([
+            envelope("IJ4APc", [1], "1"),
+            envelope("UsvDTd", [2], "2"),
+            ["di", 42],
+        ])
+
+        self.assertEqual(
+            ScriptDataParser.demultiplex_batchexecute_response(text),
+            {"1": [1], "2": [2]},
+        )
+
+    def test_chunked_response_collects_envelopes_from_every_chunk(self):
+        text = "\n".join([
+            ")]}'",
+            "",
+            "50",
+            json.dumps([envelope("IJ4APc", ["a"], "1")]),
+            "50",
+            json.dumps([envelope("IJ4APc", ["b"], "2")]),
+            "25",
+            json.dumps([["di", 42], ["af.httprm", 41, "x", 1]]),
+        ])
+
+        envelopes = ScriptDataParser.parse_batchexecute_envelopes(text)
+        self.assertEqual(len(envelopes), 2)
+        self.assertEqual(
+            ScriptDataParser.demultiplex_batchexecute_response(text),
+            {"1": ["a"], "2": ["b"]},
+        )
+
+    def test_envelope_without_identifier_is_keyed_by_rpc_id(self):
+        text = json.dumps([envelope("vyAe2", [3])])
+        self.assertEqual(
+            ScriptDataParser.demultiplex_batchexecute_response(text), {"vyAe2": [3]}
+        )
+
+    def test_garbage_returns_empty(self):
+        self.assertEqual(ScriptDataParser.demultiplex_batchexecute_response("nope"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
+from unittest.mock import patch
 
+from google_play_scraper.internal import jsonlib
 from google_play_scraper.internal.parser import ScriptDataParser
 
 
@@ -50,6 +52,31 @@ class ScriptDataParserParseTest(unittest.TestCase):
         result = ScriptDataParser.parse(html)
         self.assertEqual(result, {"ds:2": [10, 20]})
 
+    def test_parse_with_keys_only_decodes_requested_blocks(self):
+        html = (
+            "<script>AF_initDataCallback({key: 'ds:1', data: [1], sideChannel: {}});</script>"
+            "<script>AF_initDataCallback({key: 'ds:5', data: [5], sideChannel: {}});</script>"
+            "<script>AF_initDataCallback({key: 'ds:7', data: [7], sideChannel: {}});</script>"
+        )
+
+        with patch.object(jsonlib, "loads", wraps=jsonlib.loads) as loads:
+            result = ScriptDataParser.parse(html, keys={"ds:5"})
+
+        self.assertEqual(result, {"ds:5": [5]})
+        # Only the requested block is decoded, and scanning stops once it is found.
+        loads.assert_called_once_with(" [5]")
+
+    def test_parse_with_missing_key_returns_what_was_found(self):
+        html = "<script>AF_initDataCallback({key: 'ds:1', data: [1], sideChannel: {}});</script>"
+        self.assertEqual(ScriptDataParser.parse(html, keys={"ds:5", "ds:1"}), {"ds:1": [1]})
+
+    def test_parse_ignores_unterminated_block(self):
+        html = (
+            "<script>AF_initDataCallback({key: 'ds:2', data: [2], sideChannel: {}});</script>"
+            "<script>AF_initDataCallback({key: 'ds:3', data: [3"
+        )
+        self.assertEqual(ScriptDataParser.parse(html), {"ds:2": [2]})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from google_play_scraper.internal.parser import ScriptDataParser, ScriptDataScanner
+
+HTML = (
+    "<html><head><script>var x = 1;</script>"
+    "<script>AF_initDataCallback({key: 'ds:1', data: [1, \"</scrip\"], sideChannel: {}});</script>"
+    "<script>AF_initDataCallback({key: 'ds:5', data: [[5, {\"a\": \"b\"}], null], sideChannel: {}});</script>"
+    "<script>AF_initDataCallback({key: 'ds:7', data: [7], sideChannel: {}});</script>"
+    "</head><body>" + "x" * 200 + "</body></html>"
+)
+
+
+def chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class ScriptDataScannerTest(unittest.TestCase):
+    def test_matches_parse_for_any_chunk_size(self):
+        expected = ScriptDataParser.parse(HTML, keys={"ds:5", "ds:7"})
+        for size in (1, 2, 3, 7, 16, 64, len(HTML)):
+            with self.subTest(size=size):
+                scanner = ScriptDataScanner({"ds:5", "ds:7"})
+                for chunk in chunks(HTML, size):
+                    scanner.feed(chunk)
+                self.assertEqual(scanner.data_map, expected)
+
+    def test_reports_done_as_soon_as_keys_are_found(self):
+        scanner = ScriptDataScanner({"ds:5"})
+        parts = chunks(HTML, 10)
+        fed = 0
+        for chunk in parts:
+            fed += 1
+            if scanner.feed(chunk):
+                break
+
+        self.assertTrue(scanner.done)
+        self.assertEqual(scanner.data_map, {"ds:5": [[5, {"a": "b"}], None]})
+        self.assertLess(fed, len(parts))
+        # Further input is ignored once done.
+        self.assertTrue(scanner.feed("<script>AF_initDataCallback"))
+
+    def test_missing_key_is_never_done(self):
+        scanner = ScriptDataScanner({"ds:9"})
+        for chunk in chunks(HTML, 13):
+            self.assertFalse(scanner.feed(chunk))
+        self.assertEqual(scanner.data_map, {})
+
+    def test_requires_keys(self):
+        with self.assertRaises(ValueError):
+            ScriptDataScanner(set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import httpx
+
+from google_play_scraper.exceptions import QuotaExceeded
+from google_play_scraper.internal.request import Requester, _parse_retry_after
+from google_play_scraper.ratelimit import AdaptiveRateLimiter
+
+
+def _response(status=200, headers=None):
+    request = httpx.Request("GET", "https://example.test")
+    return httpx.Response(status, request=request, headers=headers, text="OK")
+
+
+@patch("google_play_scraper.ratelimit.time.sleep")
+class RequesterAdaptiveThrottleTest(unittest.TestCase):
+    def _requester(self, responses):
+        session = Mock(spec=httpx.Client)
+        session.request.side_effect = responses
+        return Requester(session, 4, "en", "us", adaptive_throttle=True, coalesce=False)
+
+    def test_429_lowers_rate_and_exposes_retry_after(self, _sleep):
+        requester = self._requester([_response(429, {"Retry-After": "7"})])
+        self.assertIsInstance(requester._limiter, AdaptiveRateLimiter)
+
+        with self.assertRaises(QuotaExceeded) as ctx:
+            requester.get("/p")
+
+        self.assertEqual(ctx.exception.retry_after, 7.0)
+        self.assertEqual(requester.effective_rate, 2.0)
+
+    def test_adaptive_without_throttle_raises(self, _sleep):
+        with self.assertRaises(ValueError):
+            Requester(Mock(spec=httpx.Client), None, "en", "us", adaptive_throttle=True)
+
+    def test_adaptive_with_rate_limiter_raises(self, _sleep):
+        with self.assertRaises(ValueError):
+            Requester(
+                Mock(spec=httpx.Client), None, "en", "us",
+                rate_limiter=AdaptiveRateLimiter(4), adaptive_throttle=True,
+            )
+
+    def test_success_raises_rate(self, _sleep):
+        requester = self._requester([_response(), _response()])
+
+        requester.get("/p")
+        requester.get("/p")
+
+        self.assertGreater(requester.effective_rate, 4)
+
+    def test_fixed_throttle_ignores_feedback(self, _sleep):
+        session = Mock(spec=httpx.Client)
+        session.request.return_value = _response(503)
+        requester = Requester(session, 4, "en", "us")
+
+        with self.assertRaises(QuotaExceeded) as ctx:
+            requester.get("/p")
+
+        self.assertIsNone(ctx.exception.retry_after)
+        self.assertEqual(requester.effective_rate, 4)
+
+    def test_unthrottled_has_no_effective_rate(self, _sleep):
+        self.assertIsNone(Requester(Mock(spec=httpx.Client), None, "en", "us").effective_rate)
+
+
+class ParseRetryAfterTest(unittest.TestCase):
+    def test_seconds_and_http_date(self):
+        self.assertEqual(_parse_retry_after("120"), 120.0)
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after("soon"))
+        with patch("google_play_scraper.internal.request.time.time", return_value=784111727.0):
+            self.assertEqual(_parse_retry_after("Sun, 06 Nov 1994 08:49:47 GMT"), 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from google_play_scraper.cache import MemoryCache
+from google_play_scraper.exceptions import AppNotFound
+from google_play_scraper.internal.request import Requester
+
+
+def _response(text="OK", status=200):
+    response = Mock()
+    response.text = text
+    if status >= 400:
+        error = httpx.HTTPStatusError("err", request=Mock(), response=Mock(status_code=status))
+        response.raise_for_status.side_effect = error
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+class RequesterCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.session = Mock(spec=httpx.Client)
+        self.cache = MemoryCache()
+
+    def _requester(self, **kwargs):
+        return Requester(self.session, None, "en", "us", cache=self.cache, **kwargs)
+
+    @patch.object(Requester, "_wait_for_throttle", autospec=True)
+    def test_hit_skips_network_and_throttle(self, wait_mock):
+        self.session.request.return_value = _response("BODY")
+        requester = self._requester()
+
+        first = requester.get("/store/apps/details", params={"id": "a"})
+        second = requester.get("/store/apps/details", params={"id": "a", "hl": None})
+
+        self.assertEqual((first, second), ("BODY", "BODY"))
+        self.assertEqual(self.session.request.call_count, 1)
+        self.assertEqual(wait_mock.call_count, 1)
+        self.assertEqual((self.cache.stats.hits, self.cache.stats.misses), (1, 1))
+
+    def test_different_locale_is_a_different_entry(self):
+        self.session.request.return_value = _response()
+        requester = self._requester()
+
+        requester.get("/store/apps/details", params={"id": "a"})
+        requester.get("/store/apps/details", params={"id": "a", "gl": "de"})
+
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_bypass_refreshes_entry(self):
+        self.session.request.side_effect = [_response("old"), _response("new")]
+        requester = self._requester()
+
+        requester.get("/store/apps/details", params={"id": "a"})
+        with requester.bypass_cache():
+            self.assertEqual(requester.get("/store/apps/details", params={"id": "a"}), "new")
+        self.assertEqual(requester.get("/store/apps/details", params={"id": "a"}), "new")
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_bypass_is_scoped_to_one_requester(self):
+        self.session.request.return_value = _response()
+        requester, other = self._requester(), self._requester()
+
+        with requester.bypass_cache():
+            self.assertTrue(requester.bypassing_cache)
+            self.assertFalse(other.bypassing_cache)
+        self.assertFalse(requester.bypassing_cache)
+
+    def test_zero_ttl_endpoint_is_not_cached(self):
+        self.session.request.return_value = _response()
+        requester = self._requester(cache_ttls={"/store/apps/details": 0})
+
+        requester.get("/store/apps/details", params={"id": "a"})
+        requester.get("/store/apps/details", params={"id": "a"})
+
+        self.assertEqual(self.session.request.call_count, 2)
+        self.assertEqual(self.cache.stats.misses, 0)
+
+    def test_errors_are_not_cached(self):
+        self.session.request.side_effect = [_response(status=404), _response("BODY")]
+        requester = self._requester()
+
+        with self.assertRaises(AppNotFound):
+            requester.get("/store/apps/details", params={"id": "a"})
+        self.assertEqual(requester.get("/store/apps/details", params={"id": "a"}), "BODY")
+
+
+class AsyncRequesterCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_async_hit_shares_cache_with_sync(self):
+        session = Mock(spec=httpx.Client)
+        session.request.return_value = _response("BODY")
+        async_session = Mock(spec=httpx.AsyncClient)
+        async_session.request = AsyncMock()
+        requester = Requester(
+            session, None, "en", "us", async_session=async_session, cache=MemoryCache()
+        )
+
+        requester.post("/_/PlayStoreUi/data/batchexecute", params={"rpcids": "IJ4APc"}, data={"f.req": "x"})
+        result = await requester.apost(
+            "/_/PlayStoreUi/data/batchexecute", params={"rpcids": "IJ4APc"}, data={"f.req": "x"}
+        )
+
+        self.assertEqual(result, "BODY")
+        async_session.request.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+import httpx
+
+from google_play_scraper.exceptions import QuotaExceeded
+from google_play_scraper.internal.request import Requester
+
+
+def _response(text="OK", status=200):
+    response = Mock()
+    response.text = text
+    if status >= 400:
+        error = httpx.HTTPStatusError("err", request=Mock(), response=Mock(status_code=status))
+        response.raise_for_status.side_effect = error
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+class AsyncRequesterCoalesceTest(unittest.IsolatedAsyncioTestCase):
+    def _requester(self, send, coalesce=True):
+        async_session = Mock(spec=httpx.AsyncClient)
+        async_session.request = send
+        return Requester(
+            Mock(spec=httpx.Client), None, "en", "us",
+            async_session=async_session, coalesce=coalesce,
+        ), async_session
+
+    async def test_identical_concurrent_requests_share_one_round_trip(self):
+        calls = []
+
+        async def send(**kwargs):
+            calls.append(kwargs)
+            await asyncio.sleep(0.01)
+            return _response("BODY")
+
+        requester, _ = self._requester(send)
+        results = await asyncio.gather(
+            *(requester.aget("/store/apps/details", params={"id": "a"}) for _ in range(30)),
+            requester.aget("/store/apps/details", params={"id": "b"}),
+        )
+
+        self.assertEqual(results, ["BODY"] * 31)
+        self.assertEqual(len(calls), 2)
+
+    async def test_errors_reach_every_waiter(self):
+        async def send(**kwargs):
+            await asyncio.sleep(0)
+            return _response(status=429)
+
+        requester, _ = self._requester(send)
+        results = await asyncio.gather(
+            *(requester.aget("/store/apps/details", params={"id": "a"}) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(r, QuotaExceeded) for r in results))
+
+    async def test_cancelled_request_stops_the_shared_round_trip(self):
+        started, cancelled = [], []
+
+        async def send(**kwargs):
+            started.append(1)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+            return _response("BODY")
+
+        requester, _ = self._requester(send)
+        request = asyncio.ensure_future(requester.apost("/p", data="x"))
+        await asyncio.sleep(0.01)
+        request.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await request
+        await asyncio.sleep(0)
+
+        self.assertEqual((len(started), len(cancelled)), (1, 1))
+
+    async def test_can_be_disabled(self):
+        calls = []
+
+        async def send(**kwargs):
+            calls.append(kwargs)
+            await asyncio.sleep(0)
+            return _response()
+
+        requester, _ = self._requester(send, coalesce=False)
+        await asyncio.gather(
+            *(requester.aget("/store/apps/details", params={"id": "a"}) for _ in range(3))
+        )
+
+        self.assertEqual(len(calls), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -181,55 +182,55 @@ class RequesterRequestTest(unittest.TestCase):
         self.assertIn("Network error: ", str(ctx.exception))
 
 
-    @patch("google_play_scraper.internal.request.time.sleep")
-    @patch("google_play_scraper.internal.request.time.time")
-    def test_wait_for_throttle_no_throttle_no_sleep_and_updates_time(self, mock_time, mock_sleep):
-        # time.time will be called twice inside _wait_for_throttle
-        mock_time.side_effect = [100.0, 100.0]
+    @patch("google_play_scraper.ratelimit.time.sleep")
+    def test_wait_for_throttle_no_throttle_no_sleep(self, mock_sleep):
         requester = self._make_requester(throttle=None)
 
         # sanity precondition
-        self.assertEqual(requester._throttle_delay, 0)
+        self.assertIsNone(requester._limiter)
 
         requester._wait_for_throttle()
 
         # Should not sleep when throttle is disabled
         mock_sleep.assert_not_called()
-        # Last request time should be updated to the last time.time() value
-        self.assertEqual(requester._last_request_time, 100.0)
 
-    @patch("google_play_scraper.internal.request.time.sleep")
-    @patch("google_play_scraper.internal.request.time.time")
+    @patch("google_play_scraper.ratelimit.time.sleep")
+    @patch("google_play_scraper.ratelimit.time.monotonic")
     def test_wait_for_throttle_sleeps_for_remaining_delay(self, mock_time, mock_sleep):
-        # throttle=2 => delay=0.5s
+        # throttle=2 => one request every 0.5s
         requester = self._make_requester(throttle=2)
-        requester._last_request_time = 10.0
 
-        # First call computes elapsed (10.1 - 10.0 = 0.1), should sleep 0.4
-        # Second call sets the new last_request_time
-        mock_time.side_effect = [10.1, 10.5]
+        # First request passes immediately; 0.1s later the next one waits 0.4s.
+        mock_time.side_effect = [10.0, 10.1]
 
+        requester._wait_for_throttle()
         requester._wait_for_throttle()
 
         mock_sleep.assert_called_once()
         sleep_arg = mock_sleep.call_args.args[0]
         self.assertAlmostEqual(sleep_arg, 0.4, places=6)
-        self.assertEqual(requester._last_request_time, 10.5)
 
-    @patch("google_play_scraper.internal.request.time.sleep")
-    @patch("google_play_scraper.internal.request.time.time")
+    @patch("google_play_scraper.ratelimit.time.sleep")
+    @patch("google_play_scraper.ratelimit.time.monotonic")
     def test_wait_for_throttle_no_sleep_if_elapsed_greater_or_equal_delay(self, mock_time, mock_sleep):
-        # throttle=1 => delay=1.0s
+        # throttle=1 => one request per second
         requester = self._make_requester(throttle=1)
-        requester._last_request_time = 10.0
 
-        # elapsed = 1.0, should not sleep
-        mock_time.side_effect = [11.0, 11.0]
+        mock_time.side_effect = [10.0, 11.0]
 
+        requester._wait_for_throttle()
         requester._wait_for_throttle()
 
         mock_sleep.assert_not_called()
-        self.assertEqual(requester._last_request_time, 11.0)
+
+    @patch("google_play_scraper.ratelimit.time.sleep")
+    def test_fractional_throttle_is_not_rounded(self, mock_sleep):
+        requester = self._make_requester(throttle=0.5)
+
+        requester._wait_for_throttle()
+        requester._wait_for_throttle()
+
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 2.0, places=1)
 
 class RequesterAsyncRequestTest(unittest.IsolatedAsyncioTestCase):
 
@@ -274,6 +275,21 @@ class RequesterAsyncRequestTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(sent_params["gl"], "br")
         self.assertEqual(sent_params["x"], 1)
 
+    async def test_await_for_throttle_reserves_distinct_slots_for_concurrent_callers(self):
+        requester = self._make_requester(throttle=10)  # 0.1s between requests
+        sleeps = []
+
+        async def _fake_sleep(delay):
+            sleeps.append(delay)
+
+        with patch("google_play_scraper.ratelimit.asyncio.sleep", _fake_sleep):
+            await asyncio.gather(*(requester._await_for_throttle() for _ in range(3)))
+
+        # First caller proceeds immediately, the others queue behind it.
+        self.assertEqual(len(sleeps), 2)
+        self.assertAlmostEqual(sorted(sleeps)[0], 0.1, places=2)
+        self.assertAlmostEqual(sorted(sleeps)[1], 0.2, places=2)
+
 
 if __name__ == "__main__":
     unittest.main()
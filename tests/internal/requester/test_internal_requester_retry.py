@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from google_play_scraper.exceptions import AppNotFound, NetworkError, ServerError
+from google_play_scraper.internal.request import Requester
+from google_play_scraper.retry import RetryPolicy
+
+# tests/conftest.py blocks `request` on both clients; keep the real methods so these
+# tests can run the full stack against an in-process `httpx.MockTransport`.
+_REAL_SYNC_REQUEST = httpx.Client.request
+_REAL_ASYNC_REQUEST = httpx.AsyncClient.request
+
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_base=0, backoff_cap=0)
+
+
+def _flaky_handler(failures):
+    """Answers with the queued failures first, then 200 "OK"."""
+    queue = list(failures)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if queue:
+            failure = queue.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return httpx.Response(failure, request=request)
+        return httpx.Response(200, text="OK", request=request)
+
+    return handler, seen
+
+
+class RequesterRetryTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(httpx.Client, "request", _REAL_SYNC_REQUEST)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _requester(self, handler, policy=NO_WAIT):
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(session.close)
+        return Requester(session, None, "en", "us", retry_policy=policy)
+
+    def test_retries_5xx_and_network_errors_then_succeeds(self):
+        handler, seen = _flaky_handler([500, httpx.ConnectError("refused")])
+        requester = self._requester(handler)
+
+        self.assertEqual(requester.get("/p"), "OK")
+
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(
+            (requester.metrics.requests, requester.metrics.attempts, requester.metrics.retries),
+            (1, 3, 2),
+        )
+
+    def test_gives_up_after_max_attempts(self):
+        handler, seen = _flaky_handler([502, 502, 502, 502])
+        requester = self._requester(handler)
+
+        with self.assertRaises(ServerError) as ctx:
+            requester.get("/p")
+
+        self.assertEqual(ctx.exception.status_code, 502)
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(requester.metrics.failures, 1)
+
+    def test_does_not_retry_not_found(self):
+        handler, seen = _flaky_handler([404])
+        requester = self._requester(handler)
+
+        with self.assertRaises(AppNotFound):
+            requester.get("/p")
+        self.assertEqual(len(seen), 1)
+
+    @patch("google_play_scraper.internal.request.time.sleep")
+    def test_sleeps_for_backoff_between_attempts(self, mock_sleep):
+        handler, _ = _flaky_handler([503])
+        requester = self._requester(handler, RetryPolicy(backoff_base=1.0))
+
+        with patch("google_play_scraper.retry.random.uniform", return_value=0.7):
+            requester.get("/p")
+
+        mock_sleep.assert_called_once_with(0.7)
+
+    def test_without_policy_errors_are_raised_immediately(self):
+        handler, seen = _flaky_handler([httpx.ConnectError("refused")])
+        requester = self._requester(handler, policy=None)
+
+        with self.assertRaises(NetworkError):
+            requester.get("/p")
+        self.assertEqual(len(seen), 1)
+
+
+class AsyncRequesterRetryTest(unittest.IsolatedAsyncioTestCase):
+    async def test_arequest_retries_with_async_sleep(self):
+        handler, seen = _flaky_handler([500, 503])
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        requester = Requester(
+            httpx.Client(), None, "en", "us", async_session=session, retry_policy=NO_WAIT
+        )
+
+        with patch.object(httpx.AsyncClient, "request", _REAL_ASYNC_REQUEST):
+            result = await requester.aget("/p")
+        await session.aclose()
+
+        self.assertEqual(result, "OK")
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(requester.metrics.attempts, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+import httpx
+
+from google_play_scraper.exceptions import AppNotFound, QuotaExceeded
+from google_play_scraper.internal.request import Requester
+
+PAGE = (
+    b"<html><script>AF_initDataCallback({key: 'ds:5', data: [1, 2], sideChannel: {}});</script>"
+    + b"<div>" + b"x" * 10_000 + b"</div></html>"
+)
+CHUNK_SIZE = 100
+
+
+class _TrackedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Body served in small chunks, recording how much was read and whether it was closed."""
+
+    def __init__(self, body):
+        self.chunks = [body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+        self.served = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.served += 1
+            yield chunk
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.served += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _handler(stream, status=200):
+    def handler(request):
+        return httpx.Response(status, stream=stream, headers={"Content-Type": "text/html; charset=utf-8"})
+
+    return handler
+
+
+class RequesterStreamTest(unittest.TestCase):
+    def _requester(self, handler):
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(session.close)
+        return Requester(session, None, "en", "us")
+
+    def test_stops_reading_once_keys_are_found(self):
+        stream = _TrackedStream(PAGE)
+        requester = self._requester(_handler(stream))
+
+        result = requester.get_script_data("/store/apps/details", {"ds:5"}, params={"id": "x"})
+
+        self.assertEqual(result, {"ds:5": [1, 2]})
+        self.assertLess(stream.served, len(stream.chunks))
+        self.assertTrue(stream.closed)
+
+    def test_reads_whole_page_when_key_is_missing(self):
+        stream = _TrackedStream(PAGE)
+        requester = self._requester(_handler(stream))
+
+        self.assertEqual(requester.get_script_data("/p", {"ds:9"}), {})
+        self.assertEqual(stream.served, len(stream.chunks))
+
+    def test_maps_error_statuses(self):
+        with self.assertRaises(AppNotFound):
+            self._requester(_handler(_TrackedStream(b""), 404)).get_script_data("/p", {"ds:5"})
+        with self.assertRaises(QuotaExceeded):
+            self._requester(_handler(_TrackedStream(b""), 429)).get_script_data("/p", {"ds:5"})
+
+
+class AsyncRequesterStreamTest(unittest.IsolatedAsyncioTestCase):
+    async def test_stops_reading_once_keys_are_found(self):
+        stream = _TrackedStream(PAGE)
+        session = httpx.AsyncClient(transport=httpx.MockTransport(_handler(stream)))
+        self.addAsyncCleanup(session.aclose)
+        requester = Requester(None, None, "en", "us", async_session=session)
+
+        result = await requester.aget_script_data("/p", {"ds:5"})
+
+        self.assertEqual(result, {"ds:5": [1, 2]})
+        self.assertLess(stream.served, len(stream.chunks))
+        self.assertTrue(stream.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
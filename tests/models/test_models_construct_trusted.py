@@ -0,0 +1,59 @@
+import unittest
+from datetime import datetime
+
+from google_play_scraper.models import AppDetails, AppOverview, Review, construct_trusted
+
+
+def _comparable(model):
+    # Validated models hold `HttpUrl` objects, trusted ones keep the raw strings.
+    return {
+        key: [str(v) for v in value] if isinstance(value, list) else
+        (str(value) if value is not None and "Url" in type(value).__name__ else value)
+        for key, value in model.model_dump(warnings=False).items()
+    }
+
+
+class ModelsConstructTrustedTest(unittest.TestCase):
+
+    def test_matches_validated_model_for_extractor_output(self):
+        data = {
+            "app_id": "com.example",
+            "title": "Example",
+            "icon": "https://img.test/icon.png",
+            "score": 4.5,
+            "min_installs": "1,000+",
+            "max_installs": 5000,
+            "ratings": None,
+            "histogram": {"1": 1, "2": 2, "3": 3, "4": 4, "5": 5},
+            "price": 0,
+            "available": 1,
+            "offers_iap": None,
+            "android_version": None,
+            "screenshots": ["https://img.test/a.png", "https://img.test/b.png"],
+            "updated": datetime(2024, 1, 2),
+        }
+
+        trusted = construct_trusted(AppDetails, data)
+
+        self.assertIsInstance(trusted, AppDetails)
+        self.assertEqual(_comparable(trusted), _comparable(AppDetails(**data)))
+        self.assertEqual(trusted.icon, "https://img.test/icon.png")
+
+    def test_none_falls_back_to_default_where_validation_would_reject_it(self):
+        review = construct_trusted(
+            Review, {"id": "r1", "user_name": "Bob", "score": 5, "thumbs_up": None}
+        )
+        self.assertEqual(review.thumbs_up, 0)
+
+    def test_optional_coerced_field_keeps_none(self):
+        overview = construct_trusted(AppOverview, {"app_id": "a", "title": "t", "score": None})
+        self.assertIsNone(overview.score)
+
+    def test_unknown_keys_are_ignored(self):
+        overview = construct_trusted(AppOverview, {"app_id": "a", "title": "t", "url": "x"})
+        self.assertEqual(overview.model_dump()["app_id"], "a")
+        self.assertNotIn("url", overview.model_dump())
+
+
+if __name__ == "__main__":
+    unittest.main()
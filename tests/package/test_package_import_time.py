@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import unittest
+
+import google_play_scraper
+
+# Cumulative microseconds `python -X importtime` may report for the package itself.
+# Importing it eagerly (httpx + pydantic models) costs several hundred ms; the lazy
+# `__init__` stays far below this budget.
+IMPORT_TIME_BUDGET_US = 50_000
+HEAVY_MODULES = ("httpx", "pydantic", "google_play_scraper.client", "google_play_scraper.models")
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+
+
+class PackageImportTimeTest(unittest.TestCase):
+    def test_import_stays_within_budget(self):
+        result = _run("from google_play_scraper import Category")
+
+        cumulative = None
+        for line in result.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == "google_play_scraper":
+                cumulative = int(parts[1])
+        self.assertIsNotNone(cumulative, result.stderr[-2000:])
+        self.assertLess(cumulative, IMPORT_TIME_BUDGET_US)
+
+    def test_import_does_not_load_heavy_modules(self):
+        result = _run(
+            "import sys, google_play_scraper; "
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_every_public_name_resolves(self):
+        for name in google_play_scraper.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(google_play_scraper, name))
+
+    def test_unknown_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            google_play_scraper.DoesNotExist
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import httpx
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.exceptions import QuotaExceeded
+from google_play_scraper.proxy import AsyncPooledTransport, PooledTransport, ProxyPool
+
+_REAL_SYNC_REQUEST = httpx.Client.request
+_REAL_ASYNC_REQUEST = httpx.AsyncClient.request
+
+PROXIES = ["http://p1:8080", "http://p2:8080", "http://p3:8080"]
+
+
+def _install(case, pool, statuses=None, is_async=False):
+    """Serve each proxy from a MockTransport recording which proxy served."""
+    served = []
+    statuses = statuses or {}
+
+    def open_transport(transport, proxy):
+        def handler(request):
+            served.append(proxy.url)
+            status = statuses.get(proxy.url, 200)
+            if isinstance(status, Exception):
+                raise status
+            return httpx.Response(status, text="OK")
+
+        return httpx.MockTransport(handler)
+
+    patcher = patch.object(AsyncPooledTransport if is_async else PooledTransport, "_open", open_transport)
+    patcher.start()
+    case.addCleanup(patcher.stop)
+    return served
+
+
+def _send(pool, times):
+    transport = pool.transport()
+    request = httpx.Request("GET", "https://play.google.com/")
+    return [transport.handle_request(request).status_code for _ in range(times)]
+
+
+class ProxyPoolTest(unittest.TestCase):
+    def test_round_robin_cycles_through_proxies(self):
+        pool = ProxyPool(PROXIES)
+        served = _install(self, pool)
+
+        _send(pool, 6)
+
+        self.assertEqual(served, PROXIES * 2)
+
+    def test_weighted_uses_weights(self):
+        pool = ProxyPool({"http://p1:8080": 5.0, "http://p2:8080": 1.0}, strategy="weighted")
+        _install(self, pool)
+
+        with patch("google_play_scraper.proxy.random.choices", side_effect=lambda items, weights: [items[0]]) as choices:
+            _send(pool, 1)
+
+        self.assertEqual(choices.call_args.kwargs["weights"], [5.0, 1.0])
+
+    def test_least_loaded_prefers_idle_proxies(self):
+        pool = ProxyPool(PROXIES, strategy="least_loaded")
+        _install(self, pool)
+        busy = pool._checkout()  # one request still in flight
+
+        picks = {pool._checkout().url for _ in range(2)}
+
+        self.assertNotIn(busy.url, picks)
+        self.assertEqual(len(picks), 2)
+
+    def test_ejects_failing_proxy_and_restores_after_cooldown(self):
+        pool = ProxyPool(PROXIES[:2], max_failures=2, cooldown=30)
+        served = _install(self, pool, {"http://p1:8080": 429})
+
+        with patch("google_play_scraper.proxy.time.monotonic", return_value=100.0):
+            _send(pool, 4)  # p1 fails twice and is ejected
+            served.clear()
+            _send(pool, 3)
+            self.assertEqual(served, ["http://p2:8080"] * 3)
+            self.assertFalse(pool.status()[0].healthy)
+
+        with patch("google_play_scraper.proxy.time.monotonic", return_value=131.0):
+            served.clear()
+            _send(pool, 2)
+
+        self.assertIn("http://p1:8080", served)
+
+    def test_network_errors_count_as_failures(self):
+        pool = ProxyPool(PROXIES[:1], max_failures=1)
+        _install(self, pool, {"http://p1:8080": httpx.ConnectError("refused")})
+
+        with self.assertRaises(httpx.ConnectError):
+            _send(pool, 1)
+
+        status = pool.status()[0]
+        self.assertEqual((status.failures, status.in_flight, status.healthy), (1, 0, False))
+
+    def test_all_ejected_falls_back_to_first_recovering(self):
+        pool = ProxyPool(PROXIES[:2], max_failures=1, cooldown=10)
+        _install(self, pool)
+        with patch("google_play_scraper.proxy.time.monotonic", return_value=0.0):
+            pool._release(pool._checkout(), failed=True)
+        with patch("google_play_scraper.proxy.time.monotonic", return_value=5.0):
+            pool._release(pool._checkout(), failed=True)
+            self.assertEqual(pool._checkout().url, PROXIES[0])
+
+    def test_each_proxy_has_its_own_rate_limit(self):
+        pool = ProxyPool(PROXIES[:2], rate_per_proxy=1)
+        _install(self, pool)
+
+        with patch("google_play_scraper.ratelimit.time.sleep") as mock_sleep:
+            _send(pool, 2)  # one request per proxy: nobody waits
+            mock_sleep.assert_not_called()
+            _send(pool, 1)
+            mock_sleep.assert_called_once()
+
+    def test_clients_sharing_a_pool_keep_their_own_transports(self):
+        pool = ProxyPool(PROXIES[:1])
+        strict, relaxed = pool.transport(verify=True), pool.transport(verify=False)
+        request = httpx.Request("GET", "https://play.google.com/")
+
+        with patch.object(PooledTransport, "transport_cls", side_effect=lambda **kw: Mock(**kw)):
+            strict.handle_request(request)
+            relaxed.handle_request(request)
+        [strict_conn], [relaxed_conn] = strict._transports.values(), relaxed._transports.values()
+        strict.close()
+
+        self.assertEqual((strict_conn.verify, relaxed_conn.verify), (True, False))
+        strict_conn.close.assert_called_once()
+        relaxed_conn.close.assert_not_called()
+
+    def test_rejects_unknown_strategy_and_empty_pool(self):
+        with self.assertRaises(ValueError):
+            ProxyPool(PROXIES, strategy="random")
+        with self.assertRaises(ValueError):
+            ProxyPool([])
+
+
+class ClientProxyPoolTest(unittest.TestCase):
+    def test_client_requests_go_through_pool(self):
+        pool = ProxyPool(PROXIES[:2], max_failures=1)
+        served = _install(self, pool, {"http://p1:8080": 429})
+        client = GooglePlayClient(proxy_pool=pool)
+
+        with patch.object(httpx.Client, "request", _REAL_SYNC_REQUEST):
+            with self.assertRaises(QuotaExceeded):
+                client._requester.get("/p")
+            self.assertEqual(client._requester.get("/p"), "OK")
+
+        self.assertEqual(served, PROXIES[:2])
+
+    def test_rejects_proxies_together_with_pool(self):
+        with self.assertRaises(ValueError):
+            GooglePlayClient(proxies={"https": PROXIES[0]}, proxy_pool=ProxyPool(PROXIES))
+
+
+class AsyncClientProxyPoolTest(unittest.IsolatedAsyncioTestCase):
+    async def test_async_requests_rotate_proxies(self):
+        pool = ProxyPool(PROXIES[:2])
+        served = _install(self, pool, is_async=True)
+        client = GooglePlayClient(proxy_pool=pool, coalesce_requests=False)
+
+        with patch.object(httpx.AsyncClient, "request", _REAL_ASYNC_REQUEST):
+            await client._requester.aget("/p")
+            await client._requester.aget("/p")
+
+        self.assertEqual(served, PROXIES[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
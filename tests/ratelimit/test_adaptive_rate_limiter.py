@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.ratelimit import AdaptiveRateLimiter, MemoryBackend
+
+
+class FakeClockBackend(MemoryBackend):
+    def __init__(self, start: float = 100.0):
+        super().__init__()
+        self.clock = start
+
+    def now(self) -> float:
+        return self.clock
+
+
+class AdaptiveRateLimiterTest(unittest.TestCase):
+    def test_throttling_halves_rate_once_per_cooldown(self):
+        limiter = AdaptiveRateLimiter(rate=8, cooldown=1.0, backend=FakeClockBackend())
+
+        with patch("google_play_scraper.ratelimit.time.monotonic", side_effect=[10.0, 10.2, 11.5]):
+            limiter.record_throttled()
+            limiter.record_throttled()  # same burst, ignored
+            self.assertEqual(limiter.rate, 4)
+            limiter.record_throttled()
+
+        self.assertEqual(limiter.rate, 2)
+
+    def test_rate_never_drops_below_min(self):
+        limiter = AdaptiveRateLimiter(rate=1, min_rate=0.4, cooldown=0, backend=FakeClockBackend())
+        for _ in range(5):
+            limiter.record_throttled()
+        self.assertEqual(limiter.rate, 0.4)
+
+    def test_success_probes_back_up_to_max(self):
+        limiter = AdaptiveRateLimiter(rate=2, max_rate=2.5, increase=0.5, backend=FakeClockBackend())
+
+        limiter.record_success()
+        self.assertAlmostEqual(limiter.rate, 2.25)
+        for _ in range(10):
+            limiter.record_success()
+        self.assertEqual(limiter.rate, 2.5)
+
+    def test_retry_after_pauses_reservations(self):
+        backend = FakeClockBackend()
+        limiter = AdaptiveRateLimiter(rate=10, backend=backend)
+        limiter.reserve()
+
+        limiter.record_throttled(retry_after=30)
+
+        # Rate is now 5/s, but the next request still has to wait out Retry-After.
+        self.assertAlmostEqual(limiter.reserve(), 30.0)
+        self.assertAlmostEqual(limiter.reserve(), 30.2)
+
+    def test_rate_change_keeps_accrued_tokens(self):
+        backend = FakeClockBackend()
+        limiter = AdaptiveRateLimiter(rate=1, burst=5, backend=backend)
+        for _ in range(5):
+            limiter.reserve()
+
+        backend.clock += 2  # two tokens earned at 1/s
+        limiter._set_rate(10)
+
+        self.assertEqual([limiter.reserve(), limiter.reserve()], [0.0, 0.0])
+        self.assertAlmostEqual(limiter.reserve(), 0.1)
+
+    def test_rejects_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            AdaptiveRateLimiter(rate=1, decrease_factor=1.5)
+        with self.assertRaises(ValueError):
+            AdaptiveRateLimiter(rate=1, min_rate=2, max_rate=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.ratelimit import FileLockBackend, MemoryBackend, TokenBucket
+
+
+class FakeClockBackend(MemoryBackend):
+    def __init__(self, start: float = 100.0):
+        super().__init__()
+        self.clock = start
+
+    def now(self) -> float:
+        return self.clock
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_steady_rate(self):
+        backend = FakeClockBackend()
+        bucket = TokenBucket(rate=2, burst=3, backend=backend)
+
+        delays = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 0.5)
+        self.assertAlmostEqual(delays[4], 1.0)
+
+    def test_refills_over_time_up_to_burst(self):
+        backend = FakeClockBackend()
+        bucket = TokenBucket(rate=1, burst=2, backend=backend)
+        bucket.reserve()
+        bucket.reserve()
+
+        backend.clock += 10  # far more than needed to refill
+        delays = [bucket.reserve() for _ in range(3)]
+
+        self.assertEqual(delays[:2], [0.0, 0.0])
+        self.assertAlmostEqual(delays[2], 1.0)
+
+    def test_fractional_rate(self):
+        bucket = TokenBucket(rate=0.25, backend=FakeClockBackend())
+        bucket.reserve()
+        self.assertAlmostEqual(bucket.reserve(), 4.0)
+
+    def test_rejects_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, burst=0.5)
+
+    @patch("google_play_scraper.ratelimit.time.sleep")
+    def test_acquire_sleeps_for_reservation(self, mock_sleep):
+        bucket = TokenBucket(rate=10, backend=FakeClockBackend())
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 0.1)
+
+    def test_file_backend_shares_budget_between_buckets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bucket")
+            # Two buckets over the same file behave like two worker processes.
+            first = TokenBucket(rate=1, backend=FileLockBackend(path))
+            second = TokenBucket(rate=1, backend=FileLockBackend(path))
+
+            with patch("google_play_scraper.ratelimit.time.time", return_value=1000.0):
+                self.assertEqual(first.reserve(), 0.0)
+                self.assertAlmostEqual(second.reserve(), 1.0)
+                self.assertAlmostEqual(first.reserve(), 2.0)
+
+
+class AsyncTokenBucketTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_coroutines_get_increasing_slots(self):
+        bucket = TokenBucket(rate=10, backend=FakeClockBackend())
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        with patch("google_play_scraper.ratelimit.asyncio.sleep", fake_sleep):
+            await asyncio.gather(*(bucket.aacquire() for _ in range(4)))
+
+        self.assertEqual(len(sleeps), 3)
+        for got, expected in zip(sleeps, [0.1, 0.2, 0.3]):
+            self.assertAlmostEqual(got, expected)
+
+    async def test_sync_and_async_callers_share_one_budget(self):
+        bucket = TokenBucket(rate=1, backend=FakeClockBackend())
+        bucket.reserve()  # e.g. a sync request just went out
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        with patch("google_play_scraper.ratelimit.asyncio.sleep", fake_sleep):
+            await bucket.aacquire()
+
+        self.assertEqual(sleeps, [1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
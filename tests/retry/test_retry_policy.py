@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+
+from google_play_scraper.exceptions import AppNotFound, NetworkError, QuotaExceeded, ServerError
+from google_play_scraper.retry import RetryPolicy
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_retries_transient_errors_until_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry(NetworkError(), 1))
+        self.assertTrue(policy.should_retry(ServerError(), 2))
+        self.assertFalse(policy.should_retry(QuotaExceeded(), 3))
+        self.assertFalse(policy.should_retry(AppNotFound(), 1))
+
+    def test_retry_on_is_configurable(self):
+        policy = RetryPolicy(retry_on=(NetworkError,))
+        self.assertFalse(policy.should_retry(ServerError(), 1))
+
+    def test_full_jitter_is_capped_exponential(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_cap=5.0)
+
+        with patch("google_play_scraper.retry.random.uniform", side_effect=lambda a, b: b) as uniform:
+            delays = [policy.backoff(attempt) for attempt in (1, 2, 3, 4)]
+
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 5.0])
+        self.assertTrue(all(call.args[0] == 0 for call in uniform.call_args_list))
+
+    def test_retry_after_is_a_lower_bound(self):
+        error = QuotaExceeded(retry_after=12.0)
+
+        self.assertGreaterEqual(RetryPolicy().backoff(1, error), 12.0)
+        self.assertLessEqual(RetryPolicy(respect_retry_after=False).backoff(1, error), 0.5)
+
+    def test_rejects_zero_attempts(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from google_play_scraper.client import GooglePlayClient
+from google_play_scraper.constants import Sort
+from google_play_scraper.models import Review
+from google_play_scraper.review_sync import (
+    MemoryWatermarkStore,
+    ReviewSyncer,
+    SQLiteWatermarkStore,
+    Watermark,
+)
+
+BASE = datetime(2024, 1, 10, 12, 0, 0)
+
+
+def make_reviews(ids: list[int]) -> list[Review]:
+    return [
+        Review(id=f"r{i}", user_name="u", score=5, date=BASE - timedelta(hours=i))
+        for i in ids
+    ]
+
+
+class SQLiteWatermarkStoreTest(unittest.TestCase):
+    def test_round_trips_and_persists_per_locale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "marks.sqlite3")
+            store = SQLiteWatermarkStore(path)
+            store.set("com.example", "en", "us", Watermark("r1", BASE))
+            store.set("com.example", "de", "de", Watermark("r9", None))
+            store.set("com.example", "en", "us", Watermark("r0", BASE + timedelta(hours=1)))
+            store.close()
+
+            reopened = SQLiteWatermarkStore(path)
+            self.assertEqual(
+                reopened.get("com.example", "en", "us"), Watermark("r0", BASE + timedelta(hours=1))
+            )
+            self.assertEqual(reopened.get("com.example", "de", "de"), Watermark("r9", None))
+            self.assertIsNone(reopened.get("com.other", "en", "us"))
+            reopened.close()
+
+
+class ReviewSyncerTest(unittest.TestCase):
+    def setUp(self):
+        self.client = GooglePlayClient(lang="en", country="us")
+        self.store = MemoryWatermarkStore()
+        self.syncer = ReviewSyncer(self.client, self.store, initial_limit=3)
+
+    @patch.object(GooglePlayClient, "iter_reviews")
+    def test_path_opens_sqlite_store(self, mock_iter):
+        mock_iter.return_value = iter(make_reviews([0]))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "marks.sqlite3")
+            syncer = ReviewSyncer(self.client, path)
+            syncer.fetch_new("com.example")
+            syncer._store.close()
+
+            reopened = SQLiteWatermarkStore(path)
+            self.assertEqual(reopened.get("com.example", "en", "us").review_id, "r0")
+            reopened.close()
+
+    def test_store_is_required(self):
+        with self.assertRaises(TypeError):
+            ReviewSyncer(self.client)
+
+    @patch.object(GooglePlayClient, "iter_reviews")
+    def test_first_sync_takes_initial_limit_and_sets_watermark(self, mock_iter):
+        mock_iter.return_value = iter(make_reviews([0, 1, 2]))
+
+        delta = self.syncer.fetch_new("com.example")
+
+        self.assertEqual([r.id for r in delta], ["r0", "r1", "r2"])
+        mock_iter.assert_called_once_with(
+            "com.example", "en", "us", sort=Sort.NEWEST, limit=3, page_size=100
+        )
+        self.assertEqual(self.store.get("com.example", "en", "us"), Watermark("r0", BASE))
+
+    @patch.object(GooglePlayClient, "iter_reviews")
+    def test_next_sync_stops_at_watermark(self, mock_iter):
+        self.store.set("com.example", "en", "us", Watermark("r2", BASE - timedelta(hours=2)))
+        mock_iter.return_value = iter(make_reviews([0, 1]))
+
+        delta = self.syncer.fetch_new("com.example")
+
+        self.assertEqual([r.id for r in delta], ["r0", "r1"])
+        mock_iter.assert_called_once_with(
+            "com.example", "en", "us", sort=Sort.NEWEST,
+            since=BASE - timedelta(hours=2), until_review_id="r2", page_size=100,
+        )
+        self.assertEqual(self.store.get("com.example", "en", "us").review_id, "r0")
+
+    @patch.object(GooglePlayClient, "iter_reviews")
+    def test_empty_delta_keeps_watermark(self, mock_iter):
+        mark = Watermark("r0", BASE)
+        self.store.set("com.example", "de", "de", mark)
+        mock_iter.return_value = iter([])
+
+        self.assertEqual(self.syncer.fetch_new("com.example", lang="de", country="de"), [])
+        self.assertEqual(self.store.get("com.example", "de", "de"), mark)
+
+    @patch.object(GooglePlayClient, "iter_reviews")
+    def test_failed_sync_does_not_advance_watermark(self, mock_iter):
+        def failing(*args, **kwargs):
+            yield from make_reviews([0])
+            raise RuntimeError("boom")
+
+        mock_iter.side_effect = failing
+
+        with self.assertRaises(RuntimeError):
+            self.syncer.fetch_new("com.example")
+        self.assertIsNone(self.store.get("com.example", "en", "us"))
+
+
+class AsyncReviewSyncerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_afetch_new_uses_watermark(self):
+        client = GooglePlayClient(lang="en", country="us")
+        store = MemoryWatermarkStore()
+        store.set("com.example", "en", "us", Watermark("r1", None))
+
+        async def fake_stream(*args, **kwargs):
+            self.assertEqual(kwargs["until_review_id"], "r1")
+            for review in make_reviews([0]):
+                yield review
+
+        with patch.object(GooglePlayClient, "aiter_reviews", side_effect=fake_stream):
+            delta = await ReviewSyncer(client, store).afetch_new("com.example")
+
+        self.assertEqual([r.id for r in delta], ["r0"])
+        self.assertEqual(store.get("com.example", "en", "us"), Watermark("r0", BASE))
+
+
+if __name__ == "__main__":
+    unittest.main()